@@ -0,0 +1,149 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+The common functions used by the lab notebooks.  Each area is a submodule that is only imported the first time it
+is used, so a notebook only pays for the areas it calls:
+
+    import coco_lab
+    coco_lab.glossary.findGlossaryTerms(...)
+
+or
+
+    from coco_lab.glossary import findGlossaryTerms
+
+Running common-functions.ipynb makes the names of every area available in the notebook, as the labs expect, without
+importing the areas: bindLazyNames binds the definitions in topology straight away, and in place of each function
+and class of the other areas it binds a stand-in that imports the area the first time it is called.  So a lab only
+pays for the areas it uses.  Settings belong to the submodule that uses them, for example
+coco_lab.rest.isDebug = True.
+
+Run "python -m coco_lab" to check how long each area, and running common-functions.ipynb, take against their budgets
+in importTimeBudgets and notebookStartupBudgets.  It also checks that exports.py, the list of the names each area
+exports that bindLazyNames works from, is up to date; "python -m coco_lab --update-exports" regenerates it.
+
+"""
+
+import importlib
+import sys
+import types
+
+submodules = ["topology", "rest", "concurrency", "cache", "elements", "admin", "platform_services", "cohorts", "assets",
+              "glossary", "governance", "integration", "async_queries", "search_index"]
+
+# The time (in seconds) that importing each area, and the areas it depends on, should take in a fresh interpreter.
+importTimeBudgets = {
+    "topology" : 0.01,
+    "rest" : 0.25,
+    "concurrency" : 0.3,
+    "cache" : 0.01,
+    "elements" : 0.25,
+    "admin" : 0.3,
+    "platform_services" : 0.3,
+    "cohorts" : 0.3,
+    "assets" : 0.35,
+    "glossary" : 0.35,
+    "governance" : 0.35,
+    "integration" : 0.3,
+    "async_queries" : 0.35,
+    "search_index" : 0.3
+}
+
+# The time (in seconds) that running the code of each notebook that the labs run at start up should take.
+notebookStartupBudgets = {
+    "common-functions.ipynb" : 0.02
+}
+
+
+def __getattr__(name):
+    if name in submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(submodules))
+
+
+#
+# Lazy names for the notebooks.  bindLazyNames(globals()) gives a notebook the same names as
+# "from coco_lab.<area> import *" for every area, but only the topology definitions are bound to their values.
+#
+#   - Each function and class is bound to a stand-in that imports its area when it is first called, and then
+#     replaces the stand-ins of that area in the notebook with the real functions and classes.
+#   - Each module, such as json or requests, is bound to a stand-in that imports it when one of its attributes is
+#     first used.
+#   - The other values of an area, such as its settings, are bound once the area is imported, unless the notebook
+#     already has a value of its own for the name.  Change settings on the area itself, for example
+#     coco_lab.rest.isDebug = True.
+#
+# A stand-in class can be called to make an instance but is not the class, so isinstance needs the real class from
+# its area, for example coco_lab.elements.GlossaryTermElement.
+#
+
+class LazyModule:
+    def __init__(self, namespace, name, moduleName):
+        self.__dict__.update(lazyNamespace=namespace, lazyName=name, lazyModuleName=moduleName)
+
+    def getModule(self):
+        module = importlib.import_module(self.lazyModuleName)
+        if self.lazyNamespace.get(self.lazyName) is self:
+            self.lazyNamespace[self.lazyName] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self.getModule(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.getModule(), name, value)
+
+    def __repr__(self):
+        return "<module " + repr(self.lazyModuleName) + " (not yet imported)>"
+
+
+def isLazyName(value):
+    return type(value) is LazyModule or (type(value) is types.FunctionType and getattr(value, "lazyArea", None) is not None)
+
+
+def getLazyFunction(namespace, area, name):
+    def lazyFunction(*args, **kwargs):
+        return bindArea(namespace, area)[name](*args, **kwargs)
+    lazyFunction.__name__ = name
+    lazyFunction.__qualname__ = name
+    lazyFunction.__doc__ = "Imports coco_lab." + area + " and calls its " + name + "."
+    lazyFunction.lazyArea = area
+    return lazyFunction
+
+
+# Import an area and bind the names of every area imported so far in the namespace in place of the stand-ins, since
+# an area imports the areas it depends on.  Returns the area's names.
+def bindArea(namespace, area):
+    from .exports import areaExports
+    importlib.import_module("." + area, __name__)
+    for importedArea in submodules:
+        module = sys.modules.get(__name__ + "." + importedArea)
+        if module is None:
+            continue
+        exports = areaExports[importedArea]
+        for name in exports["functions"] + tuple(exports["modules"]) + exports["values"]:
+            value = namespace.get(name)
+            if ((value is None and name not in namespace) or isLazyName(value)) and hasattr(module, name):
+                namespace[name] = getattr(module, name)
+    return vars(sys.modules[__name__ + "." + area])
+
+
+def bindLazyNames(namespace):
+    from .exports import areaExports
+    for area in submodules:
+        exports = areaExports[area]
+        if area == "topology":
+            bindArea(namespace, area)
+            continue
+        for name in exports["functions"]:
+            namespace[name] = getLazyFunction(namespace, area, name)
+        for name, moduleName in exports["modules"].items():
+            namespace[name] = LazyModule(namespace, name, moduleName)
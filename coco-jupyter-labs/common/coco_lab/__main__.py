@@ -0,0 +1,237 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+This script measures how long each area of the coco_lab package takes to import.  Each area is imported in a fresh
+interpreter, so the time includes the areas and libraries it depends on, and the start up time of the interpreter
+itself is taken away.  The median of several runs is compared with the area's budget in importTimeBudgets and the
+script exits with a non-zero return code if any area is over budget.
+
+Before the timings it checks that the governance action listener wakes a waiter when an event for its governance
+action arrives on the out topic, using a stand-in for the Kafka consumer so no event bus is needed.
+
+It also times the notebooks the labs run at start up, such as common-functions.ipynb, by running their code
+in a fresh interpreter against notebookStartupBudgets.  Before timing anything it checks that exports.py lists the
+names each area exports now; run "python -m coco_lab --update-exports" to regenerate it after changing an area.
+
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import textwrap
+import types
+
+from coco_lab import importTimeBudgets, notebookStartupBudgets, submodules
+
+package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+exports_path = os.path.join(package_parent, "coco_lab", "exports.py")
+
+exports_header = '''"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+The names that "from coco_lab.<area> import *" binds, listed under the area each name comes from, for
+coco_lab.bindLazyNames.  Generated by "python -m coco_lab --update-exports" - do not edit by hand.
+
+"""
+
+'''
+
+notebook_statement = """
+import json
+with open({notebook!r}) as notebook_file:
+    notebook = json.load(notebook_file)
+notebook_globals = {{"__name__" : "__main__"}}
+for cell in notebook["cells"]:
+    if cell["cell_type"] == "code":
+        exec(compile("".join(cell["source"]), {notebook!r}, "exec"), notebook_globals)
+"""
+
+timing_script = """
+import sys, time
+start_time = time.perf_counter()
+{statement}
+print(time.perf_counter() - start_time)
+"""
+
+
+def time_statement(statement: str) -> float:
+    result = subprocess.run([sys.executable, "-c", timing_script.format(statement=statement)], cwd=package_parent,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_import_times(runs: int = 5) -> dict:
+    baseline = statistics.median(time_statement("pass") for _ in range(runs))
+    import_times = {}
+    for submodule in submodules:
+        import_time = statistics.median(time_statement(f"import coco_lab.{submodule}") for _ in range(runs))
+        import_times[submodule] = max(import_time - baseline, 0.0)
+    for notebook in notebookStartupBudgets:
+        statement = notebook_statement.format(notebook=notebook)
+        startup_time = statistics.median(time_statement(statement) for _ in range(runs))
+        import_times[notebook] = max(startup_time - baseline, 0.0)
+    return import_times
+
+
+# Each name goes under the area that defines it, or else the first area that exports it, as long as every area that
+# exports it exports the same object.  Otherwise the last area wins, as it does with a series of star imports.
+def collect_exports() -> dict:
+    exported = {}
+    for submodule in submodules:
+        module = importlib.import_module(f"coco_lab.{submodule}")
+        names = getattr(module, "__all__", None) or [name for name in vars(module) if not name.startswith("_")]
+        for name in names:
+            exported.setdefault(name, []).append((submodule, getattr(module, name)))
+
+    area_exports = {submodule: {"functions": [], "modules": {}, "values": []} for submodule in submodules}
+    for name, sources in exported.items():
+        value = sources[-1][1]
+        area = sources[0][0]
+        if any(source_value is not value for _, source_value in sources):
+            area = sources[-1][0]
+        elif getattr(value, "__module__", "").startswith("coco_lab."):
+            defining_area = value.__module__[len("coco_lab."):]
+            if defining_area in area_exports and (inspect.isfunction(value) or inspect.isclass(value)):
+                area = defining_area
+        if inspect.ismodule(value):
+            area_exports[area]["modules"][name] = value.__name__
+        elif callable(value):
+            area_exports[area]["functions"].append(name)
+        else:
+            area_exports[area]["values"].append(name)
+
+    return {submodule: {"functions": tuple(sorted(exports["functions"])),
+                        "modules": dict(sorted(exports["modules"].items())),
+                        "values": tuple(sorted(exports["values"]))}
+            for submodule, exports in area_exports.items()}
+
+
+def format_names(key: str, items: list, opening: str, closing: str) -> str:
+    prefix = f'        "{key}" : {opening}'
+    lines = textwrap.wrap(", ".join(items), width=120, initial_indent=prefix,
+                          subsequent_indent=" " * len(prefix), break_long_words=False, break_on_hyphens=False)
+    return "\n".join(lines or [prefix]) + closing
+
+
+def format_exports(area_exports: dict) -> str:
+    areas = []
+    for submodule, exports in area_exports.items():
+        functions = [f'"{name}"' for name in exports["functions"]]
+        modules = [f'"{name}" : "{module}"' for name, module in exports["modules"].items()]
+        values = [f'"{name}"' for name in exports["values"]]
+        areas.append(f'    "{submodule}" : {{\n'
+                     + format_names("functions", functions, "(", ",)" if len(functions) == 1 else ")") + ",\n"
+                     + format_names("modules", modules, "{", "}") + ",\n"
+                     + format_names("values", values, "(", ",)" if len(values) == 1 else ")") + "\n    }")
+    return exports_header + "areaExports = {\n" + ",\n".join(areas) + "\n}\n"
+
+
+def get_export_names(area_exports: dict) -> dict:
+    return {submodule: set(exports["functions"]) | set(exports["modules"]) | set(exports["values"])
+            for submodule, exports in area_exports.items()}
+
+
+# Only the names are compared.  Whether a name is a function, module or other value can depend on the optional
+# libraries that are installed, such as orjson and kafka-python, which are None when they are missing.
+def check_exports(update: bool) -> bool:
+    area_exports = collect_exports()
+    if update:
+        with open(exports_path, "w") as exports_file:
+            exports_file.write(format_exports(area_exports))
+        return True
+    try:
+        from coco_lab.exports import areaExports
+    except ImportError:
+        return False
+    return get_export_names(areaExports) == get_export_names(area_exports)
+
+
+# Stands in for a KafkaConsumer assigned to the Governance Engine OMAS out topic.  send() queues an event that the
+# next poll() returns.
+class FakeOutTopicConsumer:
+    def __init__(self):
+        self.records = queue.Queue()
+        self.closed = False
+
+    def send(self, value: bytes):
+        self.records.put(types.SimpleNamespace(value=value))
+
+    def poll(self, timeout_ms: int) -> dict:
+        try:
+            record = self.records.get(timeout=timeout_ms / 1000)
+        except queue.Empty:
+            return {}
+        return {"outTopic": [record]}
+
+    def close(self):
+        self.closed = True
+
+
+def check_governance_action_listener() -> bool:
+    from coco_lab import governance
+    consumer = FakeOutTopicConsumer()
+    governance.startGovernanceActionListener("cocoMDS1", "Data Lake Platform", "https://localhost:9443", "garygeeke",
+                                             consumer=consumer)
+    waiter = governance.addGovernanceActionWaiter(["governance-action-1"])
+    try:
+        # Neither of these should wake the waiter: the first is not JSON and the second is for another action
+        consumer.send(b"not an event")
+        consumer.send(json.dumps({"eventType": "ACTION_STATUS_UPDATED",
+                                  "governanceAction": {"elementHeader": {"guid": "governance-action-2"}}}).encode())
+        woken_early = waiter["event"].wait(1)
+        consumer.send(json.dumps({"eventType": "ACTION_STATUS_UPDATED",
+                                  "governanceAction": {"elementHeader": {"guid": "governance-action-1"}}}).encode())
+        woken = waiter["event"].wait(5)
+        notified = governance.takeNotifiedGUIDs(waiter)
+        listening = governance.isGovernanceActionListenerRunning("cocoMDS1", "https://localhost:9443")
+    finally:
+        governance.removeGovernanceActionWaiter(waiter)
+        governance.stopGovernanceActionListener()
+    passed = (not woken_early and woken and notified == {"governance-action-1"} and listening and consumer.closed
+              and not governance.governanceActionWaiters)
+    print(f"Governance action listener check {'passed' if passed else 'failed'}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5, help="Number of times each area is imported")
+    parser.add_argument("--update-exports", action="store_true", help="Regenerate exports.py from the areas")
+    args = parser.parse_args()
+
+    if not check_exports(args.update_exports):
+        print("coco_lab/exports.py is out of date - run \"python -m coco_lab --update-exports\"")
+        sys.exit(1)
+    if not check_governance_action_listener():
+        sys.exit(1)
+
+    import_times = measure_import_times(args.runs)
+    over_budget = []
+    print(f"{'Area':<24}{'Import ms':>10}{'Budget ms':>11}")
+    for submodule, import_time in import_times.items():
+        budget = importTimeBudgets.get(submodule, notebookStartupBudgets.get(submodule))
+        flag = "" if import_time <= budget else "  over budget"
+        if flag:
+            over_budget.append(submodule)
+        print(f"{submodule:<24}{import_time * 1000:>10.1f}{budget * 1000:>11.1f}{flag}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
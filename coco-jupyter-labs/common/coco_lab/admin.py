@@ -0,0 +1,484 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Configuring OMAG Servers through the administration services of an OMAG Server Platform.
+
+"""
+
+import json
+
+from .rest import (getPlatformSession, getResponseEnvelope, issueDataPost, issueDelete, issuePost, issuePostNoBody,
+                   postAndPrintResult, printResponse, processErrorResponse)
+from .topology import adminUserId
+
+
+#
+# Administration services
+#
+
+#
+# OMAG Server configuration functions.  These functions add definitions to an OMAG server's configuration document
+#
+def configurePlatformURL(adminPlatformURL, adminUserId, serverName, serverPlatform):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the platform the server will run on...")
+    url = adminCommandURLRoot + serverName + '/server-url-root?url=' + serverPlatform
+    issuePostNoBody(url)
+
+def configureMaxPageSize(adminPlatformURL, adminUserId, serverName, maxPageSize):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the maximum page size...")
+    url = adminCommandURLRoot + serverName + '/max-page-size?limit=' + maxPageSize
+    issuePostNoBody(url)
+
+def configureServerType(adminPlatformURL, adminUserId, serverName, serverType):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the server's type...")
+    url = adminCommandURLRoot + serverName + '/server-type?typeName=' + serverType
+    issuePostNoBody(url)
+    
+def clearServerType(adminPlatformURL, adminUserId, serverName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... clearing the server's type...")
+    url = adminCommandURLRoot + serverName + '/server-type?typeName='
+    issuePostNoBody(url)
+
+def configureOwningOrganization(adminPlatformURL, adminUserId, serverName, organizationName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the server's owning organization...")
+    url = adminCommandURLRoot + serverName + '/organization-name?name=' + organizationName
+    issuePostNoBody(url)
+
+def configureUserId(adminPlatformURL, adminUserId, serverName, userId):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the server's userId...")
+    url = adminCommandURLRoot + serverName + '/server-user-id?id=' + userId
+    issuePostNoBody(url)
+
+def configurePassword(adminPlatformURL, adminUserId, serverName, password):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the server's password (optional)...")
+    url = adminCommandURLRoot + serverName + '/server-user-password?password=' + password
+    issuePostNoBody(url)
+
+def configureSecurityConnection(adminPlatformURL, adminUserId, serverName, securityBody):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the server's security connection...")
+    url = adminCommandURLRoot + serverName + '/security/connection'
+    issuePost(url, securityBody)
+
+def configureDefaultAuditLog(adminPlatformURL, adminUserId, serverName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the default audit log...")
+    url = adminCommandURLRoot + serverName + '/audit-log-destinations/default'
+    issuePostNoBody(url)
+
+def configureSLF4JAuditLog(adminPlatformURL, adminUserId, serverName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the SLF4j audit log...")
+    url = adminCommandURLRoot + serverName + '/audit-log-destinations/slf4j'
+    issuePost(url, "[]")
+
+def configureEventBasedAuditLog(platformURL, userId, serverName, topic, body = []):
+    alfURL = platformURL + '/open-metadata/admin-services/users/' + userId
+    requestURL = alfURL+ '/servers/' + serverName + '/audit-log-destinations/event-topic?topicName=' + topic
+    print(f"     ... configuring the Event destination for audit logs using {requestURL}")
+    response = issuePost(requestURL, body)
+    if response.status_code !=200 :
+        processErrorResponse(serverName, 'Platform', platformURL, response)
+        return False
+    else:
+        print (f"Added event audit destination - body was  {body}")
+        return True
+
+#
+# These commands are for metadata servers, metadata access points and repository proxies
+
+def configurePluginMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryConnectionBody):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the plugin repository...with " +
+           json.dumps(repositoryConnectionBody , indent=4))
+    requestURL = adminCommandURLRoot + serverName + '/local-repository/mode/plugin-repository/connection'
+    requestBody = repositoryConnectionBody
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return True
+            else:
+                printResponse(response)
+                return False
+        else:
+            printResponse(response)
+            return False
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverName + " (" + adminPlatformURL + ") is returning an error")
+        return False
+
+
+
+def configureBuiltinMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryType):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the builtin metadata repository...")
+    requestURL = adminCommandURLRoot + serverName + '/local-repository/mode/' + repositoryType
+
+    try:
+        response = issuePostNoBody(requestURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return
+            else:
+                print("configureBuiltinMetadataRepository: relatedHTTPCode not 200 but " + relatedHTTPCode)
+                printResponse(response)
+        else:
+            print("configureBuiltinMetadataRepository: status_Code not 200 but " + response.status_code)
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverName + " (" + adminPlatformURL + ") is returning an error")
+
+#
+# pass in a JDBC URL string to create an EDN string to configure XTDB.
+#
+# This also uses rocksdb for the index-store and lucene for the search-index.
+# The input URL is assumed to refer to a postgres database and include the user name and password needed to access the database.
+# The function returns a JSON body fragment that can be used to configure a metadata repository using "configurePluginMetadataRepository".
+#
+def config_xtdb_pg(serverName: str, JDBC_String: str) -> str:
+    index_dir = '"data/servers/' + serverName + '/xtdb/rdb-index"'
+    lucene_dir = '"data/servers/' + serverName + '/xtdb/lucene"'
+
+    index_str = '{:xtdb/index-store {:kv-store {:xtdb/module xtdb.rocksdb/->kv-store :db-dir '
+    index_str2 = index_str + index_dir + '}}'
+
+    lucene_str = ':xtdb.lucene/lucene-store {:db-dir ' + lucene_dir
+    lucene_str2 = lucene_str + ' :indexer {:xtdb/module xtdb.lucene.egeria/->egeria-indexer} '
+    lucene_str3 = lucene_str2 + ':analyzer {:xtdb/module xtdb.lucene.egeria/->ci-analyzer}} '
+
+    conn_pool_str = ':xtdb.jdbc/connection-pool {:dialect {:xtdb/module xtdb.jdbc.psql/->dialect} '
+    conn_pool_str2 = conn_pool_str + ':db-spec {:jdbcUrl ' + '"' + JDBC_String + '"}}'
+
+    tx_str = ':xtdb/tx-log {:xtdb/module xtdb.jdbc/->tx-log :connection-pool '
+    tx_str2 = tx_str + ':xtdb.jdbc/connection-pool :poll-sleep-duration "PT1S"}'
+
+    doc_str = ':xtdb/document-store {:xtdb/module xtdb.jdbc/->document-store :connection-pool'
+    doc_str2 = doc_str + ' :xtdb.jdbc/connection-pool}}'
+
+    EDN = index_str2 + '\n' + lucene_str3 + '\n' + conn_pool_str2 + '\n'
+    EDN = EDN + tx_str2 + '\n' + doc_str2
+
+    body = {
+        "class": "Connection",
+        "connectorType": {
+            "class": "ConnectorType",
+            "connectorProviderClassName": "org.odpi.egeria.connectors.juxt.xtdb.repositoryconnector.XtdbOMRSRepositoryConnectorProvider"
+        },
+        "configurationProperties": {
+            "xtdbConfigEDN":  EDN
+        }
+    }
+    return body
+
+#
+def configureMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryType, jdbcURL=None):
+    #
+    # This function handles the following repositoryTypes:
+    #   xtdb-inmemory       - An in-memory deployment of XTDB
+    #   xtdb-pg             - XTDB with a postgres database for document and transaction store - note that this can be extended to support other relational datastores
+    #   xtdb-kv             - XTDB with the RocksDB key value store for Documents, Transactions and Query Index along with Lucene for search -
+    #                         all configured in the data directory of the platform
+    #   graph               - JanusGraph with a default BerkeleyDB and Lucene search index configured in the data directory of the platform
+    #   inmemory            - the default native Egeria in-memory store
+
+    print("repositoryType = "+ repositoryType)
+    if (repositoryType == 'xtdb-inmemory'):
+        repositoryConnectionBody = {
+            "class": "Connection",
+            "connectorType": {
+                "class": "ConnectorType",
+                "connectorProviderClassName": "org.odpi.egeria.connectors.juxt.xtdb.repositoryconnector.XtdbOMRSRepositoryConnectorProvider"
+            }
+        }
+        configurePluginMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryConnectionBody)
+
+    elif (repositoryType =='xtdb-pg'):
+        index_dir = "data/servers/" + serverName + "/xtdb/rdb-index"
+        lucene_dir = "data/servers/" + serverName + "/xtdb/lucene"
+
+        repositoryConnectionBody = config_xtdb_pg(serverName, jdbcURL)
+
+        configurePluginMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryConnectionBody)
+        print("configured pg")
+
+    elif (repositoryType=="xtdb-kv") :
+         repositoryConnectionBody = {
+            "class" : "Connection",
+            "connectorType": {
+                 "class": "ConnectorType",
+                "connectorProviderClassName": "org.odpi.egeria.connectors.juxt.xtdb.repositoryconnector.XtdbOMRSRepositoryConnectorProvider"
+             },
+            "configurationProperties": {
+                "xtdbConfig": {
+                    "xtdb.lucene/lucene-store": {
+                        "db-dir": "data/servers/" + serverName + "/xtdb/lucene"
+                    },
+                    "xtdb/index-store": {
+                        "kv-store": {
+                          "xtdb/module": "xtdb.rocksdb/->kv-store",
+                          "db-dir": "data/servers/" + serverName + "/xtdb/rdb-index"
+                        }
+                    },
+                    "xtdb/document-store": {
+                        "kv-store": {
+                           "xtdb/module": "xtdb.rocksdb/->kv-store",
+                           "db-dir": "data/servers/" + serverName + "/xtdb/rdb-docs"
+                        }
+                    },
+                    "xtdb/tx-log": {
+                        "kv-store": {
+                        "xtdb/module": "xtdb.rocksdb/->kv-store",
+                            "db-dir": "data/servers/" + serverName + "/xtdb/rdb-tx"
+                        }
+                    }
+                }
+              }
+         }
+         print("xtdb-kv")
+         configurePluginMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryConnectionBody)
+
+    elif (repositoryType=="graph") :
+         repositoryConnectionBody = {
+            "class" : "Connection",
+            "connectorType": {
+                 "class": "ConnectorType",
+                "connectorProviderClassName": "org.odpi.openmetadata.adapters.repositoryservices.graphrepository.repositoryconnector.GraphOMRSRepositoryConnectorProvider"
+             },
+            "configurationProperties" : {
+#
+#               There are many possible configurations for JanusGraph - our default is using Berkeley DB and Lucene.
+#               Sample configurations with HBase and Elastic Search are shown commented out - there are many more options
+#               documented in the JanusGraph documentation.
+#
+#               "storage.backend" : "hbase",
+#               "storage.hostname" : "Your HBase Cluster IPs/Names",
+#               "storage.port" : "2181",
+#               "storage.hbase.skip-schema-check" : "false",
+#               "storage.hbase.table" : "your hbase table name",
+#               "index.search.backend" : "elasticsearch",
+#               "index.search.hostname" : "your elastic search cluster IPS/Names",
+#               "index.search.elasticsearch.connect-timeout": "2000",
+#               "index.search.elasticsearch.ssl.allow-self-signed-certificates": "true",
+#               "index.search.elasticsearch.ssl.enabled": "true",
+#               "index.search.elasticsearch.interface": "REST_CLIENT",
+#               "index.search.elasticsearch.http.auth.type": "basic",
+#               "index.search.elasticsearch.http.auth.basic.username": "elastic user name",
+#               "index.search.elasticsearch.http.auth.basic.password": "elastic user password",
+#               "index.search.elasticsearch.client-only" : "true",
+                "storage.backend" : "berkeleyje",
+                "storage.directory": "./data/servers/" + serverName + "/repository/graph/berkeley",
+                "index.search.backend" : "lucene",
+                "index.search.directory" : "data/servers/" + serverName + "/lucene",
+                "cache.db-cache" : "true",
+                "cache.db-cache-clean-wait" : "20",
+                "cache.db-cache-time" : "180000",
+                "cache.db-cache-size" : "0.5"
+                }
+         }
+
+         print("graph on table " + serverName )
+         configurePluginMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryConnectionBody)
+
+
+    else:
+         configureBuiltinMetadataRepository(adminPlatformURL, adminUserId, serverName, repositoryType)
+
+def configureRepositoryProxyDetails(adminPlatformURL, adminUserId, serverName, connectorProvider):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the repository proxy...")
+    url = adminCommandURLRoot + serverName + '/local-repository/mode/repository-proxy/details?connectorProvider=' + connectorProvider
+    issuePostNoBody(url)
+
+def configureRepositoryProxy(adminPlatformURL, adminUserId, serverName, body):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the repository proxy...")
+    url = adminCommandURLRoot + serverName + '/local-repository/mode/repository-proxy/connection'
+    response = issuePost(url, body)
+    prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+    print(prettyResponse)
+    if response.status_code != 200:
+        prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+        print ("Response: ")
+        print (prettyResponse)
+        print (" ")
+
+
+def configureDescriptiveName(adminPlatformURL, adminUserId, serverName, collectionName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the metadata collection name of the metadata stored in this server...")
+    url = adminCommandURLRoot + serverName + '/local-repository/metadata-collection-name/' + collectionName
+    issuePostNoBody(url)
+
+def configureMetadataCollectionId(adminPlatformURL, adminUserId, serverName, collectionId):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the metadata collection id of the metadata stored in this server...")
+    url = adminCommandURLRoot + serverName + '/local-repository/metadata-collection-id'
+    issueDataPost(url, collectionId)
+
+def addStartupArchive(adminPlatformURL, adminUserId, serverName, archiveFileName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... adding start up archive " + archiveFileName + " to server ...")
+    url = adminCommandURLRoot + serverName + '/open-metadata-archives/file'
+    issueDataPost(url, archiveFileName)
+
+def removeAllStartupArchive(adminPlatformURL, adminUserId, serverName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... removing all start up archives from server ...")
+    url = adminCommandURLRoot + serverName + '/open-metadata-archives'
+    issueDelete(url)
+
+def configureEventBus(adminPlatformURL, adminUserId, serverName, busBody):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the event bus for this server...")
+    url = adminCommandURLRoot + serverName + '/event-bus'
+    issuePost(url, busBody)
+
+def configureCohortMembership(adminPlatformURL, adminUserId, serverName, cohortName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the membership of the cohort...")
+    url = adminCommandURLRoot + serverName + '/cohorts/' + cohortName
+    issuePostNoBody(url)
+
+def deleteCohortMembership(adminPlatformURL, adminUserId, serverName, cohortName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... removing the membership of the cohort...")
+    url = adminCommandURLRoot + serverName + '/cohorts/' + cohortName
+    issueDelete(url)
+
+def configureAccessService(adminPlatformURL, adminUserId, serverName, accessService, accessServiceOptions):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + accessService + " access service for this server...")
+    url = adminCommandURLRoot + serverName + '/access-services/' + accessService
+    issuePost(url, accessServiceOptions)
+
+def configureAccessServiceNoTopic(adminPlatformURL, adminUserId, serverName, accessService, accessServiceOptions):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + accessService + " access service for this server...")
+    url = adminCommandURLRoot + serverName + '/access-services/' + accessService + '/no-topics'
+    response = issuePost(url, accessServiceOptions)
+    if response.status_code != 200:
+        prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+        print ("Response: ")
+        print (prettyResponse)
+        print (" ")
+
+
+#
+# The commands below are for View Servers only
+#
+def configureGovernanceSolutionViewService(adminPlatformURL, adminUserId, viewServerName, viewService, remotePlatformURL,remoteServerName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + viewService + " Governance Solution View Service for this server...")
+    url = adminCommandURLRoot + viewServerName + '/view-services/' + viewService
+    viewBody = {
+        "class": "ViewServiceConfig",
+        "omagserverPlatformRootURL": remotePlatformURL,
+        "omagserverName" : remoteServerName
+    }
+    issuePost(url, viewBody)
+
+def configureIntegrationViewService(adminPlatformURL, adminUserId, viewServerName, viewService, configBody):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + viewService + " Integration View Service for this server...")
+    url = adminCommandURLRoot + viewServerName + '/view-services/' + viewService
+    issuePost(url, configBody)
+
+#
+# The commands below are for Integration Daemon OMAG Servers only
+#
+def configureIntegrationService(adminPlatformURL, adminUserId, daemonServerName, mdrServerName, mdrServerPlatform, integrationServiceURLMarker, integrationServiceOptions, connectorConfigs):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + integrationServiceURLMarker + " integration service in " + daemonServerName + " integration daemon ...")
+    requestBody = {
+        "class": "IntegrationServiceRequestBody",
+        "omagserverPlatformRootURL": mdrServerPlatform,
+        "omagserverName" : mdrServerName,
+        "integrationServiceOptions" : integrationServiceOptions,
+        "integrationConnectorConfigs" : connectorConfigs
+    }
+    url = adminCommandURLRoot + daemonServerName + '/integration-services/' + integrationServiceURLMarker
+    issuePost(url, requestBody)
+
+def configureIntegrationGroup(adminPlatformURL, adminUserId, daemonServerName, mdrServerName, mdrServerPlatform, integrationGroupName):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + integrationGroupName + " integration group in " + daemonServerName + " integration daemon ...")
+    requestBody = {
+        "class": "IntegrationGroupConfig",
+        "omagserverPlatformRootURL": mdrServerPlatform,
+        "omagserverName" : mdrServerName,
+        "integrationGroupQualifiedName" : integrationGroupName
+    }
+    url = adminCommandURLRoot + daemonServerName + '/integration-groups/configuration'
+    issuePost(url, requestBody)
+
+#
+# The commands below are for Engine Host OMAG Servers only
+#
+def configureEngineDefinitionServices(adminPlatformURL, adminUserId, engineServerName, mdrServerName, mdrServerPlatform):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + engineServerName + " engine definition services...")
+    requestBody = {
+        "class": "OMAGServerClientConfig",
+        "omagserverPlatformRootURL": mdrServerPlatform,
+        "omagserverName" : mdrServerName
+    }
+    url = adminCommandURLRoot + engineServerName + '/engine-definitions/client-config'
+    issuePost(url, requestBody)
+
+def configureGovernanceEngineService(adminPlatformURL, adminUserId, engineServerName, mdrServerName, mdrServerPlatform, engineServiceURLMarker, governanceEngines):
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... configuring the " + engineServiceURLMarker + " engine service in " + engineServerName + " engine host server ...")
+    requestBody = {
+        "class": "EngineServiceRequestBody",
+        "omagserverPlatformRootURL": mdrServerPlatform,
+        "omagserverName" : mdrServerName,
+        "engines" : governanceEngines
+    }
+    url = adminCommandURLRoot + engineServerName + '/engine-services/' + engineServiceURLMarker
+    issuePost(url, requestBody)
+
+# Server configuration can be deployed from one OMAG Server Platform to another.
+# This enables a server configuration to be tested and then deployed in production.
+
+def deployServerToPlatform(adminPlatformURL, adminUserId, serverName, platformURL):
+    print("   ... deploying", serverName, "to the", platformURL, "platform...")
+    adminCommandURLRoot = adminPlatformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    url = adminCommandURLRoot + serverName + '/configuration/deploy'
+    platformTarget = {
+        "class": "URLRequestBody",
+        "urlRoot": platformURL
+    }
+    jsonContentHeader = {'content-type':'application/json'}
+    postAndPrintResult(url, json=platformTarget, headers=jsonContentHeader)
+
+#
+# Load an archive
+#
+def loadArchive(serverName, serverPlatformName, serverPlatformURL, archiveFileName):
+    loadArchiveURL = serverPlatformURL +  '/open-metadata/admin-services/users/' +  adminUserId + '/servers/' + serverName + '/instance/open-metadata-archives/file'
+    print(" ")
+    response = getPlatformSession(loadArchiveURL).post(loadArchiveURL, archiveFileName)
+    if response.status_code == 200:
+        print("Archive loaded: " + archiveFileName)
+    else:
+        print ("Returns:")
+        prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+        print (prettyResponse)
+    print(" ")
@@ -0,0 +1,1637 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Working with assets through the Asset Owner, Asset Consumer and Asset Manager OMASs and the OCF common services.
+
+"""
+
+import json
+import os
+import time
+from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
+
+from .cache import getCachedElement, invalidateCachedElements
+from .concurrency import getJitteredInterval, getNextWaitInterval, iteratePages, mapOnWorkers, submitToWorker, waitUntil
+from .elements import AssetElement, toElementRecords
+from .rest import (ResponseEnvelope, getResponseEnvelope, issueGet, issuePost, issueStreamingPost, printResponse,
+                   printUnexpectedResponse, processErrorResponse, streamResponseElements)
+
+
+#
+# OMAS
+# Working with asset elements - this set of functions displays assets returned from the open metadata repositories.
+# 
+
+def printAssetSummary(asset):
+    elementHeader = asset.get('elementHeader')
+    elementType = elementHeader.get('type')
+    assetTypeName = elementType.get('typeName')
+    requestType = elementHeader.get('guid')
+    assetProperties = asset.get('assetProperties')
+    assetQualifiedName = assetProperties.get('qualifiedName')
+    print (assetQualifiedName)
+    print(assetTypeName + " \t| " + requestType + " | " + assetQualifiedName)
+    
+def printAssetDetail(asset):
+    elementHeader = asset.get('elementHeader')
+    elementType = elementHeader.get('type')
+    assetTypeName = elementType.get('typeName')
+    assetSuperTypes = elementType.get('superTypeNames')
+    assetGUID = elementHeader.get('guid')
+    assetProperties = asset.get('assetProperties')
+    assetQualifiedName = assetProperties.get('qualifiedName')
+    assetDisplayName = assetProperties.get('displayName')
+    assetVersion = assetProperties.get('versionIdentifier')
+    extendedProperties = assetProperties.get('extendedProperties')
+    if extendedProperties:
+        assetPathName = extendedProperties.get('pathName')
+    else:
+        assetPathName = None
+    assetDescription = assetProperties.get('description')
+    assetOwner = assetProperties.get('owner')
+    assetOrigin = assetProperties.get('otherOriginValues')
+    assetOwnerType = assetProperties.get('ownerTypeName')
+    assetZones = assetProperties.get('zoneMembership')
+    if not assetGUID:
+        assetGUID = "<null>"
+    if not assetDisplayName:
+        assetDisplayName = "<none>"
+    else:
+        textWidth = len(assetDisplayName)
+        if textWidth > 20:
+            assetDisplayName = "..." + assetDisplayName[textWidth-20:textWidth]
+    print(assetDisplayName + " [" + assetGUID + "]")
+    if not assetQualifiedName:
+        assetQualifiedName = "<null>"
+    print("  qualifiedName:     " + assetQualifiedName)
+    if assetPathName:
+        print("  pathName:          " + assetPathName)
+    if assetVersion:
+        print("  versionIdentifier: " + assetVersion)
+    if assetDescription:
+        print("  description:       " + assetDescription)
+    print("  type:              " + assetTypeName + ' [%s]' % ', '.join(map(str, assetSuperTypes)))
+    if assetOwner:
+        print("  owner:             " + assetOwner + " [" + assetOwnerType + "]")
+    if assetOrigin:
+        contact = assetOrigin.get('contact')
+        dept = assetOrigin.get('originatingDept')
+        org = assetOrigin.get('originatingOrganization')
+        print("  origin:            contact=" + contact + ", dept=" + dept + ", org=" + org)
+    if assetZones:
+        print("  zones:             " + '%s' % ', '.join(map(str, assetZones)))
+    
+
+def printAssetListSummary(assets):
+    print(" ")
+    for x in range(len(assets)):
+        printAssetSummary(assets[x])
+
+def printAssetListDetail(assets):
+    print("\n--------------------------------------\n")
+    for x in range(len(assets)):
+        printAssetDetail(assets[x])
+        print("\n--------------------------------------\n")
+
+
+def printGUIDList(guids):
+    if guids == None:
+        print("No assets created")
+    else:
+        prettyGUIDs = json.dumps(guids, indent=4)
+        print(prettyGUIDs)
+
+def getLastGUID(guids):
+    if guids == None:
+        return "<unknown>"
+    else:
+        return guids[-1]
+
+def getElementType(elementHeader):
+    if elementHeader:
+        elementType = elementHeader.get('type')
+        if elementType:
+            return elementType.get('typeName')
+    return None
+
+def getElementGUID(elementHeader):
+    if elementHeader:
+        return elementHeader.get('guid')
+    return None
+
+#
+# OCF Common services
+# Working with assets - this set of functions displays assets returned from the open metadata repositories.
+# 
+
+
+def getAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID):
+    def retrieveElement():
+        connectedAssetURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/framework-services/' + serviceURLMarker + '/connected-asset/users/' + userId 
+        getAsset = connectedAssetURL + '/assets/' + assetGUID
+        response = issueGet(getAsset)
+        asset = getResponseEnvelope(response).get('asset')
+        if asset:
+            return getResponseEnvelope(response).body
+        else:
+            print ("No Asset returned")
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response) 
+    return getCachedElement(serverName, serverPlatformURL, userId, "AssetUniverse", assetGUID, retrieveElement, serviceURLMarker)
+
+#
+# The connected asset lists are paged using elementStart and maxElements.  The iterate functions are generators
+# that page through a whole list (see iteratePages) and the get functions return the whole list at once.
+#
+def iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, requestPath, pageSize=None, prefetch=False):
+    connectedAssetURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/framework-services/' + serviceURLMarker + '/connected-asset/users/' + userId
+
+    def retrievePage(elementStart, maxElements):
+        requestURL = connectedAssetURL + requestPath + '?elementStart=' + str(elementStart) + '&maxElements=' + str(maxElements)
+        response = issueGet(requestURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('list') or []
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        return None
+
+    return iteratePages(retrievePage, 0, pageSize, prefetch)
+
+def iterateRelatedAssets(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize=None, prefetch=False):
+    return iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, '/assets/' + assetGUID + '/related-assets', pageSize, prefetch)
+
+def iterateComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize=None, prefetch=False):
+    return iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, '/assets/' + assetGUID + '/comments', pageSize, prefetch)
+
+def iterateCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID, pageSize=None, prefetch=False):
+    return iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, '/assets/' + assetGUID + '/comments/' + commentGUID + '/replies', pageSize, prefetch)
+
+def iterateSchemaAttributes(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID, pageSize=None, prefetch=False):
+    return iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, '/assets/schemas/' + schemaTypeGUID + '/schema-attributes', pageSize, prefetch)
+
+def iterateAPIOperations(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, apiSchemaTypeGUID, pageSize=None, prefetch=False):
+    return iterateConnectedAssetList(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, '/assets/schemas/apis/' + apiSchemaTypeGUID + '/api-operations', pageSize, prefetch)
+
+def getRelatedAssets(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize=None):
+    return list(iterateRelatedAssets(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize))
+
+def getComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize=None):
+    comments = list(iterateComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, pageSize))
+    if comments:
+        return comments
+    else:
+        print("No comments returned")
+
+def getCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID, pageSize=None):
+    replies = list(iterateCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID, pageSize))
+    if replies:
+        return replies
+    else:
+        print("No comments returned")
+
+
+def getAPIOperations(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, apiSchemaTypeGUID, pageSize=None):
+    apiOperations = list(iterateAPIOperations(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, apiSchemaTypeGUID, pageSize))
+    if apiOperations:
+        return apiOperations
+
+def getSchemaAttributesFromSchemaType(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID, pageSize=None):
+    schemaAttributes = list(iterateSchemaAttributes(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID, pageSize))
+    if schemaAttributes:
+        return schemaAttributes
+    else:
+        print ("No Schema attributes retrieved")
+
+def printName(indent, name, guid):
+    if not name:
+        print(indent + "<null>" + " [" + guid + "]")
+    else:
+        print(indent + name + " [" + guid + "]")
+
+def printType(indent, typeName, superTypeNames):
+    if not superTypeNames:
+        print(indent + "type: " + typeName)
+    else:
+        print(indent + "type: " + typeName + ' [%s]' % ', '.join(map(str, superTypeNames)))
+
+def printStringProperty(indent, propertyName, propertyValue):
+    if propertyValue:
+        print(indent + propertyName + ": " + propertyValue)
+
+def printMapProperties(indent, propertyName, properties):
+    if properties:
+        print(indent + propertyName + ":")
+        propertyList = list(properties)
+        propertyIndent = indent + "    "
+        for x in range(len(propertyList)):
+            propertyValue = properties.get(propertyList[x])
+            print(propertyIndent + propertyList[x] + ": " + str(propertyValue))
+    
+def printMetadataCollection(indent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName):
+    print(indent + "origin:")
+    print(indent + "    sourceServer:       " + sourceServer)
+    if not metadataCollectionName:
+        print(indent + "    metadataCollection: " + metadataCollectionId + " [" + metadataCollectionType + "]")
+    else:
+        print(indent + "    metadataCollection: " + metadataCollectionId + " [" + metadataCollectionType + ", " + metadataCollectionName + "]")
+
+def printClassifications(indent, classifications, printOrigin):
+    if classifications:
+        print(indent + "classifications:")
+        elementIndent = indent + "    "
+        for classification in classifications:
+            print(elementIndent + classification.get('classificationName'))
+            propertyIndent = elementIndent + "    "
+            if printOrigin:
+                classificationElementOrigin = classification.get('origin')
+                classificationSourceServer = classificationElementOrigin.get('sourceServer')
+                classificationMetadataCollectionType = classificationElementOrigin.get('originCategory')
+                classificationMetadataCollectionId = classificationElementOrigin.get('homeMetadataCollectionId')
+                classificationMetadataCollectionName = classificationElementOrigin.get('homeMetadataCollectionName')
+                printMetadataCollection(propertyIndent, classificationSourceServer, classificationMetadataCollectionType, classificationMetadataCollectionId, classificationMetadataCollectionName)
+            properties = classification.get('classificationProperties')
+            if properties:
+                propertyList = list(properties)
+                for x in range(len(propertyList)):
+                    propertyValue = properties.get(propertyList[x])
+                    print(propertyIndent + propertyList[x] + ": " + str(propertyValue))
+
+def printMeanings(indent, meanings):
+    if meanings:
+        print(indent, "meanings:")
+        propertyIndent = indent + "    "        
+        for meaning in meanings:
+            name = meaning.get('name')
+            description = meaning.get('description')
+            if description:
+                print(propertyIndent + name + ": " + description)
+            else:
+                print(propertyIndent + name)
+
+def printSearchKeywords(indent, keywords):
+    if keywords:
+        print(indent, "keywords:")
+        propertyIndent = indent + "    "        
+        for keyword in keywords:
+            name = keyword.get('name')
+            description = keyword.get('description')
+            if description:
+                print(propertyIndent + name + ": " + description)
+            else:
+                print(propertyIndent + name)
+
+def printAsset(indent, asset, printOrigin):
+    if asset:
+        printName(indent, asset.get('name'), asset.get('guid'))
+        propertyIndent = "    "
+        printStringProperty(propertyIndent, "qualifiedName", asset.get('qualifiedName'))
+        printStringProperty(propertyIndent, "versionIdentifier", asset.get('versionIdentifier'))
+        printStringProperty(propertyIndent, "description", asset.get('description'))
+        elementType = asset.get('type')
+        printType(propertyIndent, elementType.get('typeName'), elementType.get('superTypeNames'))
+        if printOrigin:
+            elementOrigin = asset.get('origin')
+            sourceServer = elementOrigin.get('sourceServer')
+            metadataCollectionType = elementOrigin.get('originCategory')
+            metadataCollectionId = elementOrigin.get('homeMetadataCollectionId')
+            metadataCollectionName = elementOrigin.get('homeMetadataCollectionName')
+            printMetadataCollection(propertyIndent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName)
+        elementVersions = asset.get('versions')
+        printClassifications(propertyIndent, asset.get('classifications'), printOrigin)
+        printMapProperties(propertyIndent, "additionalProperties", asset.get('additionalProperties'))
+        printMapProperties(propertyIndent, "extendedProperties", asset.get('extendedProperties'))
+        printMeanings(propertyIndent, asset.get('meanings'))
+        printSearchKeywords(propertyIndent, asset.get('searchKeywords'))
+
+def printSchemaType(indent, schemaType, printOrigin):
+    if schemaType:
+        print(indent + "schemaType")
+        nameIndent = indent + "    "
+        printName(nameIndent, schemaType.get('displayName'), schemaType.get('guid'))
+        propertyIndent = nameIndent + "    "
+        printStringProperty(propertyIndent, "qualifiedName", schemaType.get('qualifiedName'))
+        printStringProperty(propertyIndent, "versionNumber", schemaType.get('versionNumber'))
+        printStringProperty(propertyIndent, "description", schemaType.get('description'))
+        printStringProperty(propertyIndent, "author", schemaType.get('author'))
+        printStringProperty(propertyIndent, "usage", schemaType.get('usage'))
+        printStringProperty(propertyIndent, "encodingStandard", schemaType.get('encodingStandard'))
+        printStringProperty(propertyIndent, "namespace", schemaType.get('namespace'))
+        elementType = schemaType.get('type')
+        printType(propertyIndent, elementType.get('typeName'), elementType.get('superTypeNames'))
+        if printOrigin:
+            elementOrigin = schemaType.get('origin')
+            sourceServer = elementOrigin.get('sourceServer')
+            metadataCollectionType = elementOrigin.get('originCategory')
+            metadataCollectionId = elementOrigin.get('homeMetadataCollectionId')
+            metadataCollectionName = elementOrigin.get('homeMetadataCollectionName')
+            printMetadataCollection(propertyIndent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName)
+        elementVersions = schemaType.get('versions')
+        printClassifications(propertyIndent, schemaType.get('classifications'), printOrigin)
+        printMapProperties(propertyIndent, "additionalProperties", schemaType.get('additionalProperties'))
+        printMapProperties(propertyIndent, "extendedProperties", schemaType.get('extendedProperties'))
+        printMeanings(propertyIndent, schemaType.get('meanings'))
+        printSearchKeywords(propertyIndent, schemaType.get('searchKeywords'))
+        
+def printSchemaTypeDetail(indent, schemaType, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree=None):
+    if schemaType:
+        print(indent + "schemaType")
+        nameIndent = indent + "    "
+        printName(nameIndent, schemaType.get('displayName'), schemaType.get('guid'))
+        propertyIndent = nameIndent + "    "
+        printStringProperty(propertyIndent, "qualifiedName", schemaType.get('qualifiedName'))
+        printStringProperty(propertyIndent, "versionNumber", schemaType.get('versionNumber'))
+        printStringProperty(propertyIndent, "description", schemaType.get('description'))
+        printStringProperty(propertyIndent, "author", schemaType.get('author'))
+        printStringProperty(propertyIndent, "usage", schemaType.get('usage'))
+        printStringProperty(propertyIndent, "encodingStandard", schemaType.get('encodingStandard'))
+        printStringProperty(propertyIndent, "namespace", schemaType.get('namespace'))
+        elementType = schemaType.get('type')
+        printType(propertyIndent, elementType.get('typeName'), elementType.get('superTypeNames'))
+        if printOrigin:
+            elementOrigin = schemaType.get('origin')
+            sourceServer = elementOrigin.get('sourceServer')
+            metadataCollectionType = elementOrigin.get('originCategory')
+            metadataCollectionId = elementOrigin.get('homeMetadataCollectionId')
+            metadataCollectionName = elementOrigin.get('homeMetadataCollectionName')
+            printMetadataCollection(propertyIndent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName)
+        elementVersions = schemaType.get('versions')
+        printClassifications(propertyIndent, schemaType.get('classifications'), printOrigin)
+        printMapProperties(propertyIndent, "additionalProperties", schemaType.get('additionalProperties'))
+        printMapProperties(propertyIndent, "extendedProperties", schemaType.get('extendedProperties'))
+        printMeanings(propertyIndent, schemaType.get('meanings'))
+        printSearchKeywords(propertyIndent, schemaType.get('searchKeywords'))
+        schemaTypeClass = schemaType.get('class')
+        if schemaTypeClass:
+            if schemaTypeClass == "ComplexSchemaType":
+                printSchemaAttributes(propertyIndent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaType.get('guid'), printOrigin, schemaTree)
+            else:
+                if schemaTypeClass == "SchemaTypeChoice":
+                    schemaOptions = schemaType.get('schemaOptions')
+                    if schemaOptions:
+                        print(propertyIndent + "Schema Options:")
+                        for x in range(len(schemaOptions)):
+                            schemaOptionIndent = propertyIndent + "    "
+                            printSchemaTypeDetail(schemaOptionIndent, schemaOptions[x], serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+                else:
+                    if schemaTypeClass == "APISchemaType":
+                        if schemaTree is not None:
+                            apiOperations = schemaTree.get(schemaType.get('guid'))
+                        else:
+                            apiOperations = getAPIOperations(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaType.get('guid'))
+                        if apiOperations:
+                            print(propertyIndent + "API Operations:")
+                            apiOperationIndent = propertyIndent + "    "
+                            for x in range(len(apiOperations)):
+                                apiOperation = apiOperations[x].get('apioperation')
+                                if apiOperation:
+                                    printSchemaTypeDetail(apiOperationIndent, apiOperation, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+                    else:
+                        if schemaTypeClass == "APIOperation":
+                            printStringProperty(propertyIndent, "API Operation", schemaType.get('command'))
+                            parameterListIndent = propertyIndent + "    "
+                            apiHeader = schemaType.get('headerSchemaType')
+                            if apiHeader:
+                                print(propertyIndent + "header:")
+                                printSchemaTypeDetail(parameterListIndent, apiHeader, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+                            apiRequest = schemaType.get('requestSchemaType')
+                            if apiRequest:
+                                print(propertyIndent + "request:")
+                                printSchemaTypeDetail(parameterListIndent, apiRequest, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+                            apiResponse = schemaType.get('responseSchemaType')
+                            if apiResponse:
+                                print(propertyIndent + "response:")
+                                printSchemaTypeDetail(parameterListIndent, apiResponse, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+
+
+
+def printSchemaAttributes(indent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID, printOrigin, schemaTree=None):
+    if schemaTree is not None:
+        schemaAttributes = schemaTree.get(schemaTypeGUID)
+    else:
+        schemaAttributes = getSchemaAttributesFromSchemaType(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID)
+    if schemaAttributes:
+        print(indent + "schemaAttributes:")
+        elementIndent = indent + "    "
+        for x in range(len(schemaAttributes)):
+            printSchemaAttribute(elementIndent, schemaAttributes[x], printOrigin)
+            schemaType = schemaAttributes[x].get('attributeType')
+            if schemaType:
+                schemaTypeIndent = elementIndent + "    "
+                printNestedSchemaAttribute(schemaTypeIndent, schemaType, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+
+def printSchemaAttribute(indent, schemaAttribute, printOrigin):
+    if schemaAttribute:
+        nameIndent = indent
+        printName(nameIndent, schemaAttribute.get('displayName'), schemaAttribute.get('guid'))
+        propertyIndent = nameIndent + "    "
+        elementType = schemaAttribute.get('type')
+        printType(propertyIndent, elementType.get('typeName'), elementType.get('superTypeNames'))
+        if printOrigin:
+            elementOrigin = schemaAttribute.get('origin')
+            sourceServer = elementOrigin.get('sourceServer')
+            metadataCollectionType = elementOrigin.get('originCategory')
+            metadataCollectionId = elementOrigin.get('homeMetadataCollectionId')
+            metadataCollectionName = elementOrigin.get('homeMetadataCollectionName')
+            printMetadataCollection(propertyIndent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName)
+        elementVersions = schemaAttribute.get('versions')
+        printClassifications(propertyIndent, schemaAttribute.get('classifications'), printOrigin)
+        printMapProperties(propertyIndent, "additionalProperties", schemaAttribute.get('additionalProperties'))
+        printMapProperties(propertyIndent, "extendedProperties", schemaAttribute.get('extendedProperties'))
+        printMeanings(propertyIndent, schemaAttribute.get('meanings'))
+        printSearchKeywords(propertyIndent, schemaAttribute.get('searchKeywords'))
+
+    
+def printNestedSchemaAttribute(indent, schemaType, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree=None):
+    schemaTypeClass = schemaType.get('class')
+    if schemaTypeClass:
+         if schemaTypeClass == "ComplexSchemaType":
+            printSchemaAttributes(indent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaType.get('guid'), printOrigin, schemaTree)
+
+
+#
+# Loading a schema tree.  Printing a schema with printSchemaTypeDetail alone makes a call for every complex schema type
+# and API schema type it meets, one after another.  loadSchemaTree walks the schema breadth-first instead: the schema
+# attributes and API operations needed for each level of the tree are retrieved concurrently, and each schema type is
+# retrieved only once however many times it is shared.  The result maps schema type GUIDs to their schema attributes
+# or API operations.  Pass it to printSchemaTypeDetail as schemaTree and the schema is printed without further calls.
+#
+def addSchemaTypesToRetrieve(schemaType, nestedOnly, toRetrieve, schemaTree):
+    # Work through the parts of the schema that are returned inline, noting the schema types whose attributes or
+    # operations must be retrieved.  Nested schema attribute types are only followed if they are complex, as in printing.
+    pending = [(schemaType, nestedOnly)]
+    while pending:
+        schemaType, nestedOnly = pending.pop()
+        if not schemaType:
+            continue
+        schemaTypeClass = schemaType.get('class')
+        schemaTypeGUID = schemaType.get('guid')
+        if schemaTypeClass == "ComplexSchemaType" or (schemaTypeClass == "APISchemaType" and not nestedOnly):
+            if schemaTypeGUID not in schemaTree and schemaTypeGUID not in toRetrieve:
+                toRetrieve[schemaTypeGUID] = schemaTypeClass
+        elif not nestedOnly:
+            if schemaTypeClass == "SchemaTypeChoice":
+                for schemaOption in schemaType.get('schemaOptions') or []:
+                    pending.append((schemaOption, False))
+            elif schemaTypeClass == "APIOperation":
+                pending.append((schemaType.get('headerSchemaType'), False))
+                pending.append((schemaType.get('requestSchemaType'), False))
+                pending.append((schemaType.get('responseSchemaType'), False))
+
+def loadSchemaTree(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaType):
+    schemaTree = {}
+    toRetrieve = {}
+    addSchemaTypesToRetrieve(schemaType, False, toRetrieve, schemaTree)
+
+    def retrieveChildren(schemaTypeToRetrieve):
+        schemaTypeGUID, schemaTypeClass = schemaTypeToRetrieve
+        if schemaTypeClass == "ComplexSchemaType":
+            return getSchemaAttributesFromSchemaType(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID)
+        else:
+            return getAPIOperations(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID)
+
+    while toRetrieve:
+        level = list(toRetrieve.items())
+        toRetrieve = {}
+        for (schemaTypeGUID, schemaTypeClass), children in zip(level, mapOnWorkers(retrieveChildren, level)):
+            schemaTree[schemaTypeGUID] = children or []
+        for schemaTypeGUID, schemaTypeClass in level:
+            for child in schemaTree[schemaTypeGUID]:
+                if schemaTypeClass == "ComplexSchemaType":
+                    addSchemaTypesToRetrieve(child.get('attributeType'), True, toRetrieve, schemaTree)
+                else:
+                    addSchemaTypesToRetrieve(child.get('apioperation'), False, toRetrieve, schemaTree)
+    return schemaTree
+
+
+def printRelatedAssets(indent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID):
+    relatedAssets = getRelatedAssets(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID)
+    if relatedAssets:      
+        print(indent + "relatedAssets:")
+        elementIndent = indent + "    "
+        for x in range(len(relatedAssets)):
+            printRelatedAsset(elementIndent, relatedAssets[x])
+
+def printRelatedAsset(indent, relatedAsset):
+    printName(indent, relatedAsset.get('name'), relatedAsset.get('guid'))
+    propertyIndent = indent + "    "
+    printStringProperty(propertyIndent, "relationshipName", relatedAsset.get('relationshipName'))
+    printStringProperty(propertyIndent, "attributeName", relatedAsset.get('attributeName'))
+    printStringProperty(propertyIndent, "qualifiedName", relatedAsset.get('qualifiedName'))
+    printStringProperty(propertyIndent, "versionNumber", relatedAsset.get('versionNumber'))
+    printStringProperty(propertyIndent, "description", relatedAsset.get('description'))
+    elementType = relatedAsset.get('type')
+    printType(propertyIndent, elementType.get('typeName'), elementType.get('superTypeNames'))
+
+def printComments(indent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, printOrigin):
+    comments = getComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID)
+    if comments:      
+        print(indent + "comments:")
+        elementIndent = indent + "    "
+        replyIndent = elementIndent + "    "
+        for x in range(len(comments)):
+            comment = comments[x].get('comment')
+            commentGUID = comment.get('guid')
+            replyCount = printCommentResponse(elementIndent, comments[x], printOrigin)
+            if replyCount:
+                if replyCount > 0:
+                    printCommentReplies(replyIndent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID, printOrigin)
+
+def printCommentReplies(indent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID, printOrigin):
+    commentReplies = getCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, commentGUID)
+    if commentReplies:
+        print(indent + "replies:")
+        elementIndent = indent + "    "
+        replyIndent = elementIndent + "    "
+        for x in range(len(commentReplies)):
+            comment = commentReplies[x].get('comment')
+            replyGUID = comment.get('guid')
+            replyCount = printCommentResponse(replyIndent, commentReplies[x], printOrigin)
+            if replyCount:
+                if replyCount > 0:
+                    printCommentReplies(replyIndent, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, replyGUID, printOrigin)
+
+def printCommentResponse(indent, commentObject, printOrigin):
+    if commentObject:
+        comment   = commentObject.get('comment')
+        replyCount = commentObject.get('replyCount')
+        if comment:
+            commentIndent = indent + "    "
+            print(indent + "comment")
+            commentType = comment.get('commentType')
+            commentText = comment.get('commentText') 
+            commentUser = comment.get('user') 
+            isPublic    = comment.get('isPublic') 
+            if commentType:
+                print(commentIndent + "comment type: " + commentType)
+            if commentText:
+                print(commentIndent + "comment text: " + commentText)
+            if commentUser:
+                print(commentIndent + "created by:   " + commentUser)
+            if isPublic:
+                print(commentIndent + "public:       " + str(isPublic))
+            if printOrigin:
+                elementOrigin = comment.get('origin')
+                sourceServer = elementOrigin.get('sourceServer')
+                metadataCollectionType = elementOrigin.get('originCategory')
+                metadataCollectionId = elementOrigin.get('homeMetadataCollectionId')
+                metadataCollectionName = elementOrigin.get('homeMetadataCollectionName')
+                printMetadataCollection(commentIndent, sourceServer, metadataCollectionType, metadataCollectionId, metadataCollectionName)
+            return replyCount  
+        else:
+            print ("Returns:")
+            prettyResponse = json.dumps(commentObject, indent=4)
+            print (prettyResponse)
+            print (" ")      
+
+
+def printAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID):
+    printSelectiveAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, True, True)
+
+    
+def printSelectiveAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID, printOrigin, printSchema):
+    assetResponse = getAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID)
+    if assetResponse:
+        printAsset("", assetResponse.get('asset'), printOrigin)
+        propertyIndent = "    "
+        if printSchema:
+            schemaType = assetResponse.get('schemaType')
+            schemaTree = loadSchemaTree(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaType)
+            printSchemaTypeDetail(propertyIndent, schemaType, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, printOrigin, schemaTree)
+       
+            
+def printCommentList(responseObjects):
+    print(" ")
+    if len(responseObjects) == 0:
+        print ("No comments found")
+    else:
+        if len(responseObjects) == 1:
+            print ("1 comment found:")
+        else:
+            print (str(len(responseObjects)) + " comments found:")
+        for x in range(len(responseObjects)):
+            printComment(responseObjects[x]) 
+
+
+def printAssetComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, requestType):
+    comments = getComments(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, requestType)
+    if (comments):
+        printCommentList(comments)
+    
+def printAssetCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, requestType, commentGUID):
+    commentReplies = getCommentReplies(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, requestType, commentGUID)
+    if (commentReplies):
+        printCommentList(commentReplies)
+
+def printComment(commentObject):
+    if commentObject:
+        comment   = commentObject.get('comment')
+        relyCount = commentObject.get('replyCount')
+        if comment:
+            commentType = comment.get('commentType')
+            commentText = comment.get('commentText') 
+            commentUser = comment.get('user') 
+            isPublic    = comment.get('isPublic') 
+            if commentType:
+                print("  comment type: " + commentType)
+            if commentText:
+                print("  comment text: " + commentText)
+            if commentUser:
+                print("  created by:   " + commentUser)
+            if isPublic:
+                print("  public:       " + str(isPublic))
+
+   
+#
+# Working with assets - this set of functions are for authoring assets.
+# Using the Asset Owner OMAS interface to create and query assets.  Notice that the interface returns all of the asset contents.
+# 
+
+def assetOwnerCreateAsset(assetTypeURL, serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath):
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    createAssetURL = assetOwnerURL + assetTypeURL       
+
+    createAssetBody = {
+        "class" : "NewCSVFileAssetRequestBody",
+        "displayName" : displayName,
+        "description" : description,
+        "fullPath" : fullPath,
+        "qualifiedName" : "Asset: " + displayName + ": " + str(time.time())
+    }
+    response=issuePost(createAssetURL, createAssetBody)
+    guids = getResponseEnvelope(response).get('guids')
+    if guids:
+        return guids
+    else:
+        print ("No assets created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+    
+def assetOwnerCreateCSVAsset(serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath):
+    return assetOwnerCreateAsset('/assets/data-files/csv', serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath)
+
+def assetOwnerCreateAvroAsset(serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath):
+    return assetOwnerCreateAsset('/assets/data-files/avro', serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath)
+
+def assetOwnerCreateCSVAssetWithColumnHeaders(serverName, serverPlatformName, serverPlatformURL, userId, displayName, description, fullPath, columnHeaders):
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    createAssetURL = assetOwnerURL + '/assets/data-files/csv'
+    createAssetBody = {
+        "class" : "NewCSVFileAssetRequestBody",
+        "displayName" : displayName,
+        "description" : description,
+        "fullPath" : fullPath,
+        "columnHeaders" : columnHeaders
+    }
+    response=issuePost(createAssetURL, createAssetBody)
+    guids = getResponseEnvelope(response).get('guids')
+    if guids:
+        return guids
+    else:
+        print ("No CSV assets created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+def assetOwnerGetSchemaAttributesFromSchemaType(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID):
+    return getSchemaAttributesFromSchemaType(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, schemaTypeGUID)
+        
+# Delete the asset with the supplied guid.     
+def assetOwnerDelete(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID ):
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    deleteAssetURL = assetOwnerURL + '/assets/'+ assetGUID + '/delete'
+    response=issuePost(deleteAssetURL, {})
+    invalidateCachedElements(assetGUID)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            print("deleted Asset")
+            return []
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def iterateAssetOwnerAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize=None, prefetch=False, stream=False):
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+
+    def retrievePage(startFrom, pageSize):
+        getAssetsURL = assetOwnerURL + '/assets/by-search-string?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize)
+        if stream:
+            return streamResponseElements(serverName, serverPlatformName, serverPlatformURL, issueStreamingPost(getAssetsURL, searchBody), 'assets')
+        response = issuePost(getAssetsURL, searchBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('assets') or []
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        return None
+
+    return iteratePages(retrievePage, 0, pageSize, prefetch)
+
+# With compact set, the assets are returned as AssetElement records (see coco_lab.elements).  With stream set, each page
+# is decoded as it is read from the connection (see streamResponseElements).
+def assetOwnerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize=None, compact=False, stream=False):
+    assets = iterateAssetOwnerAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize, stream=stream)
+    if compact:
+        assets = toElementRecords(assets, AssetElement)
+    assets = list(assets)
+    if assets:
+        return assets
+    else:
+        print ("No assets found")
+
+def assetOwnerPrintAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    assets = assetOwnerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString)
+    if assets:
+        if len(assets) == 1:
+            print ("1 asset found:")
+        else:
+            print (str(len(assets)) + " assets found:")
+        printAssetListDetail(assets)
+        
+# How long to keep searching for an asset that has only just been created
+assetSearchTimeout = 3
+
+def assetOwnerFindAssetQualifiedName(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    qualifiedName = None
+    # A newly created asset may take a moment to be found
+    assets = waitUntil(lambda: assetOwnerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString),
+                       assetSearchTimeout, initialInterval=1)
+    if assets:
+        if len(assets) == 1:
+            assetProperties = assets[0].get('assetProperties')
+            qualifiedName = assetProperties.get('qualifiedName')
+        else:
+            print (str(len(assets)) + " assets found:")
+    return qualifiedName
+
+def assetOwnerFindAssetPathName(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    pathName = None
+    # A newly created asset may take a moment to be found
+    assets = waitUntil(lambda: assetOwnerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString),
+                       assetSearchTimeout, initialInterval=1)
+    if assets:
+        if len(assets) == 1:
+            assetProperties = assets[0].get('assetProperties')
+            extendedProperties = assetProperties.get('extendedProperties')
+            if extendedProperties:
+                pathName = extendedProperties.get('pathName')
+        else:
+            print (str(len(assets)) + " assets found:")
+    return pathName
+
+#
+# Bulk asset deletion.  deleteAssetsInBulk deletes assets with up to maxInFlight requests running at once on the
+# worker pool, retrying requests that fail with a server error or exception.  The assets are found with a paged
+# search, and all of the matches are collected before any are deleted because each deletion moves the assets after
+# it onto earlier pages of the search.  With dryRun set, nothing is deleted.  If a ledger file is given, the result
+# for each asset is appended to it as a line of JSON, and running the deletion again with the same ledger skips the
+# assets it records as deleted, so an interrupted clean up can be resumed.
+#
+
+def readAssetDeletionLedger(ledgerFileName):
+    deletedGUIDs = set()
+    try:
+        with open(ledgerFileName) as ledgerFile:
+            for line in ledgerFile:
+                try:
+                    ledgerRecord = json.loads(line)
+                except ValueError:
+                    continue
+                if ledgerRecord.get('result') == 'deleted':
+                    deletedGUIDs.add(ledgerRecord.get('guid'))
+    except FileNotFoundError:
+        pass
+    return deletedGUIDs
+
+def getAssetQualifiedName(asset):
+    for propertiesName in ('assetProperties', 'dataAssetProperties', 'properties'):
+        properties = asset.get(propertiesName)
+        if properties:
+            return properties.get('qualifiedName')
+    return None
+
+# Issue a delete request and return (result, message) where result is 'deleted', 'failed', or 'retry' if the
+# failure was on the server side and the request may work if it is tried again.
+def issueAssetDelete(requestURL, requestBody, assetGUID):
+    response = issuePost(requestURL, requestBody)
+    try:
+        envelope = getResponseEnvelope(response)
+    except ValueError:
+        envelope = ResponseEnvelope(response.status_code, {})
+    relatedHTTPCode = envelope.relatedHTTPCode or response.status_code
+    if response.status_code == 200 and relatedHTTPCode == 200:
+        invalidateCachedElements(assetGUID)
+        return 'deleted', None
+    message = envelope.exceptionErrorMessage or "HTTP status " + str(response.status_code)
+    if response.status_code >= 500 or relatedHTTPCode >= 500:
+        return 'retry', message
+    return 'failed', message
+
+def deleteAssetWithRetry(deleteAsset, assetGUID, maxRetries):
+    attempts = 0
+    interval = 1
+    while True:
+        attempts = attempts + 1
+        try:
+            result, message = deleteAsset(assetGUID)
+        except Exception as error:
+            result, message = 'retry', "Exception: %s" % error
+        if result != 'retry':
+            return result, attempts, message
+        if attempts > maxRetries:
+            return 'failed', attempts, message
+        time.sleep(getJitteredInterval(interval))
+        interval = getNextWaitInterval(interval)
+
+def deleteAssetsInBulk(assets, deleteAsset, ledgerFileName=None, dryRun=False, maxInFlight=8, maxRetries=3, progressInterval=100):
+    deletedGUIDs = readAssetDeletionLedger(ledgerFileName) if ledgerFileName else set()
+    assetsToDelete = {}
+    skippedCount = 0
+    for asset in assets:
+        assetGUID = getElementGUID(asset.get('elementHeader'))
+        if assetGUID in deletedGUIDs:
+            skippedCount = skippedCount + 1
+        elif assetGUID:
+            assetsToDelete[assetGUID] = getAssetQualifiedName(asset) or "<null>"
+    if skippedCount > 0:
+        print("Skipping " + str(skippedCount) + " assets deleted by an earlier run")
+    if not assetsToDelete:
+        print("No assets to delete")
+        return {"deleted" : 0, "skipped" : skippedCount, "failedGUIDs" : [], "elapsedTime" : 0}
+    print(str(len(assetsToDelete)) + " assets to delete")
+
+    deletedCount = 0
+    failedGUIDs = []
+    inFlight = {}
+    startTime = time.perf_counter()
+
+    def writeLedgerRecord(assetGUID, result, attempts, message):
+        ledgerRecord = {
+            "guid" : assetGUID,
+            "qualifiedName" : assetsToDelete[assetGUID],
+            "result" : result,
+            "attempts" : attempts,
+            "message" : message,
+            "time" : time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        ledgerFile.write(json.dumps(ledgerRecord) + '\n')
+
+    def processCompletedDeletes(returnWhen):
+        nonlocal deletedCount
+        done, notDone = wait(inFlight, return_when=returnWhen)
+        for future in done:
+            assetGUID = inFlight.pop(future)
+            result, attempts, message = future.result()
+            writeLedgerRecord(assetGUID, result, attempts, message)
+            if result == 'deleted':
+                deletedCount = deletedCount + 1
+                if deletedCount % progressInterval == 0:
+                    elapsedTime = time.perf_counter() - startTime
+                    print("Deleted " + str(deletedCount) + " assets (" + "{:.1f}".format(deletedCount / elapsedTime) + " assets/sec)")
+            else:
+                print("Unable to delete asset " + assetsToDelete[assetGUID] + " [" + assetGUID + "]: " + str(message))
+                failedGUIDs.append(assetGUID)
+        ledgerFile.flush()
+
+    with open(ledgerFileName or os.devnull, 'a') as ledgerFile:
+        if dryRun:
+            for assetGUID, qualifiedName in assetsToDelete.items():
+                print("Would delete asset " + qualifiedName + " [" + assetGUID + "]")
+                writeLedgerRecord(assetGUID, 'dry run', 0, None)
+            return {"deleted" : 0, "skipped" : skippedCount, "failedGUIDs" : [], "elapsedTime" : 0}
+        try:
+            for assetGUID in assetsToDelete:
+                if len(inFlight) >= maxInFlight:
+                    processCompletedDeletes(FIRST_COMPLETED)
+                future = submitToWorker(deleteAssetWithRetry, deleteAsset, assetGUID, maxRetries)
+                inFlight[future] = assetGUID
+        finally:
+            # Record the assets that are already being deleted, even when the deletion is interrupted.
+            if inFlight:
+                processCompletedDeletes(ALL_COMPLETED)
+
+    elapsedTime = time.perf_counter() - startTime
+    print("Deleted " + str(deletedCount) + " assets in " + "{:.1f}".format(elapsedTime) + " seconds")
+    if failedGUIDs:
+        print(str(len(failedGUIDs)) + " assets could not be deleted - run the deletion again to retry them")
+    return {"deleted" : deletedCount, "skipped" : skippedCount, "failedGUIDs" : failedGUIDs, "elapsedTime" : elapsedTime}
+
+def assetOwnerDeleteAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, ledgerFileName=None, dryRun=False, maxInFlight=8, maxRetries=3):
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    assets = iterateAssetOwnerAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString)
+    def deleteAsset(assetGUID):
+        return issueAssetDelete(assetOwnerURL + '/assets/' + assetGUID + '/delete', {}, assetGUID)
+    return deleteAssetsInBulk(assets, deleteAsset, ledgerFileName, dryRun, maxInFlight, maxRetries)
+
+def assetManagerDeleteAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, ledgerFileName=None, dryRun=False, maxInFlight=8, maxRetries=3):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+    assets = iterateAssetManagerSearch(serverName, serverPlatformName, serverPlatformURL, userId, '/data-assets/by-search-string', searchBody)
+    def deleteAsset(assetGUID):
+        requestBody = {
+            "class" : "UpdateRequestBody"
+        }
+        return issueAssetDelete(assetManagerURL + '/data-assets/' + assetGUID + '/remove', requestBody, assetGUID)
+    return deleteAssetsInBulk(assets, deleteAsset, ledgerFileName, dryRun, maxInFlight, maxRetries)
+
+def addOwner(serverName, serverPlatformName, serverPlatformURL, userId, assetName, assetGUID, assetOwner, ownerType):
+    governanceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId 
+    print ("Setting owner on " + assetName + " to " + assetOwner + " ...")
+    body = {
+        "class" : "OwnerRequestBody",
+        "ownerType" : ownerType,
+        "ownerId" : assetOwner
+    }
+    addOwnerURL = governanceURL + "/assets/" + assetGUID + "/owner"
+    response=issuePost(addOwnerURL, body)
+    invalidateCachedElements(assetGUID)
+    if response.status_code != 200:
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+def addOrigin(serverName, serverPlatformName, serverPlatformURL, userId, assetName, assetGUID, contact, originatingDept, originatingOrganization):
+    governanceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId 
+    print ("Setting origin on " + assetName + " ...")
+    body = {
+        "class" : "OriginRequestBody",
+        "otherOriginValues" : {
+            "originatingOrganization" : originatingOrganization,
+            "originatingDept" : originatingDept,
+            "contact" : contact
+        }
+    }
+    addOriginURL = governanceURL + "/assets/" + assetGUID + "/origin"
+    response=issuePost(addOriginURL, body)
+    invalidateCachedElements(assetGUID)
+    if response.status_code != 200:
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+def addZones(serverName, serverPlatformName, serverPlatformURL, userId, assetName, assetGUID, zones):
+    print ("Setting governance zones on " + assetName + " ...")
+    governanceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId 
+    
+    addZonesURL = governanceURL + "/assets/" + assetGUID + "/governance-zones"
+    response=issuePost(addZonesURL, zones)
+    invalidateCachedElements(assetGUID)
+    if response.status_code != 200:
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+                      
+# Create a semantic assignment between an Asset's attachment - like a Schema Type - and Glossary Term 
+def createSemanticAssignment(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, schemaGUID, glossaryTermGUID):                
+    assetOwnerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-owner/users/' + userId
+    semanticAssignmentURL =  assetOwnerURL + '/assets/' + assetGUID + '/attachments/' + schemaGUID + '/meanings/' + glossaryTermGUID
+    response=issuePost(semanticAssignmentURL, {})
+    invalidateCachedElements(assetGUID)
+    if response.status_code == 200:
+        print("Semantic assignment relationship created") 
+    else:
+        print ("No semantic assignment Relationship created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+#
+# Asset Consumer OMAS
+#
+
+# Retrieve the OutTopic connection
+
+def getOutTopicConnection(serverName, serverPlatformName, serverPlatformURL, userId, callerId):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/topics/out-topic-connection/' + callerId
+    response=issueGet(requestURL)
+    connection = getResponseEnvelope(response).get('connection')
+    if connection:
+        return connection
+    else:
+        print ("No connection found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+# Finding Assets
+
+def getAssetForConnectionName(serverName, serverPlatformName, serverPlatformURL, userId, connectionName):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/by-connection-name/' + connectionName
+    response=issueGet(requestURL)
+    guid = getResponseEnvelope(response).get('guid')
+    if guid:
+        return guid
+    else:
+        print ("No asset found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+def getAssetsByMeaning(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/by-meaning/' + termGUID + '?startFrom=0&pageSize=50'
+    response=issueGet(requestURL)
+    guids = getResponseEnvelope(response).get('guids')
+    if guids:
+        return guids
+    else:
+        print ("No assets found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+def getAssetsByTag(serverName, serverPlatformName, serverPlatformURL, userId, tagGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/by-tag/' + tagGUID + '?startFrom=0&pageSize=50'
+    response=issueGet(requestURL)
+    guids = getResponseEnvelope(response).get('guids')
+    if guids:
+        return guids
+    else:
+        print ("No assets found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+def getAssetsByName(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/by-name?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "NameRequestBody",
+        "name" : name
+    }
+    response = issuePost(requestURL, searchBody)
+    guids = getResponseEnvelope(response).get('guids')
+    if guids:
+        return guids
+    else:
+        print ("No assets found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+def iterateAssetConsumerAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize=None, prefetch=False):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+
+    def retrievePage(startFrom, pageSize):
+        requestURL = assetConsumerURL + '/assets/by-search-string?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize)
+        response = issuePost(requestURL, searchBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('guids') or []
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        return None
+
+    return iteratePages(retrievePage, 0, pageSize, prefetch)
+
+def searchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize=None):
+    guids = list(iterateAssetConsumerAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize))
+    if guids:
+        return guids
+    else:
+        print ("No assets found")
+
+def assetConsumerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize=None):
+    return searchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString, pageSize)
+
+def assetConsumerPrintAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString): 
+    guids = assetConsumerSearchForAssets(serverName, serverPlatformName, serverPlatformURL, userId, searchString)
+    if guids:
+        printGUIDList(guids)  
+
+
+# Working with comments
+
+def addCommentToAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentText, commentType, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/comments'
+    commentBody={
+        "class" : "CommentRequestBody",
+        "commentType" : commentType,
+        "commentText" : commentText,
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,commentBody)
+    invalidateCachedElements(assetGUID)
+    commentGUID = getResponseEnvelope(response).get('guid')
+    if commentGUID:
+        return commentGUID
+    else:
+        print ("No comment added")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def updateComment(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentGUID, commentText, commentType, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/comments/' + commentGUID + '/update'
+    commentBody={
+        "class" : "CommentRequestBody",
+        "commentType" : commentType,
+        "commentText" : commentText,
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,commentBody)
+    invalidateCachedElements(assetGUID, commentGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def addReplyToAssetComment(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentGUID, commentText, commentType, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/comments/' + commentGUID + '/replies'
+    requestBody={
+        "class" : "CommentRequestBody",
+        "commentType" : commentType,
+        "commentText" : commentText,
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(assetGUID, commentGUID)
+    commentGUID = getResponseEnvelope(response).get('guid')
+    if commentGUID:
+        return commentGUID
+    else:
+        print ("No comment added")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def assetConsumerAddReplyToAssetComment(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentGUID, commentText, commentType, isPublic):
+    return addReplyToAssetComment(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentGUID, commentText, commentType, isPublic)
+
+
+def removeCommentFromAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, commentGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/comments/' + commentGUID + '/delete'
+    requestBody={
+        "class" : "NullRequestBody",
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(assetGUID, commentGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+# Working with glossary terms (meanings)   
+
+def getMeaningsByName(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/meanings/by-name?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "NameRequestBody",
+        "name" : name
+    }
+    response = issuePost(requestURL, searchBody)
+    meanings = getResponseEnvelope(response).get('meanings')
+    if meanings:
+        return meanings
+    else:
+        print ("No meanings found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+
+def findMeanings(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/meanings/by-search-string?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+    response = issuePost(requestURL, searchBody)
+    meanings = getResponseEnvelope(response).get('meanings')
+    if meanings:
+        return meanings
+    else:
+        print ("No meanings found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+
+def getMeaning(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    def retrieveElement():
+        assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+        requestURL = assetConsumerURL + '/meanings/' + termGUID
+        response=issueGet(requestURL)
+        meaning = getResponseEnvelope(response).get('meaning')
+        if meaning:
+            return meaning
+        else:
+            print ("No meaning found")
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return getCachedElement(serverName, serverPlatformURL, userId, "Meaning", termGUID, retrieveElement)
+
+# Working with Informal Tags
+
+def addTagToAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, tagGUID, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/tags/' + tagGUID
+    requestBody={
+        "class" : "FeedbackRequestBody",
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(assetGUID, tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+    
+def addTagToElement(serverName, serverPlatformName, serverPlatformURL, userId, elementGUID, tagGUID, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/elements/' + elementGUID + '/tags/' + tagGUID
+    requestBody={
+        "class" : "FeedbackRequestBody",
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(elementGUID, tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def removeTagFromAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, tagGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/tags/' + tagGUID + '/delete'
+    requestBody={
+        "class" : "NullRequestBody",
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(assetGUID, tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def removeTagFromElement(serverName, serverPlatformName, serverPlatformURL, userId, elementGUID, tagGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/elements/' + elementGUID + '/tags/' + tagGUID + '/delete'
+    requestBody={
+        "class" : "NullRequestBody",
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(elementGUID, tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def createTag(serverName, serverPlatformName, serverPlatformURL, userId, isPrivateTag, name, description):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags'
+    requestBody={
+        "class" : "TagRequestBody",
+        "isPrivateTag" : isPrivateTag,
+        "name" : name,
+        "description" : description,
+        "user" : userId
+    }
+    response = issuePost(requestURL,requestBody)
+    tagGUID = getResponseEnvelope(response).get('guid')
+    if tagGUID:
+        return tagGUID
+    else:
+        print ("No tag added")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def updateTagDescription(serverName, serverPlatformName, serverPlatformURL, userId, tagGUID, description):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/' + tagGUID + '/update'
+    requestBody={
+        "class" : "TagUpdateRequestBody",
+        "description" : description,
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def deleteTag(serverName, serverPlatformName, serverPlatformURL, userId, tagGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/' + tagGUID + '/delete'
+    requestBody={
+        "class" : "NullRequestBody"
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(tagGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def getTagsByName(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/by-name?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "NameRequestBody",
+        "name" : name
+    }
+    response = issuePost(requestURL, searchBody)
+    tags = getResponseEnvelope(response).get('tags')
+    if tags:
+        return tags
+    else:
+        print ("No tags found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def getMyTagsByName(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/private/by-name?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "NameRequestBody",
+        "name" : name
+    }
+    response = issuePost(requestURL, searchBody)
+    tags = getResponseEnvelope(response).get('tags')
+    if tags:
+        return tags
+    else:
+        print ("No tags found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+
+def findTags(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/by-search-string?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+    response = issuePost(requestURL, searchBody)
+    tags = getResponseEnvelope(response).get('tags')
+    if tags:
+        return tags
+    else:
+        print ("No tags found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def findMyTags(serverName, serverPlatformName, serverPlatformURL, userId, searchString):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/tags/private/by-search-string?startFrom=0&pageSize=50'
+    searchBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+    response = issuePost(requestURL, searchBody)
+    tags = getResponseEnvelope(response).get('tags')
+    if tags:
+        return tags
+    else:
+        print ("No tags found")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def getTag(serverName, serverPlatformName, serverPlatformURL, userId, tagGUID):
+    def retrieveElement():
+        assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+        requestURL = assetConsumerURL + '/tags/' + tagGUID
+        response=issueGet(requestURL)
+        tag = getResponseEnvelope(response).get('tag')
+        if tag:
+            return tag
+        else:
+            print ("No tag found")
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return getCachedElement(serverName, serverPlatformURL, userId, "InformalTag", tagGUID, retrieveElement)
+
+# Working with Ratings/Reviews
+
+def addRatingToAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, starRating, review, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/ratings'
+    requestBody={
+        "class" : "RatingRequestBody",
+        "starRating" : starRating,
+        "review" : review,
+        "user" : userId,
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(assetGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def removeRatingFromAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/ratings/delete'
+    requestBody={
+        "class" : "NullRequestBody",
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(assetGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+    
+# Working with Likes
+
+def addLikeToAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, isPublic):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/likes'
+    requestBody={
+        "class" : "FeedbackRequestBody",
+        "isPublic" : isPublic
+    }
+    response = issuePost(requestURL,requestBody)
+    invalidateCachedElements(assetGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+def removeLikeFromAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId 
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/likes/delete'
+    requestBody={
+        "class" : "NullRequestBody",
+    }
+    response = issuePost(requestURL, requestBody)
+    invalidateCachedElements(assetGUID)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+
+
+# Working with the Audit log
+
+def set_auditlog_destinations_logback(platformURL, adminUserId, serverName, body=[]):
+    adminCommandURLRoot = platformURL + '/open-metadata/admin-services/users/' + adminUserId + '/servers/'
+    print ("   ... updating the audit log destinations...")
+    url = adminCommandURLRoot + serverName + '/audit-log-destinations/slf4j'
+
+    response = issuePost(url, body)
+
+    if response.status_code != 200:
+        processErrorResponse(serverName, 'Platform', platformURL, response)
+    else:
+        print(f"Added slf4j audit destination - body was {body}")
+
+
+def addEventBasedAuditLog(platformURL, userId,serverName, body=[]):
+    alfURL= platformURL + '/open-metadata/admin-services/users/' + userId
+    requestURL = alfURL + '/servers/' + serverName + '/audit-log-destinations/event-topic'
+
+    print(requestURL)
+    response = issuePost(requestURL, body)
+
+    if response.status_code != 200:
+        processErrorResponse(serverName, 'Platform', platformURL, response)
+    else:
+         print(f"Added event audit destination - body was {body}")
+
+
+
+
+def addLogMessageToAsset(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID, connectorInstanceId, connectionName, connectorType, contextId, message):
+    assetConsumerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-consumer/users/' + userId
+    requestURL = assetConsumerURL + '/assets/' + assetGUID + '/log-records'
+    requestBody={
+        "class" : "LogRecordRequestBody",
+        "connectorInstanceId" : connectorInstanceId,
+        "connectionName" : connectionName,
+        "connectorType" : connectorType,
+        "contextId" : contextId,
+        "message" : message
+    }
+    response = issuePost(requestURL,requestBody)
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+#
+# These methods call the OCG Metadata Management Interface on behalf of Asset Consumer OMAS
+#
+def assetConsumerGetAssetUniverse(serverName, serverPlatformName, serverPlatformURL, userId, requestType):
+    return getAssetUniverse(serverName, serverPlatformName, serverPlatformURL, "asset-consumer", userId, requestType)
+        
+def assetConsumerPrintAssetUniverse(serverName, serverPlatformName, serverPlatformURL, userId, requestType):
+    printAssetUniverse(serverName, serverPlatformName, serverPlatformURL, "asset-consumer", userId, requestType)
+
+def assetConsumerPrintAssetCommentReplies(serverName, serverPlatformName, serverPlatformURL, userId, requestType, commentGUID):
+    printAssetCommentReplies(serverName, serverPlatformName, serverPlatformURL, "asset-consumer", userId, requestType, commentGUID)
+
+def assetConsumerPrintRelatedAssets(serverName, serverPlatformName, serverPlatformURL, userId, assetGUID):
+    printRelatedAssets(4, serverName, serverPlatformName, serverPlatformURL, "asset-consumer", userId, assetGUID)
+
+def assetConsumerPrintAssetComments(serverName, serverPlatformName, serverPlatformURL, userId, requestType):
+    printAssetComments(serverName, serverPlatformName, serverPlatformURL, "asset-consumer", userId, requestType)
+
+#
+# Asset Manager OMAS
+# This function assumes the assets exist, and it creates the lineage between the source asset schema type, to the port to the process to the port to 
+# the target asset schematype
+#
+def createDirectedProcessBetweenAssets(serverName, serverPlatformName, serverPlatformURL, userId, sourceSchemaTypeGuid, targetSchemaTypeGuid, processName, processDescription, processFormula):
+
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    createProcessURL = assetManagerURL + '/processes?assetManagerIsHome=false&initialStatus=ACTIVE'
+   
+    elementProperties = {
+        'class':'ProcessProperties',
+        'qualifiedName' : processName,
+        'technicalName':processName,
+        'technicalDescription':processDescription,
+        'formula': processFormula
+    } 
+    metadataCorrelationProperties = {
+        'class':'MetadataCorrelationProperties'
+    }
+    # create the process
+    processRequestBody= {
+        'class':'ProcessRequestBody',
+        'elementProperties': elementProperties,
+        'metadataCorrelationProperties': metadataCorrelationProperties
+        
+    }    
+    response=issuePost(createProcessURL, processRequestBody)
+    processGuid = getResponseEnvelope(response).get('guid')
+    if processGuid:
+        # create in port
+        createPortURL = assetManagerURL + '/processes/' + processGuid + '/ports?assetManagerIsHome=false'
+        metadataCorrelationProperties= {
+            'class':'MetadataCorrelationProperties'
+        }
+        inPortProperties = {
+            'class':'PortProperties',
+            'qualifiedName': processGuid + "-in-port",
+            'portType': 'INPUT_PORT',
+            'displayName': 'in port'
+        }
+        inPortRequestBody = {
+            'class':'PortRequestBody',
+            'MetadataCorrelationProperties': metadataCorrelationProperties,
+            'elementProperties': inPortProperties
+        } 
+        
+        response=issuePost(createPortURL, inPortRequestBody)
+        inPortGuid = getResponseEnvelope(response).get('guid')
+        if inPortGuid is None:
+            print ("No in port created")
+            if response.status_code != 200:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+                return [] 
+            else:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode != 200:
+                    printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+                return []     
+        
+        # create in portschema
+        createInPortSchemaURL = assetManagerURL + '/ports/' + inPortGuid + '/schema-type/' + sourceSchemaTypeGuid +'?assetManagerIsHome=false'
+        assetManagerIdentifiersRequestBody = {
+            'class':'AssetManagerIdentifiersRequestBody'
+        }
+        response=issuePost(createInPortSchemaURL, assetManagerIdentifiersRequestBody)
+       
+        if response.status_code != 200:
+            print ("No in port schema created")
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+            return []         
+        
+        # create out port
+        outPortProperties = {
+            'class':'PortProperties',
+            'qualifiedName': processGuid + "-out-port",
+            'portType': 'OUTPUT_PORT',
+            'displayName': 'out port'
+        }
+        outPortRequestBody = {
+            'class':'PortRequestBody',
+            'MetadataCorrelationProperties': metadataCorrelationProperties,
+            'elementProperties': outPortProperties
+        } 
+
+        response=issuePost(createPortURL, outPortRequestBody)
+        outPortGuid = getResponseEnvelope(response).get('guid')
+        if outPortGuid is None:
+            print ("No out port created")
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+        # create out portschema
+        createOutPortSchemaURL = assetManagerURL + '/ports/' + outPortGuid + '/schema-type/' + targetSchemaTypeGuid +'?assetManagerIsHome=false'
+        assetManagerIdentifiersRequestBody = {
+            'class':'AssetManagerIdentifiersRequestBody'
+        }
+        response=issuePost(createOutPortSchemaURL, assetManagerIdentifiersRequestBody)
+       
+        if response.status_code != 200:
+            print ("No out port schema created")
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)  
+        else:
+            print ("Process " + processName + " created.") 
+        return processGuid
+    else:
+        print ("No process created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+#
+# Paging through the asset manager's by-search-string queries.  These are generators that yield elements as each page
+# arrives (see iteratePages), so only the current page - and the next one, if prefetch is set - is held in memory
+# however large the result.  With stream set, each page is decoded as it is read from the connection so only the
+# current element is held in memory (see streamResponseElements).
+#
+def iterateAssetManagerSearch(serverName, serverPlatformName, serverPlatformURL, userId, searchPath, requestBody, startFrom=0, pageSize=None, prefetch=False, stream=False):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+
+    def retrievePage(pageStart, pageSize):
+        requestURL = assetManagerURL + searchPath + '?startFrom=' + str(pageStart) + '&pageSize=' + str(pageSize)
+        if stream:
+            return streamResponseElements(serverName, serverPlatformName, serverPlatformURL, issueStreamingPost(requestURL, requestBody), 'elementList')
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList') or []
+        printResponse(response)
+        return None
+
+    try:
+        yield from iteratePages(retrievePage, startFrom, pageSize, prefetch)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
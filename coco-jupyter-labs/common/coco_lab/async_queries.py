@@ -0,0 +1,37 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Asynchronous versions of the most heavily used query functions.
+
+"""
+
+from .assets import getAssetUniverse, getRelatedAssets
+from .concurrency import runAsync
+from .glossary import findGlossaryTerms, getGlossaryTermByGUID
+from .governance import getGovernanceAction
+
+
+#
+# Asynchronous versions of the most heavily used query functions.  They issue exactly the same requests as the
+# functions they wrap and return the same results.
+#
+
+async def asyncGetAssetUniverse(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID):
+    return await runAsync(getAssetUniverse, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID)
+
+async def asyncGetRelatedAssets(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID):
+    return await runAsync(getRelatedAssets, serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, assetGUID)
+
+async def asyncFindGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom=0, pageSize=0):
+    return await runAsync(findGlossaryTerms, serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom, pageSize)
+
+async def asyncGetGlossaryTermByGUID(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    return await runAsync(getGlossaryTermByGUID, serverName, serverPlatformName, serverPlatformURL, userId, termGUID)
+
+async def asyncGetGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID):
+    return await runAsync(getGovernanceAction, serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID)
@@ -0,0 +1,122 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+A bounded, time limited cache of the elements that are looked up by GUID.
+
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+#
+# Element cache.  The notebooks and the print functions look up the same elements by GUID again and again.  The
+# lookup functions that use getCachedElement keep their results in a bounded cache keyed by platform, server, user,
+# element type and GUID.  Each element type has its own time to live (in seconds) in elementCacheTTLs and, once the
+# cache holds elementCacheMaxSize entries, the least recently used entry is dropped to make room for a new one.
+# The functions that change an element call invalidateCachedElements so the next lookup goes back to the server.
+# Set elementCacheEnabled to False to turn the cache off.
+#
+
+
+elementCacheEnabled = True
+elementCacheMaxSize = 5000
+elementCacheDefaultTTL = 60
+elementCacheTTLs = {
+    "Glossary" : 600,
+    "GlossaryCategory" : 300,
+    "GlossaryTerm" : 300,
+    "Meaning" : 300,
+    "InformalTag" : 120,
+    "AssetUniverse" : 60
+}
+
+elementCache = OrderedDict()
+elementCacheKeysByGUID = {}
+elementCacheLock = threading.Lock()
+elementCacheGeneration = 0
+elementCacheStatistics = {"hits" : 0, "misses" : 0, "expired" : 0, "evicted" : 0, "invalidated" : 0}
+
+# Must be called while holding elementCacheLock.
+def removeElementCacheEntry(cacheKey):
+    del elementCache[cacheKey]
+    guid = cacheKey[4]
+    cacheKeys = elementCacheKeysByGUID.get(guid)
+    if cacheKeys:
+        cacheKeys.discard(cacheKey)
+        if not cacheKeys:
+            del elementCacheKeysByGUID[guid]
+
+# Return the element from the cache or call retrieveElement() to get it from the server.  Nothing is cached if
+# retrieveElement returns None (an error) or if the element was invalidated while it was being retrieved.
+def getCachedElement(serverName, serverPlatformURL, userId, elementType, guid, retrieveElement, variant=None):
+    if not elementCacheEnabled or guid == None:
+        return retrieveElement()
+    cacheKey = (serverPlatformURL, serverName, userId, elementType, guid, variant)
+    with elementCacheLock:
+        cacheEntry = elementCache.get(cacheKey)
+        if cacheEntry:
+            expiryTime, element = cacheEntry
+            if expiryTime > time.monotonic():
+                elementCache.move_to_end(cacheKey)
+                elementCacheStatistics["hits"] += 1
+                return element
+            removeElementCacheEntry(cacheKey)
+            elementCacheStatistics["expired"] += 1
+        elementCacheStatistics["misses"] += 1
+        generation = elementCacheGeneration
+    element = retrieveElement()
+    if element == None:
+        return element
+    timeToLive = elementCacheTTLs.get(elementType, elementCacheDefaultTTL)
+    with elementCacheLock:
+        if generation == elementCacheGeneration:
+            if cacheKey in elementCache:
+                removeElementCacheEntry(cacheKey)
+            while len(elementCache) >= elementCacheMaxSize:
+                removeElementCacheEntry(next(iter(elementCache)))
+                elementCacheStatistics["evicted"] += 1
+            elementCache[cacheKey] = (time.monotonic() + timeToLive, element)
+            elementCacheKeysByGUID.setdefault(guid, set()).add(cacheKey)
+    return element
+
+# Remove every cached copy of the elements with the supplied GUIDs, whichever platform, server and user they were
+# retrieved through, since a change made through one server is visible through the others.
+def invalidateCachedElements(*guids):
+    global elementCacheGeneration
+    with elementCacheLock:
+        elementCacheGeneration += 1
+        for guid in guids:
+            for cacheKey in list(elementCacheKeysByGUID.get(guid, ())):
+                removeElementCacheEntry(cacheKey)
+                elementCacheStatistics["invalidated"] += 1
+
+def clearElementCache():
+    global elementCacheGeneration
+    with elementCacheLock:
+        elementCacheGeneration += 1
+        elementCache.clear()
+        elementCacheKeysByGUID.clear()
+        for statistic in elementCacheStatistics:
+            elementCacheStatistics[statistic] = 0
+
+def getElementCacheStatistics():
+    with elementCacheLock:
+        statistics = dict(elementCacheStatistics)
+        statistics["size"] = len(elementCache)
+    lookups = statistics["hits"] + statistics["misses"]
+    statistics["hitRatio"] = statistics["hits"] / lookups if lookups else 0.0
+    return statistics
+
+def printElementCacheStatistics():
+    statistics = getElementCacheStatistics()
+    print("Element cache: " + str(statistics["size"]) + " entries, " + str(statistics["hits"]) + " hits, "
+          + str(statistics["misses"]) + " misses (hit ratio " + "{:.1%}".format(statistics["hitRatio"]) + "), "
+          + str(statistics["expired"]) + " expired, " + str(statistics["evicted"]) + " evicted, "
+          + str(statistics["invalidated"]) + " invalidated")
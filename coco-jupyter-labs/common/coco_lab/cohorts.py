@@ -0,0 +1,193 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Querying the open metadata repository cohorts that the servers belong to through the repository services.
+
+"""
+
+from .rest import getPlatformSession, getResponseEnvelope, issueGet, printUnexpectedResponse
+from .topology import adminUserId
+
+
+#
+# Repository Services
+#
+
+# Understanding Cohorts
+#
+# The metadata servers, metadata access points, repository proxies and the CTS are linked together through open metadata repository cohorts.
+# The servers linked via a cohort can exchange open metadata either through federated queries or metadata replication.
+
+def queryServerCohorts(serverName, serverPlatformName, serverPlatformURL):
+    cohortNames = []
+    try:
+        metadataHighwayServicesURLcore =  '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+        url = serverPlatformURL + metadataHighwayServicesURLcore + '/cohort-descriptions'
+        response = getPlatformSession(url).get(url)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                cohorts=getResponseEnvelope(response).get('cohorts')
+                if cohorts != None:
+                    for x in range(len(cohorts)):
+                        cohortName = cohorts[x].get('cohortName')
+                        cohortNames.append(cohortName)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return cohortNames
+
+
+def printServerCohortsStatus(serverName, serverPlatformName, serverPlatformURL):
+    try:
+        metadataHighwayServicesURLcore =  '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+        url = serverPlatformURL + metadataHighwayServicesURLcore + '/cohort-descriptions'
+        response = issueGet(url)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                cohorts=getResponseEnvelope(response).get('cohorts')
+                if cohorts == None:
+                    print("Server " + serverName + " is not connected to any cohorts")
+                else:
+                    print("Server " + serverName + " is connected to the following cohorts:")
+                    for x in range(len(cohorts)):
+                        cohortName = cohorts[x].get('cohortName')
+                        connectionStatus = cohorts[x].get('connectionStatus')
+                        print (" * " + cohortName + " [" + connectionStatus + "]")
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+
+def printCohortMember(cohortMember, localRegistration):
+    serverName = cohortMember.get('serverName')
+    serverType = cohortMember.get('serverType')
+    if serverType is None:
+        serverType = "server"
+    metadataCollectionId = cohortMember.get('metadataCollectionId')
+    metadataCollectionName = cohortMember.get('metadataCollectionName')
+    registrationTime = cohortMember.get('registrationTime')
+    if localRegistration == True:
+        print("Registration details for local " + serverType + " " + serverName)
+    else:    
+        print("Registration details for remote " + serverType + " " + serverName)
+    if (metadataCollectionId != None):
+        print(" * Metadata collection id:   " + metadataCollectionId)
+    if (metadataCollectionName != None):
+        print(" * Metadata collection name: " + metadataCollectionName)
+    if (registrationTime != None):
+        print(" * Registration time:        " + registrationTime)
+    repositoryConnection = cohortMember.get('repositoryConnection')
+    if repositoryConnection != None:
+        endpoint = repositoryConnection.get('endpoint')
+        if endpoint != None:
+            address = endpoint.get('address')
+            if address != None:
+                print(" * URL for metadata queries: " + address)
+            else:
+                print(" * URL for metadata queries: null")
+        else:
+            print(" * URL for metadata queries: no endpoint")
+    else:
+        print(" * URL for metadata queries: not supported")
+
+###
+
+def printLocalRegistration(serverName, serverPlatformName, serverPlatformURL):
+    try:
+        metadataHighwayServicesURLcore =  '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+        url = serverPlatformURL + metadataHighwayServicesURLcore + '/local-registration'
+        response = issueGet(url)
+
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                cohortMember = getResponseEnvelope(response).get('cohortMember')
+                if cohortMember is not None:
+                    printCohortMember(cohortMember, True)
+                else:
+                    print("No Cohort Members returned")
+            else:
+                print("relatedHTTPCode was not 200")
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            print("response.status_code wasn't 200")
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+def printLocalRegistrationForCohort(serverName, cohortName, serverPlatformName, serverPlatformURL):
+    try:
+        metadataHighwayServicesURLcore =  '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+        url = serverPlatformURL + metadataHighwayServicesURLcore + '/cohorts/' + cohortName + '/local-registration'
+        response = issueGet(url)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                cohortMember = getResponseEnvelope(response).get('cohortMember')
+                printCohortMember(cohortMember, True)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+def printRemoteRegistrations(serverName, cohortName, serverPlatformName, serverPlatformURL):
+    try:
+        metadataHighwayServicesURLcore = '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+        url = serverPlatformURL + metadataHighwayServicesURLcore + '/cohorts/' + cohortName + '/remote-members'
+        response = issueGet(url)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                cohortMembers = getResponseEnvelope(response).get('cohortMembers')
+                if cohortMembers != None:
+                    for x in range(len(cohortMembers)):
+                        printCohortMember(cohortMembers[x], False)
+                else:
+                    print("No remote members")
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+    
+
+def printServerCohorts(serverName, serverPlatformName, serverPlatformURL):
+    print("Reviewing the cohort registry for server: " + serverName)
+    print(" ")
+    printLocalRegistration(serverName, serverPlatformName, serverPlatformURL)
+    print(" ")
+    cohorts = queryServerCohorts(serverName, serverPlatformName, serverPlatformURL)
+    for x in range(len(cohorts)):
+        print("Cohort " + cohorts[x] + " member details")
+        printLocalRegistrationForCohort(serverName, cohorts[x], serverPlatformName, serverPlatformURL)
+        printRemoteRegistrations(serverName, cohorts[x], serverPlatformName, serverPlatformURL)
+        print(" ")
+
+def unregisterFromCohort(serverName, cohortName, serverPlatformName, serverPlatformURL):
+    metadataHighwayServicesURLcore = '/servers/' + serverName + '/open-metadata/repository-services/users/' + adminUserId + '/metadata-highway'
+    url = serverPlatformURL + metadataHighwayServicesURLcore + '/cohorts/' + cohortName + '/unregister'
+    response = issueGet(url)
@@ -0,0 +1,179 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Running REST calls concurrently on a shared worker pool, paging through long results and waiting for slow
+operations to finish.
+
+"""
+
+import asyncio
+import functools
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from . import rest
+from .rest import issueGet, issuePost
+from .topology import max_paging_size
+
+
+#
+# Asynchronous REST calls.  These run the rest calls above on a shared worker pool so a notebook or script can
+# have many Egeria calls in flight at once; the requests still go through the pooled platform sessions.
+# Use gatherWithLimit to bound how many run at the same time, for example:
+#
+#     terms = await gatherWithLimit([asyncGetGlossaryTermByGUID(serverName, serverPlatformName, serverPlatformURL, userId, guid)
+#                                    for guid in termGUIDs], 20)
+#
+
+asyncExecutor = None
+workerThread = threading.local()
+
+def markWorkerThread():
+    workerThread.isWorker = True
+
+def isWorkerThread():
+    return getattr(workerThread, "isWorker", False)
+
+# The worker pool is sized to match the connection pool of each platform session.
+def getAsyncExecutor():
+    global asyncExecutor
+    if asyncExecutor == None:
+        asyncExecutor = ThreadPoolExecutor(max_workers=rest.platformPoolMaxSize, thread_name_prefix="egeria-rest",
+                                           initializer=markWorkerThread)
+    return asyncExecutor
+
+async def runAsync(function, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(getAsyncExecutor(), functools.partial(function, *args, **kwargs))
+
+async def asyncIssueGet(url):
+    return await runAsync(issueGet, url)
+
+async def asyncIssuePost(url, body):
+    return await runAsync(issuePost, url, body)
+
+async def gatherWithLimit(awaitables, limit=20):
+    semaphore = asyncio.Semaphore(limit)
+    async def runWithLimit(awaitable):
+        async with semaphore:
+            return await awaitable
+    return await asyncio.gather(*[runWithLimit(awaitable) for awaitable in awaitables])
+
+#
+# Fanning out.  Functions such as loadCategoryTree spread their calls over the worker pool and wait for the results,
+# but they may themselves be running on the pool - wrapped in runAsync or gatherWithLimit, or called from another
+# fan-out.  Had they queued their calls on the same pool, once every worker was waiting for queued calls there would
+# be no worker left to run them.  So mapOnWorkers and submitToWorker use the pool when they are called from outside
+# it, and make the calls one after another in the calling thread when they are called from one of its workers.
+#
+
+def mapOnWorkers(function, items):
+    if isWorkerThread():
+        return map(function, items)
+    return getAsyncExecutor().map(function, items)
+
+def submitToWorker(function, *args, **kwargs):
+    if not isWorkerThread():
+        return getAsyncExecutor().submit(function, *args, **kwargs)
+    future = Future()
+    try:
+        future.set_result(function(*args, **kwargs))
+    except Exception as error:
+        future.set_exception(error)
+    return future
+
+
+#
+# Functions that page through results never ask for more than max_paging_size in one request, and use defaultPageSize
+# when they are not given a page size.  Change defaultPageSize to set the page size for all of them.
+#
+defaultPageSize = max_paging_size
+
+#
+# Paging.  iteratePages is a generator that calls retrievePage(startFrom, pageSize) for successive pages and yields
+# the elements of each page as it arrives.  It stops when retrievePage returns None (an error) or a page shorter than
+# pageSize.  With prefetch set, the next page is requested on the worker pool while the current one is being consumed,
+# unless the pages are being read on one of the pool's workers (see mapOnWorkers above).
+# A page can also be an iterator, such as the elements of a streamed response (see streamResponseElements), in which
+# case its length is only known once it has been read and the next page is not prefetched.
+# Page sizes default to defaultPageSize and are never larger than max_paging_size.
+#
+def iteratePages(retrievePage, startFrom=0, pageSize=None, prefetch=False):
+    if not pageSize:
+        pageSize = defaultPageSize
+    pageSize = min(pageSize, max_paging_size)
+    pageStart = startFrom
+    nextPage = None
+    try:
+        page = retrievePage(pageStart, pageSize)
+        while page is not None:
+            pageStart = pageStart + pageSize
+            if prefetch and not isWorkerThread() and isinstance(page, list) and len(page) == pageSize:
+                nextPage = getAsyncExecutor().submit(retrievePage, pageStart, pageSize)
+            elementCount = 0
+            for element in page:
+                elementCount = elementCount + 1
+                yield element
+            if elementCount < pageSize:
+                break
+            if nextPage:
+                page = nextPage.result()
+                nextPage = None
+            else:
+                page = retrievePage(pageStart, pageSize)
+    finally:
+        if nextPage:
+            nextPage.cancel()
+
+#
+# Waiting.  waitUntil calls check() until it returns something other than None and then returns that value.  Between
+# calls it sleeps, starting with initialInterval seconds and backing off by waitBackoffFactor each time up to
+# maxInterval, with some random jitter so that many waiters do not all call the server at the same moment.  Fast
+# operations are noticed quickly and slow ones are not polled more than they need to be.  If timeout seconds pass
+# first it gives up and returns None (a timeout of None waits for ever).
+#
+# The wait functions default their timeout to defaultWaitTimeout, which stands for whatever waitTimeout is when the
+# wait starts, so changing coco_lab.concurrency.waitTimeout in a notebook takes effect at once.
+#
+
+waitInitialInterval = 0.2
+waitMaxInterval = 5
+waitBackoffFactor = 1.5
+waitJitter = 0.2
+waitTimeout = 600
+defaultWaitTimeout = object()
+
+def getWaitTimeout(timeout):
+    if timeout is defaultWaitTimeout:
+        return waitTimeout
+    return timeout
+
+def getNextWaitInterval(interval, maxInterval=None):
+    return min(interval * waitBackoffFactor, maxInterval or waitMaxInterval)
+
+def getJitteredInterval(interval):
+    return interval * random.uniform(1 - waitJitter, 1 + waitJitter)
+
+def waitUntil(check, timeout=defaultWaitTimeout, initialInterval=None, maxInterval=None):
+    timeout = getWaitTimeout(timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = initialInterval or waitInitialInterval
+    while True:
+        result = check()
+        if result is not None:
+            return result
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            return None
+        sleepTime = getJitteredInterval(interval)
+        if deadline is not None:
+            sleepTime = min(sleepTime, deadline - now)
+        time.sleep(sleepTime)
+        interval = getNextWaitInterval(interval, maxInterval)
@@ -0,0 +1,301 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Compact records for the assets, glossary terms, glossary categories and governance actions returned by the open
+metadata services.
+
+"""
+
+import sys
+import threading
+
+from .rest import decodeJSON, encodeJSON, encodeStoredJSON
+
+
+#
+# Compact element records.  The query functions return each element as nested dictionaries, which is convenient but
+# takes a lot of memory once a notebook holds tens of thousands of them.  The record classes below hold the same
+# element in __slots__ instead:
+#
+#   - the commonly used fields are kept in slots named after the JSON fields,
+#   - repeated strings such as type names, user ids and zone names are interned, and lists of them become tuples,
+#   - an element's type and origin are shared by all of the elements with the same type and origin,
+#   - every other field - classifications, additionalProperties, extendedProperties and so on - is kept as compact
+#     JSON and only decoded the first time one of them is used.
+#
+# The records have a get method that works like the dictionary's, so the print functions and the other helpers work
+# on records and dictionaries alike, for example getElementGUID(term.get('elementHeader')).  Fields can also be read
+# as attributes: term.elementHeader.type.typeName.  toDict returns the element as dictionaries again.
+#
+# Convert elements as they are retrieved, for example
+#
+#     terms = list(toElementRecords(iterateGlossaryTerms(...), GlossaryTermElement))
+#
+# or pass compact=True to findGlossaryTermsAll, getCategoriesForGlossary, assetOwnerSearchForAssets and
+# getGovernanceActions.  Records, and the shared types and origins in particular, should be
+# treated as read only.
+#
+
+def internString(value):
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+def internStrings(values):
+    if type(values) is list:
+        return tuple(internString(value) for value in values)
+    return values
+
+
+class ElementRecord:
+    __slots__ = ('remainingFields',)
+
+    # Maps the name of each field kept in a slot to the function that converts its value (None keeps it as it is).
+    fieldConverters = {}
+
+    # Fields that are kept with the remaining fields but can still be read as attributes.
+    lazyFieldNames = ()
+
+    def __init__(self, element):
+        remainingFields = None
+        fieldConverters = self.fieldConverters
+        for name, value in element.items():
+            if name in fieldConverters:
+                if value is not None:
+                    converter = fieldConverters[name]
+                    setattr(self, name, converter(value) if converter else value)
+            else:
+                if remainingFields is None:
+                    remainingFields = {}
+                remainingFields[name] = value
+        if remainingFields:
+            self.remainingFields = encodeStoredJSON(remainingFields)
+        else:
+            self.remainingFields = None
+
+    # Slots that were not in the element read as None; the lazy fields are decoded on first use.
+    def __getattr__(self, name):
+        if name in self.fieldConverters:
+            return None
+        if name in self.lazyFieldNames:
+            return self.getRemainingFields().get(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def getRemainingFields(self):
+        remainingFields = self.remainingFields
+        if remainingFields is None:
+            return {}
+        if type(remainingFields) is bytes:
+            remainingFields = decodeJSON(remainingFields)
+            self.remainingFields = remainingFields
+        return remainingFields
+
+    def get(self, name, default=None):
+        if name in self.fieldConverters:
+            value = getattr(self, name)
+        else:
+            value = self.getRemainingFields().get(name)
+        if value is None:
+            return default
+        return value
+
+    def toDict(self):
+        element = {}
+        for name in self.fieldConverters:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if isinstance(value, ElementRecord):
+                value = value.toDict()
+            elif type(value) is tuple:
+                value = list(value)
+            element[name] = value
+        element.update(self.getRemainingFields())
+        return element
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(self.toDict()) + ")"
+
+
+#
+# Records that are the same for many elements are shared.  sharedRecords is keyed by the record class and the
+# element's JSON and stops growing at sharedRecordsMaxSize entries.  Elements are converted on the worker pool as
+# well as in the notebook, so sharedRecords is only used while holding sharedRecordsLock.
+#
+sharedRecordsMaxSize = 10000
+sharedRecords = {}
+sharedRecordsLock = threading.Lock()
+
+def getSharedRecord(recordClass, element):
+    recordKey = (recordClass, encodeJSON(element))
+    with sharedRecordsLock:
+        record = sharedRecords.get(recordKey)
+    if record is None:
+        record = recordClass(element)
+        with sharedRecordsLock:
+            # Another thread may have added the same record while this one was being made
+            sharedRecord = sharedRecords.get(recordKey)
+            if sharedRecord is not None:
+                record = sharedRecord
+            elif len(sharedRecords) < sharedRecordsMaxSize:
+                sharedRecords[recordKey] = record
+    return record
+
+def clearSharedRecords():
+    with sharedRecordsLock:
+        sharedRecords.clear()
+
+
+class ElementType(ElementRecord):
+    fieldConverters = {
+        "typeId" : internString,
+        "typeName" : internString,
+        "typeVersion" : None,
+        "typeDescription" : internString,
+        "superTypeNames" : internStrings
+    }
+    __slots__ = tuple(fieldConverters)
+
+def getSharedElementType(element):
+    return getSharedRecord(ElementType, element)
+
+
+class ElementOrigin(ElementRecord):
+    fieldConverters = {
+        "sourceServer" : internString,
+        "originCategory" : internString,
+        "homeMetadataCollectionId" : internString,
+        "homeMetadataCollectionName" : internString,
+        "license" : internString
+    }
+    __slots__ = tuple(fieldConverters)
+
+def getSharedElementOrigin(element):
+    return getSharedRecord(ElementOrigin, element)
+
+
+class ElementVersions(ElementRecord):
+    fieldConverters = {
+        "createdBy" : internString,
+        "updatedBy" : internString,
+        "maintainedBy" : internStrings,
+        "createTime" : None,
+        "updateTime" : None,
+        "version" : None
+    }
+    __slots__ = tuple(fieldConverters)
+
+
+class ElementHeader(ElementRecord):
+    fieldConverters = {
+        "guid" : None,
+        "type" : getSharedElementType,
+        "origin" : getSharedElementOrigin,
+        "versions" : ElementVersions,
+        "status" : internString
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("classifications",)
+
+
+class AssetProperties(ElementRecord):
+    fieldConverters = {
+        "qualifiedName" : None,
+        "displayName" : None,
+        "name" : None,
+        "versionIdentifier" : None,
+        "description" : None,
+        "owner" : internString,
+        "ownerTypeName" : internString,
+        "zoneMembership" : internStrings,
+        "typeName" : internString
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("additionalProperties", "extendedProperties", "otherOriginValues")
+
+
+class AssetElement(ElementRecord):
+    fieldConverters = {
+        "elementHeader" : ElementHeader,
+        "assetProperties" : AssetProperties,
+        "properties" : AssetProperties
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("correlationHeaders",)
+
+
+class GlossaryTermProperties(ElementRecord):
+    fieldConverters = {
+        "qualifiedName" : None,
+        "displayName" : None,
+        "summary" : None,
+        "description" : None,
+        "examples" : None,
+        "abbreviation" : None,
+        "usage" : None,
+        "publishVersionIdentifier" : None
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("additionalProperties", "extendedProperties")
+
+
+class GlossaryTermElement(ElementRecord):
+    fieldConverters = {
+        "elementHeader" : ElementHeader,
+        "glossaryTermProperties" : GlossaryTermProperties
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("correlationHeaders",)
+
+
+class GlossaryCategoryProperties(ElementRecord):
+    fieldConverters = {
+        "qualifiedName" : None,
+        "displayName" : None,
+        "description" : None
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("additionalProperties", "extendedProperties")
+
+
+class GlossaryCategoryElement(ElementRecord):
+    fieldConverters = {
+        "elementHeader" : ElementHeader,
+        "glossaryCategoryProperties" : GlossaryCategoryProperties
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("correlationHeaders",)
+
+
+class GovernanceActionElement(ElementRecord):
+    fieldConverters = {
+        "elementHeader" : ElementHeader,
+        "qualifiedName" : None,
+        "displayName" : None,
+        "description" : None,
+        "actionStatus" : internString,
+        "processName" : internString,
+        "governanceEngineGUID" : internString,
+        "governanceEngineName" : internString,
+        "requestType" : internString,
+        "processingEngineUserId" : internString,
+        "requestedTime" : None,
+        "startTime" : None,
+        "completionTime" : None,
+        "completionGuards" : internStrings,
+        "completionMessage" : None
+    }
+    __slots__ = tuple(fieldConverters)
+    lazyFieldNames = ("requestParameters", "requestSourceElements", "actionTargetElements", "receivedGuards",
+                      "mandatoryGuards", "additionalProperties", "extendedProperties")
+
+
+# Convert elements to records as they are iterated, so only one page of dictionaries is in memory at a time.
+def toElementRecords(elements, recordClass):
+    for element in elements:
+        yield recordClass(element) if element is not None else None
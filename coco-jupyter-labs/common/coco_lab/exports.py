@@ -0,0 +1,229 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+The names that "from coco_lab.<area> import *" binds, listed under the area each name comes from, for
+coco_lab.bindLazyNames.  Generated by "python -m coco_lab --update-exports" - do not edit by hand.
+
+"""
+
+areaExports = {
+    "topology" : {
+        "functions" : (),
+        "modules" : {"os" : "os"},
+        "values" : ("adminPlatformURL", "adminUserId", "calliesUserId", "cocoCohort", "cocoMDS1Name",
+                    "cocoMDS1PlatformName", "cocoMDS1PlatformURL", "cocoMDS2Name", "cocoMDS2PlatformName",
+                    "cocoMDS2PlatformURL", "cocoMDS3Name", "cocoMDS3PlatformName", "cocoMDS3PlatformURL",
+                    "cocoMDS4Name", "cocoMDS4PlatformName", "cocoMDS4PlatformURL", "cocoMDS5Name",
+                    "cocoMDS5PlatformName", "cocoMDS5PlatformURL", "cocoMDS6Name", "cocoMDS6PlatformName",
+                    "cocoMDS6PlatformURL", "cocoMDSxName", "cocoMDSxPlatformName", "cocoMDSxPlatformURL",
+                    "cocoOLS1Name", "cocoOLS1PlafformURL", "cocoOLS1PlatformName", "cocoView1Name",
+                    "cocoView1PlatformName", "cocoView1PlatformURL", "corePlatformName", "corePlatformURL", "ctsCohort",
+                    "dataLakePlatformName", "dataLakePlatformURL", "devCohort", "devPlatformName", "devPlatformURL",
+                    "egeriaSampleDataRoot", "erinsUserId", "eventBusBootstrapServers", "exchangeDL01MDS",
+                    "exchangeDL01Name", "exchangeDL01PlatformName", "exchangeDL01PlatformURL", "exchangeDL01ServerType",
+                    "faithsUserId", "fileSystemRoot", "governDL01MDS", "governDL01Name", "governDL01PlatformName",
+                    "governDL01PlatformURL", "governDL01ServerType", "harrysUserId", "iotCohort", "max_paging_size",
+                    "monitorDev01MDS", "monitorDev01Name", "monitorDev01PlatformName", "monitorDev01PlatformURL",
+                    "monitorDev01ServerType", "monitorGov01MDS", "monitorGov01Name", "monitorGov01PlatformName",
+                    "monitorGov01PlatformURL", "monitorGov01ServerType", "petersUserId")
+    },
+    "rest" : {
+        "functions" : ("HTTPAdapter", "ResponseEnvelope", "ResponseStream", "closePlatformSessions",
+                       "configurePlatformSessions", "decodeJSON", "encodeJSON", "encodeStoredJSON",
+                       "exportRestCallMetricsJSONL", "exportRestCallMetricsPrometheus", "getAndPrintResult",
+                       "getEndpointTemplate", "getHistogramBucketRange", "getHistogramIndex", "getHistogramPercentile",
+                       "getInstrumentedRequest", "getLastRestResponse", "getPlatformSession", "getPrometheusLabels",
+                       "getRelatedHTTPCode", "getResponseEnvelope", "getRestCallStatistics", "getResult",
+                       "isTransientRestFailure", "issueDataPost", "issueDelete", "issueGet", "issuePost",
+                       "issuePostNoBody", "issuePut", "issueStreamingGet", "issueStreamingPost",
+                       "iterateResponseElements", "postAndPrintResult", "printResponse", "printRestCallStatistics",
+                       "printRestRequest", "printRestRequestBody", "printRestResponse", "printUnexpectedResponse",
+                       "processErrorResponse", "recordRestCall", "resetRestCallStatistics", "streamResponseElements",
+                       "urlsplit"),
+        "modules" : {"codecs" : "codecs", "json" : "json", "orjson" : "orjson", "re" : "re", "requests" : "requests",
+                     "threading" : "threading", "time" : "time", "urllib3" : "urllib3"},
+        "values" : ("isDebug", "lastRestCalls", "platformPoolConnections", "platformPoolMaxSize", "platformSessions",
+                    "platformSessionsLock", "restCallGUIDPattern", "restCallHistogramPrecision",
+                    "restCallHistogramSubBuckets", "restCallMetricsEnabled", "restCallPrometheusBuckets",
+                    "restCallRelatedHTTPCodePattern", "restCallStatistics", "restCallStatisticsLock",
+                    "restCallUserPattern", "streamChunkSize", "streamDecoder", "streamNumberEndPattern",
+                    "streamWhitespacePattern")
+    },
+    "concurrency" : {
+        "functions" : ("Future", "ThreadPoolExecutor", "asyncIssueGet", "asyncIssuePost", "gatherWithLimit",
+                       "getAsyncExecutor", "getJitteredInterval", "getNextWaitInterval", "getWaitTimeout",
+                       "isWorkerThread", "iteratePages", "mapOnWorkers", "markWorkerThread", "runAsync",
+                       "submitToWorker", "waitUntil"),
+        "modules" : {"asyncio" : "asyncio", "functools" : "functools", "random" : "random", "rest" : "coco_lab.rest"},
+        "values" : ("asyncExecutor", "defaultPageSize", "defaultWaitTimeout", "waitBackoffFactor",
+                    "waitInitialInterval", "waitJitter", "waitMaxInterval", "waitTimeout", "workerThread")
+    },
+    "cache" : {
+        "functions" : ("OrderedDict", "clearElementCache", "getCachedElement", "getElementCacheStatistics",
+                       "invalidateCachedElements", "printElementCacheStatistics", "removeElementCacheEntry"),
+        "modules" : {},
+        "values" : ("elementCache", "elementCacheDefaultTTL", "elementCacheEnabled", "elementCacheGeneration",
+                    "elementCacheKeysByGUID", "elementCacheLock", "elementCacheMaxSize", "elementCacheStatistics",
+                    "elementCacheTTLs")
+    },
+    "elements" : {
+        "functions" : ("AssetElement", "AssetProperties", "ElementHeader", "ElementOrigin", "ElementRecord",
+                       "ElementType", "ElementVersions", "GlossaryCategoryElement", "GlossaryCategoryProperties",
+                       "GlossaryTermElement", "GlossaryTermProperties", "GovernanceActionElement", "clearSharedRecords",
+                       "getSharedElementOrigin", "getSharedElementType", "getSharedRecord", "internString",
+                       "internStrings", "toElementRecords"),
+        "modules" : {"sys" : "sys"},
+        "values" : ("sharedRecords", "sharedRecordsLock", "sharedRecordsMaxSize")
+    },
+    "admin" : {
+        "functions" : ("addStartupArchive", "clearServerType", "config_xtdb_pg", "configureAccessService",
+                       "configureAccessServiceNoTopic", "configureBuiltinMetadataRepository",
+                       "configureCohortMembership", "configureDefaultAuditLog", "configureDescriptiveName",
+                       "configureEngineDefinitionServices", "configureEventBasedAuditLog", "configureEventBus",
+                       "configureGovernanceEngineService", "configureGovernanceSolutionViewService",
+                       "configureIntegrationGroup", "configureIntegrationService", "configureIntegrationViewService",
+                       "configureMaxPageSize", "configureMetadataCollectionId", "configureMetadataRepository",
+                       "configureOwningOrganization", "configurePassword", "configurePlatformURL",
+                       "configurePluginMetadataRepository", "configureRepositoryProxy",
+                       "configureRepositoryProxyDetails", "configureSLF4JAuditLog", "configureSecurityConnection",
+                       "configureServerType", "configureUserId", "deleteCohortMembership", "deployServerToPlatform",
+                       "loadArchive", "removeAllStartupArchive"),
+        "modules" : {},
+        "values" : ()
+    },
+    "platform_services" : {
+        "functions" : ("activatePlatform", "activateServerIfDown", "activateServerOnPlatform", "checkServerActive",
+                       "checkServerConfigured", "checkServerPlatform", "getAccessServices", "getConnectorType",
+                       "getEngineServices", "getIntegrationServices", "getServerPlatformServices", "getServerServices",
+                       "getViewServices", "printServiceDescriptions", "queryActiveServers", "queryKnownServers",
+                       "reActivatePlatform"),
+        "modules" : {},
+        "values" : ()
+    },
+    "cohorts" : {
+        "functions" : ("printCohortMember", "printLocalRegistration", "printLocalRegistrationForCohort",
+                       "printRemoteRegistrations", "printServerCohorts", "printServerCohortsStatus",
+                       "queryServerCohorts", "unregisterFromCohort"),
+        "modules" : {},
+        "values" : ()
+    },
+    "assets" : {
+        "functions" : ("addCommentToAsset", "addEventBasedAuditLog", "addLikeToAsset", "addLogMessageToAsset",
+                       "addOrigin", "addOwner", "addRatingToAsset", "addReplyToAssetComment",
+                       "addSchemaTypesToRetrieve", "addTagToAsset", "addTagToElement", "addZones",
+                       "assetConsumerAddReplyToAssetComment", "assetConsumerGetAssetUniverse",
+                       "assetConsumerPrintAssetCommentReplies", "assetConsumerPrintAssetComments",
+                       "assetConsumerPrintAssetUniverse", "assetConsumerPrintAssets", "assetConsumerPrintRelatedAssets",
+                       "assetConsumerSearchForAssets", "assetManagerDeleteAssets", "assetOwnerCreateAsset",
+                       "assetOwnerCreateAvroAsset", "assetOwnerCreateCSVAsset",
+                       "assetOwnerCreateCSVAssetWithColumnHeaders", "assetOwnerDelete", "assetOwnerDeleteAssets",
+                       "assetOwnerFindAssetPathName", "assetOwnerFindAssetQualifiedName",
+                       "assetOwnerGetSchemaAttributesFromSchemaType", "assetOwnerPrintAssets",
+                       "assetOwnerSearchForAssets", "createDirectedProcessBetweenAssets", "createSemanticAssignment",
+                       "createTag", "deleteAssetWithRetry", "deleteAssetsInBulk", "deleteTag", "findMeanings",
+                       "findMyTags", "findTags", "getAPIOperations", "getAssetForConnectionName",
+                       "getAssetQualifiedName", "getAssetUniverse", "getAssetsByMeaning", "getAssetsByName",
+                       "getAssetsByTag", "getCommentReplies", "getComments", "getElementGUID", "getElementType",
+                       "getLastGUID", "getMeaning", "getMeaningsByName", "getMyTagsByName", "getOutTopicConnection",
+                       "getRelatedAssets", "getSchemaAttributesFromSchemaType", "getTag", "getTagsByName",
+                       "issueAssetDelete", "iterateAPIOperations", "iterateAssetConsumerAssets",
+                       "iterateAssetManagerSearch", "iterateAssetOwnerAssets", "iterateCommentReplies",
+                       "iterateComments", "iterateConnectedAssetList", "iterateRelatedAssets",
+                       "iterateSchemaAttributes", "loadSchemaTree", "printAsset", "printAssetCommentReplies",
+                       "printAssetComments", "printAssetDetail", "printAssetListDetail", "printAssetListSummary",
+                       "printAssetSummary", "printAssetUniverse", "printClassifications", "printComment",
+                       "printCommentList", "printCommentReplies", "printCommentResponse", "printComments",
+                       "printGUIDList", "printMapProperties", "printMeanings", "printMetadataCollection", "printName",
+                       "printNestedSchemaAttribute", "printRelatedAsset", "printRelatedAssets", "printSchemaAttribute",
+                       "printSchemaAttributes", "printSchemaType", "printSchemaTypeDetail", "printSearchKeywords",
+                       "printSelectiveAssetUniverse", "printStringProperty", "printType", "readAssetDeletionLedger",
+                       "removeCommentFromAsset", "removeLikeFromAsset", "removeRatingFromAsset", "removeTagFromAsset",
+                       "removeTagFromElement", "searchForAssets", "set_auditlog_destinations_logback", "updateComment",
+                       "updateTagDescription", "wait"),
+        "modules" : {},
+        "values" : ("ALL_COMPLETED", "FIRST_COMPLETED", "assetSearchTimeout")
+    },
+    "glossary" : {
+        "functions" : ("addSecurityTagsToGlossary", "archiveTermWithAssetManager", "createCategoryWithAssetManager",
+                       "createControlledTermWithAssetManager", "createGlossary", "createGlossaryWithAssetManager",
+                       "createSimpleTermsFromCSVFile", "createSynonym", "createTerm", "createTermWithAssetManager",
+                       "createTermWithRetry", "createValidValue", "deleteGlossary", "displayDescription",
+                       "displayTermSummary", "exportCategoryTree", "findGlossaryTerms", "findGlossaryTermsAll",
+                       "findTerm", "getAssetManagerTermCreator", "getAttachedNoteLogsWithAssetManager",
+                       "getCSVColumnValue", "getCategoriesForGlossary", "getCategoryDisplayName", "getCreatedTermGUID",
+                       "getGUIDFromGlossary", "getGUIDFromGlossaryTerm", "getGlossariesByName", "getGlossaryByGUID",
+                       "getGlossaryCategoriesByName", "getGlossaryCategoryByGUID", "getGlossaryTermByGUID",
+                       "getGlossaryTerms", "getGlossaryTermsByName", "getNotesForNoteLogWithAssetManager",
+                       "getSubcategories", "getSubjectAreaTermCreator", "getTermHistory", "getTermsForGlossaryCategory",
+                       "getTopLevelCategory", "iterateGlossaries", "iterateGlossaryCategories", "iterateGlossaryTerms",
+                       "loadCategoryTree", "loadGlossaryTermsFromCSVFile", "printCategoryElement",
+                       "printCategoryElements", "printCategoryHierarchy", "printCategoryTree", "printElementHeader",
+                       "printGlossaryElement", "printGlossaryElements", "printGlossarySummary", "printNoteForNoteLog",
+                       "printNoteLogSummary", "printNotesForNoteLog", "printRevisionHistoryWithAssetManager",
+                       "printTermElement", "printTermElements", "printTermSummaries", "printTermSummary",
+                       "printTermsForCategories", "readTermCheckpoint", "searchForGlossaryTerms", "setupTermCategory",
+                       "undoTermUpdateWithAssetManager", "updateTermGovernanceClassifications",
+                       "updateTermStatusWithAssetManager", "updateTermVersionWithAssetManager",
+                       "updateTermWithAssetManager"),
+        "modules" : {"csv" : "csv"},
+        "values" : ()
+    },
+    "governance" : {
+        "functions" : ("addGovernanceActionWaiter", "addIntegrationConnectorToGroup", "checkGovernanceActionCompletion",
+                       "checkGovernanceActionStatus", "checkGovernanceEngineStatus", "createGovernanceActionProcess",
+                       "createGovernanceActionType", "createGovernanceEngine", "createGovernanceService",
+                       "createIntegrationConnector", "createIntegrationGroup", "createOutTopicConsumer",
+                       "filterGovernanceActions", "getDiscoveryReport", "getDiscoveryReportAnnotations",
+                       "getEventGUIDs", "getGovernanceAction", "getGovernanceActionGUIDs", "getGovernanceActionMonitor",
+                       "getGovernanceActionMonitorKey", "getGovernanceActionUpdateTime", "getGovernanceActions",
+                       "getGovernanceEngineDefinitions", "getGovernanceEngineGUID", "getGovernanceEngineOutTopicName",
+                       "getGovernanceEngineProperties", "getGovernanceEngineSummary", "getGovernanceServiceDefinitions",
+                       "getRegisteredGovernanceServices", "initiateGovernanceAction",
+                       "isGovernanceActionListenerRunning", "iterateGovernanceActions", "monitorGovernanceActions",
+                       "notifyGovernanceActionWaiters", "printGovernanceAction", "printGovernanceActionChanges",
+                       "printGovernanceActionSummary", "printGovernanceEngineDefinition", "printGovernanceEngineStatus",
+                       "printGovernanceEngineStatuses", "printGovernanceServiceDefinition",
+                       "printRegisteredServicesProperties", "printRequestTypes", "readNewGovernanceActions",
+                       "refreshGovernanceActionMonitor", "refreshGovernanceEngineConfig",
+                       "registerGovernanceServiceWithEngine", "removeGovernanceActionWaiter", "runDiscoveryService",
+                       "runGovernanceActionListener", "setupFirstActionType", "setupNextActionType",
+                       "startGovernanceActionListener", "stopGovernanceActionListener", "takeNotifiedGUIDs",
+                       "validateAssetAnalysisEngineConnector", "validateGovernanceActionEngineConnector",
+                       "waitForConfiguringGovernanceEngine", "waitForGovernanceActions",
+                       "waitForGovernanceEngineStatus", "waitForRunningGovernanceAction",
+                       "waitForRunningGovernanceEngine", "watchGovernanceActions"),
+        "modules" : {"concurrency" : "coco_lab.concurrency"},
+        "values" : ("KafkaConsumer", "TopicPartition", "governanceActionEventPollInterval", "governanceActionListener",
+                    "governanceActionMonitorPageSize", "governanceActionMonitors", "governanceActionWaiters",
+                    "governanceActionWaitersLock")
+    },
+    "integration" : {
+        "functions" : ("getIntegrationConnectorConfigProperties", "getIntegrationDaemonStatus",
+                       "printIntegrationConnectorStatus", "printIntegrationGroupSummary",
+                       "printIntegrationServiceSummary", "refreshIntegrationGroupConfig", "restartIntegrationConnector",
+                       "updateConnectorConfigurationProperties", "validateIntegrationConnector"),
+        "modules" : {},
+        "values" : ()
+    },
+    "async_queries" : {
+        "functions" : ("asyncFindGlossaryTerms", "asyncGetAssetUniverse", "asyncGetGlossaryTermByGUID",
+                       "asyncGetGovernanceAction", "asyncGetRelatedAssets"),
+        "modules" : {},
+        "values" : ()
+    },
+    "search_index" : {
+        "functions" : ("addToSearchIndex", "buildSearchIndex", "clearSearchIndexes", "getAssetSearchIndex",
+                       "getElementProperties", "getElementVersionKey", "getGlossarySearchIndex", "getPrefixPostings",
+                       "getSearchIndex", "getSearchIndexKey", "getSearchTokens", "getSortedTokens",
+                       "getSubstringCandidates", "getTrigrams", "iterateSearchIndexSource", "loadSearchIndex",
+                       "newSearchIndex", "refreshSearchIndex", "removeFromSearchIndex", "saveSearchIndex", "searchIndex"),
+        "modules" : {"bisect" : "bisect", "heapq" : "heapq"},
+        "values" : ("searchIndexFields", "searchIndexMaxAge", "searchIndexPageSize", "searchIndexRecordClasses",
+                    "searchIndexVersion", "searchIndexes", "tokenPattern")
+    }
+}
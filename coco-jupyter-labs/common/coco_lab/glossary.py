@@ -0,0 +1,1458 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Working with glossaries, categories and terms through the Subject Area and Asset Manager OMASs.
+
+"""
+
+import csv
+import time
+from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
+
+from . import rest
+from .assets import getElementGUID, iterateAssetManagerSearch
+from .cache import getCachedElement, invalidateCachedElements
+from .concurrency import getJitteredInterval, getNextWaitInterval, iteratePages, mapOnWorkers, submitToWorker
+from .elements import GlossaryCategoryElement, GlossaryTermElement, toElementRecords
+from .rest import (getLastRestResponse, getResponseEnvelope, isTransientRestFailure, issueGet, issuePost, issuePut,
+                   issueStreamingPost, printResponse, processErrorResponse, streamResponseElements)
+from .topology import erinsUserId
+
+
+#
+# Subject Area OMAS
+# Working with glossaries - this set of functions displays glossary content returned from the open metadata repositories.
+#         
+
+def printGlossarySummary(glossary):
+    nodeTypeName = glossary.get('nodeType')
+    nodeQualifiedName = glossary.get('qualifiedName')
+    systemAttributes = glossary.get('systemAttributes')
+    guid = systemAttributes.get('guid')
+    print (nodeQualifiedName)
+    print(nodeTypeName + " \t| " + guid + " | " + nodeQualifiedName)    
+    
+def printTermSummary(term):
+    nodeTypeName = term.get('nodeType')
+    nodeQualifiedName = term.get('qualifiedName')
+    systemAttributes = term.get('systemAttributes')
+    guid = systemAttributes.get('guid')
+    print (nodeQualifiedName)
+    print(nodeTypeName + " \t| " + guid + " | " + nodeQualifiedName)     
+
+#
+# Working with glossary content - this set of functions are for authoring glossary content.
+#      
+    
+# Create a glossary with a display name and description     
+def createGlossary(serverName, serverPlatformName, serverPlatformURL, userId, displayName, description):    
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    createGlossaryURL = subjectAreaURL + '/glossaries'
+    createGlossaryBody = {
+        "class" : "Glossary",
+        "name" : displayName,
+        "description" : description,
+        "nodeType" : "Glossary",
+    }
+    response = issuePost(createGlossaryURL, createGlossaryBody)
+    result = getResponseEnvelope(response).get('result')
+    createdGlossary = result[0]
+    if createdGlossary:
+        return createdGlossary
+    else:
+        print ("No Glossary created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        
+# Create a glossary term with a display name and description     
+def createTerm(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, displayName, description, example):
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    createTermURL = subjectAreaURL + '/terms'
+    
+    glossaryBody = { 
+        "guid": glossaryGUID
+    }
+    createTermBody = {
+        "class" : "Term",
+        "name" : displayName,
+        "description" : description,
+        "example"  : example,
+        "nodeType" : "Term",
+        "glossary" : glossaryBody
+    }
+ 
+    response = issuePost(createTermURL, createTermBody)
+    result = getResponseEnvelope(response).get('result')
+    createdTerm = result[0]
+    if createdTerm:
+        return createdTerm
+    else:
+        print ("No Term created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    
+# Find a Term that matches the supplied search criteria and is within the glossary identified by glossaryGUID    
+def findTerm(serverName, serverPlatformName, serverPlatformURL, userId, searchCriteria, glossaryGUID):
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    termURL = subjectAreaURL + '/terms?searchCriteria=' + searchCriteria
+    response=issueGet(termURL)
+    results = getResponseEnvelope(response).get('result')
+    for resultTerm in results:
+        resultTermGlossary = resultTerm.get('glossary') 
+        if (resultTermGlossary):
+            resultTermGlossaryGUID = resultTermGlossary.get('guid')
+            if resultTermGlossaryGUID == glossaryGUID:
+                return resultTerm
+            
+    print ("No Term found")
+    processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+# update a Term with the supplied governance classifications     
+def updateTermGovernanceClassifications(serverName, serverPlatformName, serverPlatformURL, userId, termGuid, retention, criticality, confidence, confidentiality):
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    termURL = subjectAreaURL + '/terms/' + termGuid
+    governanceClassifications = {
+        "class": "GovernanceClassifications"
+    }
+    if retention:
+        retention['class'] = "Retention"
+        governanceClassifications['retention'] = retention
+    if criticality:
+        criticality['class'] = "Criticality"
+        governanceClassifications['criticality'] = criticality
+    if confidence:
+        confidence['class'] = "Confidence"
+        governanceClassifications['confidence'] = confidence
+    if confidentiality:
+        confidentiality['class'] = "confidentiality"
+        governanceClassifications['confidentiality'] = confidentiality
+        
+    termBody = {
+        "class" : "Term",
+        "governanceClassifications": governanceClassifications
+    }
+    response=issuePut(termURL, termBody)
+    invalidateCachedElements(termGuid)
+    result = getResponseEnvelope(response).get('result')
+
+    updatedTerm = result[0]
+    if updatedTerm:
+        print("updatedTerm Governance action classifications")
+        print(updatedTerm.get('governanceClassifications'))
+        return updatedTerm
+    else:
+        print ("Term not updated")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    
+# create a synonym relationship between 2 glossary terms    
+def createSynonym(serverName, serverPlatformName, serverPlatformURL, userId, guid1, guid2):
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    createSynonymURL = subjectAreaURL + '/relationships/synonyms'
+    
+    end1 = {
+        "class": "LineEnd",
+        "nodeGuid" : guid1,
+        "nodeType": "Term",
+        "name":"synonyms"
+    }
+    end2 = {
+        "class": "LineEnd",
+        "nodeGuid" : guid2,
+        "nodeType": "Term",
+        "name":"synonyms"
+    }
+    createSynonymBody = {
+        "class" : "Synonym",
+        "typeDefGuid": "74f4094d-dba2-4ad9-874e-d422b69947e2",
+        "lineType": "Synonym",
+        "name": "Synonym",
+        "end1": end1,
+        "end2": end2
+        
+    }
+    response=issuePost(createSynonymURL, createSynonymBody)
+    if response == 200:
+        print("Synonym Created")
+        return
+    else:
+        print("No Synonym created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    
+# Create a valid value relationship between the valid value for and the valid value glossary terms.   
+def createValidValue(serverName, serverPlatformName, serverPlatformURL, userId, validValueForGuid, validValuesGuid):
+    subjectAreaURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/subject-area/users/' + userId
+    createValidValueURL = subjectAreaURL + '/relationships/valid-values'
+
+    end1 = {
+        "class": "LineEnd",
+        "nodeGuid" : validValueForGuid,
+        "nodeType": "Term",
+        "name":"validValueFor"
+    }
+    end2 = {
+        "class": "LineEnd",
+        "nodeGuid" : validValuesGuid,
+        "nodeType": "Term",
+        "name":"validValues"
+    }
+    createValidValuesBody = {
+        "class" : "ValidValue",
+        "typeDefGuid": "707a156b-e579-4482-89a5-de5889da1971",
+        "lineType": "ValidValue",
+        "name": "ValidValue",
+        "end1": end1,
+        "end2": end2   
+    }
+
+    response=issuePost(createValidValueURL, createValidValuesBody)
+    result = getResponseEnvelope(response).get('result')
+    createdValidValue = result[0]
+    if createdValidValue:
+        return createdValidValue
+    else:
+        print("No ValidValue relationship created")
+        processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response) 
+        
+#
+# Bulk loading glossary terms from a CSV file.  loadGlossaryTermsFromCSVFile reads the file once, as a stream, and
+# creates the terms on the worker pool with no more than maxInFlight create requests outstanding at a time.  A create
+# that fails because the platform could not be reached or returned a server side error is retried up to maxRetries
+# times, waiting about backoffSeconds and then backing off as waitUntil does; other failures, such as invalid
+# properties, are not retried.
+# The number of each row whose term has been created is appended to a checkpoint file, so a load that is interrupted
+# can simply be run again - the rows already loaded are skipped.  Progress is reported in terms per second.
+#
+# createTermFromRow(row) creates the term for one row of the file (a dictionary of column name to value) and returns
+# the created term or its GUID, or None if the create failed.  getSubjectAreaTermCreator and
+# getAssetManagerTermCreator return row functions that call createTerm and createTermWithAssetManager.
+#
+# The checkpoint file defaults to the CSV file name followed by the glossary GUID and ".checkpoint".  Delete it to
+# load the same file into the same glossary a second time.  Bear in mind that a create that timed out may still have
+# been made by the server, so a retry can occasionally create a term twice.
+#
+
+
+def getCSVColumnValue(row, columnHeader):
+    if columnHeader:
+        value = row.get(columnHeader)
+        if value != None:
+            return value
+    return ""
+
+def getSubjectAreaTermCreator(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, nameColumnHeader, descriptionColumnHeader, exampleColumnHeader):
+    def createTermFromRow(row):
+        createdTerm = createTerm(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID,
+                                 getCSVColumnValue(row, nameColumnHeader),
+                                 getCSVColumnValue(row, descriptionColumnHeader),
+                                 getCSVColumnValue(row, exampleColumnHeader))
+        if (rest.isDebug):
+            printTermSummary(createdTerm)
+        return createdTerm
+    return createTermFromRow
+
+def readTermCheckpoint(checkpointFileName):
+    loadedRows = set()
+    try:
+        with open(checkpointFileName) as checkpointFile:
+            for line in checkpointFile:
+                rowNumber = line.split(',')[0].strip()
+                if rowNumber.isdigit():
+                    loadedRows.add(int(rowNumber))
+    except FileNotFoundError:
+        pass
+    return loadedRows
+
+def createTermWithRetry(createTermFromRow, row, maxRetries, backoffSeconds):
+    attempt = 0
+    interval = backoffSeconds
+    while True:
+        try:
+            createdTerm = createTermFromRow(row)
+            if createdTerm:
+                return createdTerm
+        except Exception as error:
+            print("Exception: %s" % error)
+        # The row function runs on this thread, so its last call is the one that failed
+        if attempt >= maxRetries or not isTransientRestFailure(getLastRestResponse()):
+            return None
+        time.sleep(getJitteredInterval(interval))
+        interval = getNextWaitInterval(interval)
+        attempt = attempt + 1
+
+def getCreatedTermGUID(createdTerm):
+    if isinstance(createdTerm, str):
+        return createdTerm
+    if isinstance(createdTerm, dict):
+        systemAttributes = createdTerm.get('systemAttributes')
+        if systemAttributes:
+            return systemAttributes.get('guid')
+    return ""
+
+def loadGlossaryTermsFromCSVFile(fileName, glossaryGUID, nameColumnHeader, createTermFromRow, checkpointFileName=None, maxInFlight=8, maxRetries=3, backoffSeconds=1, progressInterval=1000):
+    if checkpointFileName == None:
+        checkpointFileName = fileName + '.' + glossaryGUID + '.checkpoint'
+    loadedRows = readTermCheckpoint(checkpointFileName)
+    if loadedRows:
+        print("Resuming load of " + fileName + ": " + str(len(loadedRows)) + " terms already loaded")
+
+    termCount = 0
+    skippedCount = 0
+    failedRows = []
+    inFlight = {}
+    startTime = time.perf_counter()
+
+    def processCompletedCreates(returnWhen):
+        nonlocal termCount
+        done, notDone = wait(inFlight, return_when=returnWhen)
+        for future in done:
+            rowNumber, name = inFlight.pop(future)
+            createdTerm = future.result()
+            if createdTerm:
+                checkpointFile.write(str(rowNumber) + ',' + getCreatedTermGUID(createdTerm) + '\n')
+                termCount = termCount + 1
+                if termCount % progressInterval == 0:
+                    elapsedTime = time.perf_counter() - startTime
+                    print("Created " + str(termCount) + " terms (" + "{:.1f}".format(termCount / elapsedTime) + " terms/sec)")
+            else:
+                print("Unable to create term " + name + " from row " + str(rowNumber))
+                failedRows.append(rowNumber)
+        checkpointFile.flush()
+
+    try:
+        with open(fileName, newline='', encoding='utf-8-sig') as csvfile, open(checkpointFileName, 'a') as checkpointFile:
+            dictionary = csv.DictReader(csvfile)
+            if dictionary.fieldnames == None or nameColumnHeader not in dictionary.fieldnames:
+                print("Expected Name column " + nameColumnHeader + " does not exist in the file, so we cannot process the file")
+                return None
+            try:
+                for rowNumber, row in enumerate(dictionary, start=1):
+                    if rowNumber in loadedRows:
+                        skippedCount = skippedCount + 1
+                        continue
+                    if (rest.isDebug):
+                        print(row)
+                    name = row.get(nameColumnHeader)
+                    if (name == None or name == ''):
+                        print("Found a Row without a name - so ignoring.")
+                        continue
+                    if len(inFlight) >= maxInFlight:
+                        processCompletedCreates(FIRST_COMPLETED)
+                    future = submitToWorker(createTermWithRetry, createTermFromRow, row, maxRetries, backoffSeconds)
+                    inFlight[future] = (rowNumber, name)
+            finally:
+                # Record the terms that are already being created, even when the load is interrupted.
+                if inFlight:
+                    processCompletedCreates(ALL_COMPLETED)
+    except EnvironmentError: # parent of IOError, OSError *and* WindowsError where available
+        print("Error opening File " + fileName)
+        return None
+
+    elapsedTime = time.perf_counter() - startTime
+    if (termCount > 0):
+        print("Created " + str(termCount) + " terms in " + "{:.1f}".format(elapsedTime) + " seconds (" + "{:.1f}".format(termCount / elapsedTime) + " terms/sec)")
+    else:
+        print("No terms created")
+    if skippedCount > 0:
+        print("Skipped " + str(skippedCount) + " terms loaded by an earlier run")
+    if failedRows:
+        print(str(len(failedRows)) + " terms could not be created - run the load again to retry them")
+    return {"created" : termCount, "skipped" : skippedCount, "failedRows" : failedRows, "elapsedTime" : elapsedTime}
+
+# This function takes a glossary guid, and a file name. The file name should be a csv file that contains contain columns with names nameColumnHeader, descriptionColumnHeader, exampleColumn.
+# - the fileName on the Mac platform that works is of the form /.../.../zzz.csv. The file needs to exist. The Python read might be sensitive to different file encodings.  
+# - nameColumnHeader is the column for that will be used for the Glossary Term Name,
+# - descriptionColumnHeader is the column for that will be used for the Glossary Term Description,
+# - exampleColumn  is the column for that will be used for the Glossary Term Example
+# 
+# Note that  the qualifiedName for each term is not specified so it is generated by the Subject Area OMAS. 
+
+def createSimpleTermsFromCSVFile(serverName, serverPlatformName, serverPlatformURL, userId, fileName, glossaryGUID, nameColumnHeader, descriptionColumnHeader, exampleColumnHeader):
+    createTermFromRow = getSubjectAreaTermCreator(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID,
+                                                  nameColumnHeader, descriptionColumnHeader, exampleColumnHeader)
+    return loadGlossaryTermsFromCSVFile(fileName, glossaryGUID, nameColumnHeader, createTermFromRow)
+
+#
+# Issue requests to the Asset Manager OMAS
+#
+
+def displayTermSummary(displayName, description):
+    nameWidth=40
+    descriptionWidth=80
+    if description:
+        descriptionLength = len(description)
+    else:
+        description = ""
+        descriptionLength = 0
+    if descriptionLength <= descriptionWidth:
+        print('{0: <{1}}'.format(displayName, nameWidth) + ": "  + '{0: <{1}}'.format(description, descriptionWidth))
+    else:
+        textPointer = 0
+        print('{0: <{1}}'.format(displayName, nameWidth) + ": "  + description[textPointer:textPointer + descriptionWidth])
+        textPointer = textPointer + descriptionWidth
+        while textPointer < descriptionLength:
+            print('{0: <{1}}'.format(" ", nameWidth) + ": "  + description[textPointer:textPointer + descriptionWidth])
+            textPointer = textPointer + descriptionWidth
+
+def displayDescription(description):
+    descriptionWidth=80
+    if description:
+        descriptionLength = len(description)
+    else:
+        description = ""
+        descriptionLength = 0
+    if descriptionLength <= descriptionWidth:
+        return description
+    else:
+        textPointer = 0
+        return description[textPointer:textPointer + descriptionWidth] + " ... "
+
+
+def printTermSummaries(terms):
+    if terms:
+        for x in range(len(terms)):
+            term = terms[x]
+            name = ""
+            description = ""
+            if term:
+                properties = term.get('glossaryTermProperties')
+                if properties:
+                    name = properties.get('displayName')
+                    description = properties.get('description')
+                displayTermSummary(name, description)
+
+
+def printElementHeader(indent, elementHeader):
+    if elementHeader:
+        guid = elementHeader.get('guid')
+        if guid:
+            print(indent + "    guid:                         " + guid)
+        elementType = elementHeader.get('type')
+        if elementType:
+            typeName = elementType.get('typeName')
+            if typeName:
+                print(indent + "    typeName:                     " + typeName)
+        elementStatus = elementHeader.get('status')
+        if elementStatus:
+            print(indent + "    status:                       " + elementStatus)
+        versions = elementHeader.get('versions')
+        if versions:
+            version = versions.get('version')
+            if version:
+                print(indent + "    version:                      " + str(version))
+            createdBy = versions.get('createdBy')
+            if createdBy:
+                print(indent + "    createdBy:                    " + createdBy)
+            updatedBy = versions.get('updatedBy')
+            if updatedBy:
+                print(indent + "    updatedBy:                    " + updatedBy)
+            updateTime = versions.get('updateTime')
+            if updateTime:
+                print(indent + "    updatedTime:                  " + str(updateTime))
+
+
+def printGlossaryElement(indent, glossary):
+    if glossary:
+        print(indent + "glossary: ")
+        elementHeader = glossary.get('elementHeader')
+        if elementHeader:
+            printElementHeader(indent, elementHeader)
+        properties = glossary.get('glossaryProperties')
+        if properties:
+            qualifiedName = properties.get('qualifiedName')
+            if qualifiedName:
+                print(indent + "       qualifiedName:                " + qualifiedName)
+            displayName = properties.get('displayName')
+            if displayName:
+                print(indent + "       displayName:                  " + displayName)
+            description = properties.get('description')
+            if description:
+                print(indent + "       description:                  " + displayDescription(description))
+            language = properties.get('language')
+            if language:
+                print(indent + "       language:                     " + language)
+            usage = properties.get('usage')
+            if usage:
+                print(indent + "       usage:                        " + usage)
+
+def printGlossaryElements(indent, glossaries):
+    if glossaries:
+        print(indent + "glossaries:")
+        subIndent = indent + "   "
+        for x in range(len(glossaries)):
+            printGlossaryElement(subIndent, glossaries[x])
+
+def printCategoryElement(indent, category):
+    if category:
+        print(indent + "category: ")
+        elementHeader = category.get('elementHeader')
+        if elementHeader:
+            printElementHeader(indent, elementHeader)
+        properties = category.get('glossaryCategoryProperties')
+        if properties:
+            qualifiedName = properties.get('qualifiedName')
+            if qualifiedName:
+                print(indent + "       qualifiedName:                " + qualifiedName)
+            displayName = properties.get('displayName')
+            if displayName:
+                print(indent + "       displayName:                  " + displayName)
+            description = properties.get('description')
+            if description:
+                print(indent + "       description:                  " + description)
+
+def printCategoryElements(indent, categories):
+    if categories:
+        print(indent + "categories:")
+        subIndent = indent + "   "
+        for x in range(len(categories)):
+            printCategoryElement(subIndent, categories[x])
+
+def printCategoryHierarchy(whitespace, serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID):
+    categoryTree = loadCategoryTree(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUIDs=[categoryGUID])
+    printCategoryTree(whitespace, categoryTree)
+
+#
+# Loading a category tree.  loadCategoryTree retrieves a whole glossary's category hierarchy (or the hierarchy below
+# the categories in categoryGUIDs) one level at a time, with the subcategories - and, if includeTerms is set, the
+# terms - of every category in a level retrieved concurrently on the shared worker pool, or one after another when
+# loadCategoryTree is itself running on the pool, for example under runAsync (see mapOnWorkers).  Each category is
+# retrieved once.  The tree is a dictionary:
+#     categories - the category elements by GUID
+#     subcategories - the GUIDs of each category's subcategories, by GUID
+#     terms - the term elements linked to each category, by GUID (when includeTerms is set)
+#     topLevelCategories - the GUIDs of the categories at the top of the tree
+#
+def getCategoriesForGlossary(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, pageSize=None, compact=False):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestBody = {
+        "class" : "EffectiveTimeQueryRequestBody"
+    }
+
+    def retrievePage(startFrom, pageSize):
+        requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/categories/retrieve?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize)
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList') or []
+        printResponse(response)
+        return None
+
+    try:
+        categories = iteratePages(retrievePage, 0, pageSize)
+        if compact:
+            categories = toElementRecords(categories, GlossaryCategoryElement)
+        return list(categories)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def loadCategoryTree(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID=None, categoryGUIDs=None, includeTerms=False):
+    categoryTree = {
+        "categories" : {},
+        "subcategories" : {},
+        "terms" : {},
+        "topLevelCategories" : []
+    }
+    categories = categoryTree["categories"]
+    subcategories = categoryTree["subcategories"]
+
+    if glossaryGUID:
+        level = getCategoriesForGlossary(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID) or []
+    else:
+        level = mapOnWorkers(lambda categoryGUID: getGlossaryCategoryByGUID(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID), categoryGUIDs or [])
+    level = [category for category in level if category and getElementGUID(category.get('elementHeader'))]
+    for category in level:
+        categories[getElementGUID(category.get('elementHeader'))] = category
+
+    def retrieveCategoryContents(categoryGUID):
+        categorySubcategories = getSubcategories(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID)
+        categoryTerms = None
+        if includeTerms:
+            categoryTerms = getTermsForGlossaryCategory(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID)
+        return categorySubcategories or [], categoryTerms or []
+
+    while level:
+        levelGUIDs = [getElementGUID(category.get('elementHeader')) for category in level]
+        nextLevel = []
+        for categoryGUID, (categorySubcategories, categoryTerms) in zip(levelGUIDs, mapOnWorkers(retrieveCategoryContents, levelGUIDs)):
+            subcategories[categoryGUID] = []
+            if includeTerms:
+                categoryTree["terms"][categoryGUID] = categoryTerms
+            for subcategory in categorySubcategories:
+                subcategoryGUID = getElementGUID(subcategory.get('elementHeader'))
+                if subcategoryGUID:
+                    subcategories[categoryGUID].append(subcategoryGUID)
+                    if subcategoryGUID not in categories:
+                        categories[subcategoryGUID] = subcategory
+                        nextLevel.append(subcategory)
+        level = nextLevel
+
+    # Categories listed for a glossary come back in no particular order, so the top of the tree is every category
+    # that is not a subcategory of another.
+    childGUIDs = set(childGUID for categoryChildren in subcategories.values() for childGUID in categoryChildren)
+    if glossaryGUID:
+        categoryTree["topLevelCategories"] = [categoryGUID for categoryGUID in categories if categoryGUID not in childGUIDs]
+    else:
+        categoryTree["topLevelCategories"] = [categoryGUID for categoryGUID in categoryGUIDs or [] if categoryGUID in categories]
+    return categoryTree
+
+def getCategoryDisplayName(category):
+    properties = category.get('glossaryCategoryProperties')
+    if properties:
+        return properties.get('displayName')
+
+def printCategoryTree(whitespace, categoryTree, printTerms=False):
+    indent = "    "
+    arrow = "--> "
+    printed = set()
+    pending = [(whitespace, categoryGUID) for categoryGUID in reversed(categoryTree["topLevelCategories"])]
+    while pending:
+        categoryWhitespace, categoryGUID = pending.pop()
+        if categoryGUID in printed:
+            continue
+        printed.add(categoryGUID)
+        displayName = getCategoryDisplayName(categoryTree["categories"][categoryGUID])
+        if displayName:
+            print (categoryWhitespace + arrow + displayName)
+            if printTerms:
+                for term in categoryTree["terms"].get(categoryGUID, []):
+                    termProperties = term.get('glossaryTermProperties')
+                    if termProperties:
+                        print (categoryWhitespace + indent + "* " + str(termProperties.get('displayName')))
+            for subcategoryGUID in reversed(categoryTree["subcategories"].get(categoryGUID, [])):
+                pending.append((categoryWhitespace + indent, subcategoryGUID))
+
+# Returns the tree as nested dictionaries, for example to save it with json.dump.
+def exportCategoryTree(categoryTree):
+    def exportCategory(categoryGUID, ancestors):
+        category = categoryTree["categories"][categoryGUID]
+        properties = category.get('glossaryCategoryProperties') or {}
+        exported = {
+            "guid" : categoryGUID,
+            "qualifiedName" : properties.get('qualifiedName'),
+            "displayName" : properties.get('displayName'),
+            "description" : properties.get('description')
+        }
+        if categoryGUID in categoryTree["terms"]:
+            exported["terms"] = [
+                {
+                    "guid" : getElementGUID(term.get('elementHeader')),
+                    "displayName" : (term.get('glossaryTermProperties') or {}).get('displayName')
+                } for term in categoryTree["terms"][categoryGUID]]
+        exported["subcategories"] = [exportCategory(subcategoryGUID, ancestors | {categoryGUID})
+                                     for subcategoryGUID in categoryTree["subcategories"].get(categoryGUID, [])
+                                     if subcategoryGUID not in ancestors and subcategoryGUID != categoryGUID]
+        return exported
+    return [exportCategory(categoryGUID, set()) for categoryGUID in categoryTree["topLevelCategories"]]
+
+def printTermElement(indent, term):
+    if term:
+        print(indent + "term: ")
+        elementHeader = term.get('elementHeader')
+        if elementHeader:
+            printElementHeader(indent, elementHeader)
+        properties = term.get('glossaryTermProperties')
+        if properties:
+            qualifiedName = properties.get('qualifiedName')
+            if qualifiedName:
+                print(indent + "       qualifiedName:                " + qualifiedName)
+            displayName = properties.get('displayName')
+            if displayName:
+                print(indent + "       displayName:                  " + displayName)
+            publishVersionIdentifier = properties.get('publishVersionIdentifier')
+            if publishVersionIdentifier:
+                print(indent + "       publishVersionIdentifier:     " + publishVersionIdentifier)
+            summary = properties.get('summary')
+            if summary:
+                print(indent + "       summary:                      " + summary)
+            description = properties.get('description')
+            if description:
+                print(indent + "       description:                  " + description)
+            examples = properties.get('examples')
+            if examples:
+                print(indent + "       examples:                     " + examples)
+            abbreviation = properties.get('abbreviation')
+            if abbreviation:
+                print(indent + "       abbreviation:                 " + abbreviation)
+            usage = properties.get('usage')
+            if usage:
+                print(indent + "       usage:                        " + usage)
+
+def printTermElements(indent, terms):
+    if terms:
+        print(indent + "terms:")
+        subIndent = indent + "   "
+        for x in range(len(terms)):
+            printTermElement(subIndent, terms[x])
+
+def printTermsForCategories(serverName, serverPlatformName, serverPlatformURL, userId, categoryName, glossaryGUID):
+    categories = getGlossaryCategoriesByName(serverName, serverPlatformName, serverPlatformURL, userId, categoryName, glossaryGUID)
+    if categories:
+        categoryGUIDs = [getElementGUID(category.get('elementHeader')) for category in categories]
+        categoryTerms = mapOnWorkers(lambda categoryGUID: getTermsForGlossaryCategory(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID) if categoryGUID else None, categoryGUIDs)
+        for category, terms in zip(categories, categoryTerms):
+            print("-------------------------------------------------------------------------------------------")
+            printCategoryElement("", category)
+            elementHeader = category.get('elementHeader')
+            if elementHeader:
+                print(" ")
+                if terms:
+                    print("Terms for category: ")
+                    print("-------------------------------------------------------------------------------------------")
+                    printTermSummaries(terms)
+    else:
+        print("No categories")
+    print("-------------------------------------------------------------------------------------------")
+
+
+def printRevisionHistoryWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    noteLogs = getAttachedNoteLogsWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID)
+    if noteLogs:
+        for x in range(len(noteLogs)):
+            printNoteLogSummary("", noteLogs[x])
+            elementHeader = noteLogs[x].get('elementHeader')
+            if elementHeader:
+                noteLogGUID = elementHeader.get('guid')
+                if noteLogGUID:
+                    notes = getNotesForNoteLogWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, noteLogGUID)
+                    if notes:
+                        printNotesForNoteLog("   ", notes)
+                    else:
+                        print("    Empty note log")
+                else:
+                    print("Element header is unexpected: " + elementHeader)
+            else:
+                print("Element header is missing from note log: " + noteLogs[x])
+    else:
+        print("No note logs attached ...")
+## fixed
+def printNoteLogSummary(indent, noteLog):
+    elementHeader = noteLog.get('elementHeader')
+    if elementHeader:
+        noteLogGUID = elementHeader.get('guid')
+        properties = noteLog.get('properties')
+        if properties:
+            qualifiedName = properties.get('qualifiedName')
+            print(indent + qualifiedName + " (guid: " + noteLogGUID)
+        else:
+            print("Properties are missing from note log: " + noteLog)
+    else:
+        print("Element header is missing from note log: " + noteLog)
+
+
+def printNotesForNoteLog(indent, notes):
+    if notes:
+        for x in range(len(notes)):
+            printNoteForNoteLog(indent + "   ", notes[x])
+## updated
+def printNoteForNoteLog(indent, note):
+    elementHeader = note.get('elementHeader')
+    if elementHeader:
+        noteGUID = elementHeader.get('guid')
+        properties = note.get('properties')
+        if properties:
+            title = properties.get('title')
+            if title:
+                print(indent + title + " (guid: " + noteGUID + ")")
+            else:
+                print(indent + "guid: " + noteGUID)
+            print(indent + "   text: " + properties.get('text'))
+        else:
+            print("Element header is missing from note: " + note)
+
+
+def getGlossariesByName(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/by-name?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "NameRequestBody",
+        "name" : name
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList')
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def getGlossaryByGUID(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID):
+    def retrieveElement():
+        assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+        requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/retrieve'
+        requestBody = {
+            "class" : "EffectiveTimeQueryRequestBody"
+        }
+        try:
+            response = issuePost(requestURL, requestBody)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    return getResponseEnvelope(response).get('element')
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+    return getCachedElement(serverName, serverPlatformURL, userId, "Glossary", glossaryGUID, retrieveElement)
+
+def getGUIDFromGlossary(serverName, serverPlatformName, serverPlatformURL, userId, name):
+    glossaries = getGlossariesByName(serverName, serverPlatformName, serverPlatformURL, userId, name)
+    if glossaries:
+        if len(glossaries) > 0:
+            glossary = glossaries[0]
+            if glossary:
+                elementHeader = glossary.get('elementHeader')
+                if elementHeader:
+                    return elementHeader.get('guid')
+                else:
+                    print("Bad element")
+            else:
+                print("Bad list")
+        else:
+            print(str("No glossaries returned, glossary not loaded"))
+
+## updated
+def getTopLevelCategory(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID):
+    getGlossaryMoreInfoURLRoot = serverPlatformURL + '/servers/' + serverName + '/open-metadata/framework-services/asset-consumer/connected-asset/users/' +  erinsUserId + '/referenceables/'
+    getGlossaryMoreInfoURLTail = '/more-information?elementStart=0&maxElements=50'
+    response = issueGet(getGlossaryMoreInfoURLRoot + glossaryGUID + getGlossaryMoreInfoURLTail)
+    if response.status_code == 200:
+        moreDetailList = getResponseEnvelope(response).get('list')
+        if moreDetailList:
+            return moreDetailList[0].get('guid')
+
+def getGlossaryCategoriesByName(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/categories/by-name?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "GlossaryNameRequestBody",
+        "name" : name,
+        "glossaryGUID" : glossaryGUID
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList')
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def getGlossaryCategoryByGUID(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID):
+    def retrieveElement():
+        assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+        requestURL = assetManagerURL + '/glossaries/categories/' + categoryGUID + '/retrieve'
+        requestBody = {
+            "class" : "EffectiveTimeQueryRequestBody"
+        }
+        try:
+            response = issuePost(requestURL, requestBody)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    return getResponseEnvelope(response).get('element')
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+    return getCachedElement(serverName, serverPlatformURL, userId, "GlossaryCategory", categoryGUID, retrieveElement)
+
+def getSubcategories(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/categories/' + categoryGUID + '/subcategories/retrieve?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "EffectiveTimeQueryRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList')
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def getGlossaryTermsByName(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID, limitResultsByStatus):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/by-name?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "GlossaryNameRequestBody",
+        "name" : name,
+        "glossaryGUID" : glossaryGUID,
+        "limitResultsByStatus" : limitResultsByStatus
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList')
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+# With stream set, an iterator over the terms is returned and each term is decoded as it is read from the connection
+# (see streamResponseElements), which keeps memory use flat when pageSize is 0 and there are a great many terms.
+def findGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom=0, pageSize=0, stream=False):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/by-search-string?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize)
+    requestBody = {
+        "class" : "GlossarySearchStringRequestBody",
+        "searchString" : searchString,
+        "glossaryGUID" : glossaryGUID,
+        "limitResultsByStatus" : limitResultsByStatus
+    }
+    try:
+        if stream:
+            return streamResponseElements(serverName, serverPlatformName, serverPlatformURL, issueStreamingPost(requestURL, requestBody), 'elementList')
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                return getResponseEnvelope(response).get('elementList')
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+# With compact set, the terms are returned as GlossaryTermElement records (see coco_lab.elements).  With stream set, each
+# page is decoded as it is read from the connection (see streamResponseElements).
+def findGlossaryTermsAll(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom=0, pageSize=600, compact=False, stream=False):
+    terms = iterateGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom, pageSize, stream=stream)
+    if compact:
+        terms = toElementRecords(terms, GlossaryTermElement)
+    return list(terms)
+
+def iterateGlossaries(serverName, serverPlatformName, serverPlatformURL, userId, searchString, startFrom=0, pageSize=None, prefetch=False, stream=False):
+    requestBody = {
+        "class" : "SearchStringRequestBody",
+        "searchString" : searchString
+    }
+    return iterateAssetManagerSearch(serverName, serverPlatformName, serverPlatformURL, userId, '/glossaries/by-search-string', requestBody, startFrom, pageSize, prefetch, stream)
+
+def iterateGlossaryCategories(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, startFrom=0, pageSize=None, prefetch=False, stream=False):
+    requestBody = {
+        "class" : "GlossarySearchStringRequestBody",
+        "searchString" : searchString,
+        "glossaryGUID" : glossaryGUID
+    }
+    return iterateAssetManagerSearch(serverName, serverPlatformName, serverPlatformURL, userId, '/glossaries/categories/by-search-string', requestBody, startFrom, pageSize, prefetch, stream)
+
+def iterateGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus, startFrom=0, pageSize=None, prefetch=False, stream=False):
+    requestBody = {
+        "class" : "GlossarySearchStringRequestBody",
+        "searchString" : searchString,
+        "glossaryGUID" : glossaryGUID,
+        "limitResultsByStatus" : limitResultsByStatus
+    }
+    return iterateAssetManagerSearch(serverName, serverPlatformName, serverPlatformURL, userId, '/glossaries/terms/by-search-string', requestBody, startFrom, pageSize, prefetch, stream)
+
+
+def getGlossaryTermByGUID(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    def retrieveElement():
+        assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+        requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/retrieve'
+        requestBody = {
+            "class" : "EffectiveTimeQueryRequestBody"
+        }
+        try:
+            response = issuePost(requestURL, requestBody)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    return getResponseEnvelope(response).get('element')
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+    return getCachedElement(serverName, serverPlatformURL, userId, "GlossaryTerm", termGUID, retrieveElement)
+
+def getGUIDFromGlossaryTerm(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID, limitResultsByStatus):
+    terms = getGlossaryTermsByName(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID, limitResultsByStatus)
+    if terms:
+        if len(terms) == 1:
+            term = terms[0]
+            if term:
+                elementHeader = term.get('elementHeader')
+                if elementHeader:
+                    return elementHeader.get('guid')
+                else:
+                    print("Bad element")
+            else:
+                print("Bad list")
+        else:
+            print(str(len(terms)) + " terms returned, choose a different term or narrow the search")
+    else:
+        print("No terms exactly matching: " + name)
+
+def getTermsForGlossaryCategory(serverName, serverPlatformName, serverPlatformURL, userId, glossaryCategoryGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/categories/' + glossaryCategoryGUID + '/terms/retrieve?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "EffectiveTimeQueryRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                terms = getResponseEnvelope(response).get('elementList')
+                if terms:
+                    return terms
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def getTermHistory(serverName, serverPlatformName, serverPlatformURL, userId, glossaryTermGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + glossaryTermGUID + '/history?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "HistoryRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                terms = getResponseEnvelope(response).get('elementList')
+                if terms:
+                    return terms
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def searchForGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus):
+    terms = findGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, searchString, glossaryGUID, limitResultsByStatus)
+    if terms:
+        print("Results found for search string: " + searchString)
+        print("-------------------------------------------------------------------------------------------")
+        printTermSummaries(terms)
+        #printTermElements("", terms)
+    else:
+        print("No results found for search string: " + searchString)
+
+
+def getGlossaryTerms(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID, limitResultsByStatus):
+    terms = getGlossaryTermsByName(serverName, serverPlatformName, serverPlatformURL, userId, name, glossaryGUID, limitResultsByStatus)
+    if terms:
+        print("Terms exactly matching: " + name)
+        print("-------------------------------------------------------------------------------------------")
+        printTermSummaries(terms)
+        #printTermElements("", terms)
+    else:
+        print("No terms exactly matching: " + name)
+
+# Create a glossary with a display name and description
+def createGlossaryWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, displayName, description):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries'
+    requestBody = {
+        "class" : "ReferenceableRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryProperties",
+            "qualifiedName" : "Glossary:" + displayName + ": " + str(time.time()),
+            "displayName" : displayName,
+            "description" : description,
+            "language" : "English",
+            "usage" : "Education"},
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                glossaryGUID = getResponseEnvelope(response).get('guid')
+                if glossaryGUID:
+                    return glossaryGUID
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+
+def addSecurityTagsToGlossary(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID,
+                              securityLabels, securityProperties, accessGroups):
+
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/elements/' + glossaryGUID + '/security-tags'
+    requestBody = {
+        "class" : "ClassificationRequestBody",
+        "properties" : {
+            "class" : "SecurityTagsProperties",
+            "securityLabels" : securityLabels,
+            "securityProperties" : securityProperties,
+            "accessGroups" : accessGroups
+        }
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(glossaryGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                print("Security tags set ...")
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+
+def createCategoryWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, displayName, description):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/categories'
+    requestBody = {
+        "class" : "ReferenceableUpdateRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryCategoryProperties",
+            "qualifiedName" : "GlossaryCategory:" + displayName + ": " + str(time.time()),
+            "displayName" : displayName,
+            "description" : description
+        },
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                glossaryCategoryGUID = getResponseEnvelope(response).get('guid')
+                if glossaryCategoryGUID:
+                    return glossaryCategoryGUID
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def createTermWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, typeName, displayName, summary, description, examples, abbreviation, usage, updateDescription=None):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/terms'
+    requestBody = {
+        "class" : "ReferenceableUpdateRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryTermProperties",
+            "typeName" : typeName,
+            "qualifiedName" : typeName + ":" + displayName + ": " + str(time.time()),
+            "displayName" : displayName,
+            "summary" : summary,
+            "description" : description,
+            "examples" : examples,
+            "abbreviation" : abbreviation,
+            "usage" : usage
+        },
+        "updateDescription" : updateDescription
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                glossaryTermGUID = getResponseEnvelope(response).get('guid')
+                if glossaryTermGUID:
+                    return glossaryTermGUID
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+# Return a row function for loadGlossaryTermsFromCSVFile that creates each term with createTermWithAssetManager.
+# Leave a column header as None if the file has no such column.
+def getAssetManagerTermCreator(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, nameColumnHeader, summaryColumnHeader=None, descriptionColumnHeader=None, examplesColumnHeader=None, abbreviationColumnHeader=None, usageColumnHeader=None, typeName="GlossaryTerm"):
+    def createTermFromRow(row):
+        return createTermWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, typeName,
+                                          getCSVColumnValue(row, nameColumnHeader),
+                                          getCSVColumnValue(row, summaryColumnHeader),
+                                          getCSVColumnValue(row, descriptionColumnHeader),
+                                          getCSVColumnValue(row, examplesColumnHeader),
+                                          getCSVColumnValue(row, abbreviationColumnHeader),
+                                          getCSVColumnValue(row, usageColumnHeader))
+    return createTermFromRow
+
+def createControlledTermWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, typeName, displayName, summary, description, examples, abbreviation, usage, updateDescription=None):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/terms/new-controlled'
+    requestBody = {
+        "class" : "ControlledGlossaryTermRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryTermProperties",
+            "typeName" : typeName,
+            "qualifiedName" : typeName + ":" + displayName + ": " + str(time.time()),
+            "displayName" : displayName,
+            "summary" : summary,
+            "description" : description,
+            "examples" : examples,
+            "abbreviation" : abbreviation,
+            "usage" : usage
+        },
+        "initialStatus" : "DRAFT",
+        "updateDescription" : updateDescription
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                glossaryTermGUID = getResponseEnvelope(response).get('guid')
+                if glossaryTermGUID:
+                    return glossaryTermGUID
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+        
+def updateTermWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID, displayName, summary, description, examples, abbreviation, usage, updateDescription=None):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/update?isMergeUpdate=true'
+    requestBody = {
+        "class" : "ReferenceableUpdateRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryTermProperties",
+            "displayName" : displayName,
+            "summary" : summary,
+            "description" : description,
+            "examples" : examples,
+            "abbreviation" : abbreviation,
+            "usage" : usage
+        },
+        "updateDescription" : updateDescription
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def updateTermVersionWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID, publishVersionIdentifier):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/update?isMergeUpdate=true'
+    requestBody = {
+        "class" : "ReferenceUpdateRequestBody",
+        "elementProperties" : {
+            "class" : "GlossaryTermProperties",
+                "publishVersionIdentifier" : publishVersionIdentifier
+            }
+        }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def updateTermStatusWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID, status):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/status'
+    requestBody = {
+        "class" : "GlossaryTermStatusRequestBody",
+        "glossaryTermStatus" :  status
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def undoTermUpdateWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/undo'
+    requestBody = {
+        "class" : "UpdateRequestBody",
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def archiveTermWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/terms/' + termGUID + '/archive'
+    requestBody = {
+        "class" : "ArchiveRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def setupTermCategory(serverName, serverPlatformName, serverPlatformURL, userId, categoryGUID, termGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/categories/' + categoryGUID + '/terms/' + termGUID
+    requestBody = {
+        "class" : "RelationshipRequestBody",
+        "properties" : {
+            "class" : "GlossaryTermCategorization"
+            }
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(categoryGUID, termGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def deleteGlossary(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/glossaries/' + glossaryGUID + '/remove'
+    requestBody = {
+        "class" : "ReferenceableUpdateRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        invalidateCachedElements(glossaryGUID)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+
+
+def getAttachedNoteLogsWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, termGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/elements/' + termGUID + '/note-logs/retrieve?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "EffectiveTimeQueryRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+            else:
+                return getResponseEnvelope(response).get('elementList')
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+
+def getNotesForNoteLogWithAssetManager(serverName, serverPlatformName, serverPlatformURL, userId, noteLogGUID):
+    assetManagerURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/asset-manager/users/' + userId
+    requestURL = assetManagerURL + '/note-logs/' + noteLogGUID + '/notes/retrieve?startFrom=0&pageSize=0'
+    requestBody = {
+        "class" : "EffectiveTimeQueryRequestBody"
+    }
+    try:
+        response = issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printResponse(response)
+            else:
+                return getResponseEnvelope(response).get('elementList')
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
@@ -0,0 +1,1409 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Working with the engine hosts, governance engines, governance services and governance actions through the
+Governance Engine OMAS and the governance engine services.
+
+"""
+
+import json
+import threading
+import time
+
+from . import concurrency
+from .assets import getElementGUID, getElementType, printMapProperties
+from .concurrency import (defaultWaitTimeout, getJitteredInterval, getNextWaitInterval, getWaitTimeout, iteratePages,
+                          mapOnWorkers, waitUntil)
+from .elements import GovernanceActionElement, toElementRecords
+from .rest import (decodeJSON, getPlatformSession, getResponseEnvelope, issueDataPost, issueGet, issuePost, issueStreamingGet,
+                   printResponse, printUnexpectedResponse, streamResponseElements)
+from .topology import eventBusBootstrapServers
+
+
+# Open Governance and Discovery
+# Working with the engine host server and the Governance Engine OMAS of the metadata server.
+
+## Governance Action Open Metadata Engine Services (OMES) validation of a governance service connector
+
+def validateGovernanceActionEngineConnector(serverName, serverPlatformName, serverPlatformURL, userId, connectorProvider):
+    try:
+        engineServiceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-services/governance-action/users/' + userId 
+        getStatusURL = engineServiceURL + '/validate-connector/' + connectorProvider
+        response=issueGet(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                connectorReport = getResponseEnvelope(response).get('connectorReport')
+                if connectorReport:
+                    connectorType = connectorReport.get('connectorType')
+                    if connectorType:
+                        print("   connectorType: ")
+                        guid = connectorType.get('guid')
+                        if guid:
+                            print("       guid:                              " + guid)
+                        qualifiedName = connectorType.get('qualifiedName')
+                        if qualifiedName:
+                            print("       qualifiedName:                     " + qualifiedName)
+                        displayName = connectorType.get('displayName')
+                        if displayName:
+                            print("       displayName:                       " + displayName)
+                        description = connectorType.get('description')
+                        if description:
+                            print("       description:                       " + description)
+                        connectorProviderClassName = connectorType.get('connectorProviderClassName')
+                        if connectorProviderClassName:
+                            print("       connectorProviderClassName:        " + connectorProviderClassName)
+                        if connectorType.get('connectorInterfaceLanguage'):
+                            print ("    connectorInterfaceLanguage: " + connectorType.get('connectorInterfaceLanguage'))
+                        if connectorType.get('connectorFrameworkName'):
+                            print ("    connectorFrameworkName: " + connectorType.get('connectorFrameworkName'))
+                        connectorInterfaces = connectorType.get('connectorInterfaces')
+                        if connectorInterfaces:
+                            print ("    connectorInterfaces:")
+                            for x in range(len(connectorInterfaces)):
+                                print ("        " + connectorInterfaces[x])
+                        if connectorType.get('targetTechnologySource'):
+                            print ("    targetTechnologySource: " + connectorType.get('targetTechnologySource'))
+                        if connectorType.get('targetTechnologyName'):
+                            print ("    targetTechnologyName: " + connectorType.get('targetTechnologyName'))
+                        recognizedConfigurationProperties = connectorType.get('recognizedConfigurationProperties')
+                        if recognizedConfigurationProperties:
+                            print("       recognizedConfigurationProperties: ")
+                            for x in range(len(recognizedConfigurationProperties)):
+                                print("          - " + recognizedConfigurationProperties[x])
+                        supportedRequestTypes = connectorReport.get('supportedRequestTypes')
+                        if supportedRequestTypes:
+                            print("   supportedRequestTypes: ")
+                            for x in range(len(supportedRequestTypes)):
+                                print("      - " + supportedRequestTypes[x])
+                        supportedRequestParameters = connectorReport.get('supportedRequestParameters')
+                        if supportedRequestParameters:
+                            print("   supportedRequestParameters: ")
+                            for x in range(len(supportedRequestParameters)):
+                                print("      - " + supportedRequestParameters[x])
+                        supportedRequestSourceNames = connectorReport.get('supportedRequestSourceNames')
+                        if supportedRequestSourceNames:
+                            print("   supportedRequestSourceNames: ")
+                            for x in range(len(supportedRequestSourceNames)):
+                                print("      - " + supportedRequestSourceNames[x])
+                        supportedActionTargetNames = connectorReport.get('supportedActionTargetNames')
+                        if supportedActionTargetNames:
+                            print("   supportedActionTargetNames: ")
+                            for x in range(len(supportedActionTargetNames)):
+                                print("      - " + supportedActionTargetNames[x])
+                        supportedGuards = connectorReport.get('supportedGuards')
+                        if supportedGuards:
+                            print("   supportedGuards: ")
+                            for x in range(len(supportedGuards)):
+                                print("      - " + supportedGuards[x])
+                    else:
+                        printResponse(response)
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+        
+## Asset Analysis Open Metadata Engine Services (OMES) validation of a discovery service connector
+
+def validateAssetAnalysisEngineConnector(serverName, serverPlatformName, serverPlatformURL, userId, connectorProvider):
+    try:
+        engineServiceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-services/asset-analysis/users/' + userId 
+        getStatusURL = engineServiceURL + '/validate-connector/' + connectorProvider
+        response=issueGet(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                connectorReport = getResponseEnvelope(response).get('connectorReport')
+                if connectorReport:
+                    connectorType = connectorReport.get('connectorType')
+                    if connectorType:
+                        guid = connectorType.get('guid')
+                        if guid:
+                            print("   guid:                              " + guid)
+                        qualifiedName = connectorType.get('qualifiedName')
+                        if qualifiedName:
+                            print("   qualifiedName:                     " + qualifiedName)
+                        displayName = connectorType.get('displayName')
+                        if displayName:
+                            print("   displayName:                       " + displayName)
+                        description = connectorType.get('description')
+                        if description:
+                            print("   description:                       " + description)
+                        connectorProviderClassName = connectorType.get('connectorProviderClassName')
+                        if connectorProviderClassName:
+                            print("   connectorProviderClassName:        " + connectorProviderClassName)
+                        if connectorType.get('connectorInterfaceLanguage'):
+                            print ("    connectorInterfaceLanguage: " + connectorType.get('connectorInterfaceLanguage'))
+                        if connectorType.get('connectorFrameworkName'):
+                            print ("    connectorFrameworkName: " + connectorType.get('connectorFrameworkName'))
+                        connectorInterfaces = connectorType.get('connectorInterfaces')
+                        if connectorInterfaces:
+                            print ("    connectorInterfaces:")
+                            for x in range(len(connectorInterfaces)):
+                                print ("        " + connectorInterfaces[x])
+                        if connectorType.get('targetTechnologySource'):
+                            print ("    targetTechnologySource: " + connectorType.get('targetTechnologySource'))
+                        if connectorType.get('targetTechnologyName'):
+                            print ("    targetTechnologyName: " + connectorType.get('targetTechnologyName'))
+                        recognizedConfigurationProperties = connectorType.get('recognizedConfigurationProperties')
+                        if recognizedConfigurationProperties:
+                            print("")
+                            print("   recognizedConfigurationProperties: ")
+                            for x in range(len(recognizedConfigurationProperties)):
+                                print("      - " + recognizedConfigurationProperties[x])
+                    else:
+                        printResponse(response)
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+        
+
+# The configuration of governance engines and governance services is managed in an open metadata server
+# through the Governance Engine OMAS.  The functions below support the definition and retrieval of these capabilities.
+
+def getGovernanceEngineDefinitions(serverName, serverPlatformName, serverPlatformURL, userId):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+    getGovernanceEngineURL = configCommandURLRoot + '/governance-engines?startingFrom=0&maximumResults=0'
+    governanceEngineProperties = None
+    response = getPlatformSession(getGovernanceEngineURL).get(getGovernanceEngineURL)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            governanceEngines = getResponseEnvelope(response).get('elements')
+            if governanceEngines:
+                for x in range(len(governanceEngines)):
+                    governanceEngineGUID = printGovernanceEngineDefinition(governanceEngines[x])
+                    if governanceEngineGUID:
+                        getRegisteredGovernanceServices(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineGUID)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return governanceEngineProperties
+
+
+
+def printGovernanceEngineDefinition(governanceEngineElement):
+    governanceEngineGUID = None
+    governanceEngineHeader = governanceEngineElement.get('elementHeader')
+    if governanceEngineHeader:
+        governanceEngineTypeName = getElementType(governanceEngineHeader)
+        governanceEngineGUID = getElementGUID(governanceEngineHeader)
+    else:
+        governanceEngineTypeName = None
+    governanceEngineProperties = governanceEngineElement.get('properties')
+    governanceEngineName = governanceEngineProperties.get('qualifiedName')
+    if governanceEngineName:
+        print(" ")
+        print("  Governance Engine: " + governanceEngineName)
+        if governanceEngineTypeName:
+            print("     type:               " + governanceEngineTypeName)
+        displayName = governanceEngineProperties.get('displayName')
+        if displayName:
+            print("     display name:       " + displayName)
+        if governanceEngineHeader:
+            print("     guid:               " + governanceEngineGUID)
+        governanceEngineDescription = governanceEngineProperties.get('description')
+        if governanceEngineDescription:
+            print("     description:        " + governanceEngineDescription)
+        print("     requestTypes:")
+    return governanceEngineGUID
+        
+
+def getRegisteredGovernanceServices(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineGUID):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+    getGovernanceEngineURL = configCommandURLRoot + '/governance-engines/' + governanceEngineGUID + '/governance-services?startingFrom=0&maximumResults=0'
+    registeredServicesProperties = None
+    response = getPlatformSession(getGovernanceEngineURL).get(getGovernanceEngineURL)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            registeredServicesProperties = getResponseEnvelope(response).get('elements')
+            if registeredServicesProperties:
+                for x in range(len(registeredServicesProperties)):
+                    printRegisteredServicesProperties(registeredServicesProperties[x])
+            else:
+                print("            <none>")
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return registeredServicesProperties
+
+
+
+def printRegisteredServicesProperties(registeredServiceProperties):
+    governanceServiceHeader = registeredServiceProperties.get('elementHeader')
+
+    governanceServiceProperties   = registeredServiceProperties.get('properties')
+    if governanceServiceProperties:
+        governanceServiceDescription = governanceServiceProperties.get('description')
+        requestTypes = governanceServiceProperties.get('requestTypes')
+        if requestTypes:
+            printRequestTypes("            ", 'requestTypes', requestTypes, governanceServiceDescription)
+#### ?
+def printRequestTypes(indent, propertyName, requestTypes, governanceServiceDescription):
+    if requestTypes:
+        propertyList = list(requestTypes)
+        for x in range(len(propertyList)):
+            propertyValue = requestTypes.get(propertyList[x])
+            if propertyValue:
+                serviceRequestType = propertyValue.get('serviceRequestType')
+                if serviceRequestType:
+                    print(indent + propertyList[x] + " --> " + serviceRequestType + ":")
+                else:
+                    print(indent + propertyList[x] + ":")
+            else:
+                print(indent + propertyList[x] + ":" )
+            descriptionWidth=80
+            descriptionIndent = indent + "     "
+            if governanceServiceDescription:
+                description = governanceServiceDescription
+                descriptionLength = len(description)
+            else:
+                description = ""
+                descriptionLength = 0
+            if descriptionLength <= descriptionWidth:
+                print(descriptionIndent + description)
+            else:
+                textPointer = 0
+                print(descriptionIndent  + description[textPointer:textPointer + descriptionWidth])
+                textPointer = textPointer + descriptionWidth
+                while textPointer < descriptionLength:
+                    print(descriptionIndent + description[textPointer:textPointer + descriptionWidth])
+                    textPointer = textPointer + descriptionWidth
+
+    
+def getGovernanceServiceDefinitions(serverName, serverPlatformName, serverPlatformURL, userId):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+    getGovernanceServiceURL = configCommandURLRoot + '/governance-services?startingFrom=0&maximumResults=0'
+    governanceServiceProperties = None
+    response = getPlatformSession(getGovernanceServiceURL).get(getGovernanceServiceURL)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            governanceServices = getResponseEnvelope(response).get('elements')
+            if governanceServices:
+                for x in range(len(governanceServices)):
+                    printGovernanceServiceDefinition(governanceServices[x])
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)                
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return governanceServiceProperties
+
+def printGovernanceServiceDefinition(governanceServiceElement):
+    governanceServiceHeader = governanceServiceElement.get('elementHeader')
+    if governanceServiceHeader:
+        governanceServiceTypeName = getElementType(governanceServiceHeader)
+    else:
+        governanceServiceTypeName = None
+    governanceServiceProperties = governanceServiceElement.get('properties')
+    governanceServiceName = governanceServiceProperties.get('qualifiedName')
+    if governanceServiceName:
+        print(" ")
+        print("  Governance Service: " + governanceServiceName)
+        if governanceServiceTypeName:
+            print("     type:               " + governanceServiceTypeName)
+        displayName = governanceServiceProperties.get('name')
+        if displayName:
+            print("     display name:       " + displayName)
+        if governanceServiceHeader:
+            print("     guid:               " + getElementGUID(governanceServiceHeader))
+        governanceServiceDescription = governanceServiceProperties.get('description')
+        if governanceServiceDescription:
+            print("     description:        " + governanceServiceDescription)
+
+def getGovernanceEngineGUID(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName):
+    governanceEngineProperties = getGovernanceEngineProperties(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName)
+    if governanceEngineProperties:
+        elementHeader = governanceEngineProperties.get('elementHeader')
+        if elementHeader:
+            return elementHeader.get('guid')
+    print ("Returns:")
+    prettyResponse = json.dumps(governanceEngineProperties, indent=4)
+    print (prettyResponse)
+    print (" ")  
+
+
+def getGovernanceEngineProperties(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+    getGovernanceEngineURL = configCommandURLRoot + '/governance-engines/by-name/' + qualifiedName
+    governanceEngineProperties = None
+    response = getPlatformSession(getGovernanceEngineURL).get(getGovernanceEngineURL)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            governanceEngineProperties = getResponseEnvelope(response).get('element')
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return governanceEngineProperties
+
+
+def createGovernanceEngine(serverName, serverPlatformName, serverPlatformURL, userId, typeName, qualifiedName, displayName, description):
+    governanceEngineProperties = getGovernanceEngineProperties(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName)
+    if (governanceEngineProperties):
+        print("Governance Engine " + qualifiedName + " is already defined with the following properties:")
+        displayName = governanceEngineProperties.get('displayName')
+        if (displayName):
+            print("   displayName: " + displayName)
+        description = governanceEngineProperties.get('description')
+        if (description):
+            print("   description: " + description)
+        elementHeader = governanceEngineProperties.get('elementHeader')
+        return elementHeader.get('guid')
+    else:
+        configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+        createGovernanceEngineURL = configCommandURLRoot + '/governance-engines/new/' + typeName
+        governanceEngineGUID = None
+        try:
+            body = {
+                "class" : "NewGovernanceEngineRequestBody",
+                "qualifiedName" : qualifiedName,
+                "displayName" : displayName,
+                "description" : description
+            }
+            response=issuePost(createGovernanceEngineURL, body)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    governanceEngineGUID = getResponseEnvelope(response).get('guid')
+                else:
+                    printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformURL + " is returning an error")
+        return governanceEngineGUID
+
+
+def createGovernanceService(serverName, serverPlatformName, serverPlatformURL, userId, typeName, qualifiedName, displayName, description, providerClassName, configurationProperties):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    createGovernanceServiceURL = configCommandURLRoot + '/governance-services/new/' + typeName
+    governanceServiceGUID = None
+    try:
+        body = {
+            "class" : "NewGovernanceServiceRequestBody",
+            "qualifiedName" : qualifiedName,
+            "displayName" : displayName,
+            "description" : description,
+            "connection" : {
+                "class": "Connection",
+                "type": {
+                    "class": "ElementType",
+                    "elementTypeId": "114e9f8f-5ff3-4c32-bd37-a7eb42712253",
+                    "elementTypeName": "Connection",
+                    "elementTypeVersion": 1,
+                    "elementTypeDescription": "A set of properties to identify and configure a connector instance.",
+                    "elementOrigin": "CONFIGURATION"
+                },
+                "qualifiedName": qualifiedName + "-implementation",
+                "displayName": displayName + " Implementation Connection",
+                "description": "Connection for governance service " + qualifiedName,
+                "connectorType": {
+                    "class": "ConnectorType",
+                    "type": {
+                        "class": "ElementType",
+                        "elementTypeId": "954421eb-33a6-462d-a8ca-b5709a1bd0d4",
+                        "elementTypeName": "ConnectorType",
+                        "elementTypeVersion": 1,
+                        "elementTypeDescription": "A set of properties describing a type of connector.",
+                        "elementOrigin": "LOCAL_COHORT"
+                    },
+                    "guid": "1111f73d-e343-abcd-82cb-3918fed81da6",
+                    "qualifiedName": qualifiedName + "-GovernanceServiceProvider",
+                    "displayName": displayName + " Governance Service Provider Implementation",
+                    "description": description,
+                    "connectorProviderClassName": providerClassName
+                },
+                "configurationProperties" : configurationProperties
+            }
+        }
+        response=issuePost(createGovernanceServiceURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceServiceGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceServiceGUID
+
+def registerGovernanceServiceWithEngine(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineGUID, governanceServiceGUID, governanceRequestType, serviceRequestType):
+    configCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    registerGovernanceServiceURL = configCommandURLRoot + '/governance-engines/' + governanceEngineGUID + '/governance-services'
+
+    try:
+        body = {
+            "class" : "GovernanceServiceRegistrationRequestBody",
+            "governanceServiceGUID" : governanceServiceGUID,
+            "requestType" : governanceRequestType,
+            "serviceRequestType" : serviceRequestType
+        }
+        response=issuePost(registerGovernanceServiceURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceServiceGUID = getResponseEnvelope(response).get('guid')
+                return governanceServiceGUID
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+# The engine host periodically refreshes its configuration.  This call causes it to request fresh
+# configuration from the Metadata Server immediately.  This is useful in demos or labs so that there is
+# no need to wait for the asynchronous update if demonstrating governance engine configuration and you want
+# any configuration changes to take effect immediately.
+
+def refreshGovernanceEngineConfig(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName):
+    governanceServerCommandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/engine-host-services/users/" + userId
+    refreshConfigURL = governanceServerCommandURLRoot + '/governance-engines/' + qualifiedName + '/refresh-config'
+    response = getPlatformSession(refreshConfigURL).get(refreshConfigURL)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            print("Done.")
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+
+        
+# The engine can return the current status of the governance engines that it is hosting.
+# This is useful to show how the Engine Host is configured and the different types of
+# governance requests that are supported.
+
+def printGovernanceEngineStatus(governanceEngineSummary):
+    governanceEngineName = governanceEngineSummary.get('governanceEngineName')
+    if governanceEngineName:
+        print("  Governance Engine: " + governanceEngineName)
+        governanceEngineTypeName = governanceEngineSummary.get('governanceEngineTypeName')
+        if governanceEngineTypeName:
+            print("     type:               " + governanceEngineTypeName)
+        governanceEngineService = governanceEngineSummary.get('governanceEngineService')
+        if governanceEngineService:
+            print("     supporting service: " + governanceEngineService)
+        governanceEngineStatus = governanceEngineSummary.get('governanceEngineStatus')
+        if governanceEngineStatus:
+            print("     status:             " + governanceEngineStatus)    
+        governanceEngineGUID = governanceEngineSummary.get('governanceEngineGUID')
+        if governanceEngineGUID:
+            print("     guid:               " + governanceEngineGUID)
+        governanceEngineDescription = governanceEngineSummary.get('governanceEngineDescription')
+        if governanceEngineDescription:
+            print("     description:        " + governanceEngineDescription)
+        requestTypes = governanceEngineSummary.get('governanceRequestTypes')
+        if requestTypes:
+            print("     requestTypes:       ")
+            for x in range(len(requestTypes)):
+                print("       - " + requestTypes[x])
+
+def checkGovernanceEngineStatus(governanceEngineSummary, desiredStatus):
+    governanceEngineStatus = governanceEngineSummary.get('governanceEngineStatus')
+    if governanceEngineStatus == desiredStatus:
+        return True
+    else:
+        return False
+
+def getGovernanceEngineSummary(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName):
+    governanceEngineSummary = None
+    try:
+        governanceServerRootURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-host-services/users/' + userId
+        getStatusURL = governanceServerRootURL + '/governance-engines/' + governanceEngineName + '/summary'
+        response = getPlatformSession(getStatusURL).get(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceEngineSummary = getResponseEnvelope(response).get('governanceEngineSummary')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceEngineSummary
+    
+def waitForConfiguringGovernanceEngine(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, timeout=defaultWaitTimeout):
+    return waitForGovernanceEngineStatus(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, "CONFIGURING", timeout)
+        
+def waitForRunningGovernanceEngine(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, timeout=defaultWaitTimeout):
+    return waitForGovernanceEngineStatus(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, "RUNNING", timeout)
+
+# Wait for a governance engine to reach the desired status.  The engine host is asked to refresh the engine's
+# configuration once if it is not already in that status.  As with waitUntil, the timeout defaults to
+# coco_lab.concurrency.waitTimeout, read when the wait starts, and a timeout of None waits for ever.
+def waitForGovernanceEngineStatus(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, desiredStatus, timeout=defaultWaitTimeout):
+    timeout = getWaitTimeout(timeout)
+    refreshed = False
+    def checkStatus():
+        nonlocal refreshed
+        governanceEngineSummary = getGovernanceEngineSummary(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName)
+        if governanceEngineSummary is None:
+            # A failed retrieval may be transient, so keep polling until the timeout
+            return None
+        if checkGovernanceEngineStatus(governanceEngineSummary, desiredStatus):
+            return governanceEngineSummary
+        if not refreshed:
+            refreshGovernanceEngineConfig(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName)
+            refreshed = True
+            print(" ... Waiting for status change")
+        return None
+    governanceEngineSummary = waitUntil(checkStatus, timeout)
+    if governanceEngineSummary is None:
+        print(" ... Governance engine " + governanceEngineName + " did not reach status " + desiredStatus + " within " + str(timeout) + " seconds")
+    print("")
+    return governanceEngineSummary
+
+def printGovernanceEngineStatuses(serverName, serverPlatformName, serverPlatformURL, userId):
+    try:
+        governanceServerRootURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-host-services/users/' + userId
+        getStatusURL = governanceServerRootURL + '/governance-engines/summary'
+        response = getPlatformSession(getStatusURL).get(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceEngineSummaries = getResponseEnvelope(response).get('governanceEngineSummaries')
+                if governanceEngineSummaries:
+                    if len(governanceEngineSummaries) == 1:
+                        print("One governance engine defined for engine host server " + serverName)
+                    else:
+                        print(str(len(governanceEngineSummaries)) + " governance engines defined for engine host server " + serverName)
+                    print(' ')
+                    for x in range(len(governanceEngineSummaries)):
+                        printGovernanceEngineStatus(governanceEngineSummaries[x])
+                        print(" ")
+                    time.sleep(1)
+                else:
+                    print("No governance engines defined for engine host server " + serverName) 
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+def runDiscoveryService(serverName, serverPlatformName, serverPlatformURL, userId, discoveryEngineName, discoveryRequestType, requestType):
+    try:
+        discoveryServerRootURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-services/asset-analysis/users/' + userId
+        requestDiscoveryURL = discoveryServerRootURL + '/discovery-engines/' + discoveryEngineName + '/discovery-request-types/' + discoveryRequestType + '/assets/' + requestType
+        body = {
+            "class" : "DiscoveryRequestRequestBody",
+        }
+        response=issuePost(requestDiscoveryURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                reportGUID = getResponseEnvelope(response).get('guid')
+                if reportGUID:
+                    return reportGUID
+                else:
+                    print("No discovery results returned from Asset Analysis OMES in server " + serverName) 
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+
+def getDiscoveryReport(serverName, serverPlatformName, serverPlatformURL, userId, discoveryEngineName, reportGUID):
+    try:
+        discoveryServerRootURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-services/asset-analysis/users/' + userId
+        requestReportURL = discoveryServerRootURL + '/discovery-engines/' + discoveryEngineName + '/discovery-analysis-reports/' + reportGUID
+        response=issueGet(requestReportURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                printResponse(response)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+        
+def getDiscoveryReportAnnotations(serverName, serverPlatformName, serverPlatformURL, userId, discoveryEngineName, reportGUID):
+    try:
+        discoveryServerRootURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/engine-services/asset-analysis/users/' + userId
+        requestReportURL = discoveryServerRootURL + '/discovery-engines/' + discoveryEngineName + '/discovery-analysis-reports/' + reportGUID + '/annotations?startingFrom=0&maximumResults=100'
+        response=getPlatformSession(requestReportURL).get(requestReportURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                printResponse(response)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+#
+# Working with Governance Actions, Governance Action Processes and Governance Action Types through the Governance Engine OMAS
+#
+
+def createIntegrationGroup(serverName, serverPlatformName, serverPlatformURL, userId, integrationGroupName, description):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    requestURL = commandURLRoot + '/integration-groups/new'
+    integrationGroupGUID = None
+    try:
+        requestBody = {
+            "class" : "IntegrationGroupProperties",
+            "qualifiedName" : integrationGroupName,
+            "displayName" : integrationGroupName,
+            "description" : description
+        }
+        response=issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                integrationGroupGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return integrationGroupGUID
+
+def createIntegrationConnector(serverName, serverPlatformName, serverPlatformURL, userId, integrationConnectorName, description, connection):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    requestURL = commandURLRoot + '/integration-connectors/new'
+    integrationConnectorGUID = None
+    try:
+        requestBody = {
+            "class" : "IntegrationConnectorProperties",
+            "qualifiedName" : "IntegrationConnector:" + integrationConnectorName,
+            "displayName" : integrationConnectorName,
+            "description" : description,
+            "connection" : connection
+        }
+        response=issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                integrationConnectorGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return integrationConnectorGUID
+
+
+
+def addIntegrationConnectorToGroup(serverName, serverPlatformName, serverPlatformURL, userId, integrationGroupGUID, integrationConnectorGUID, connectorName, connectorUserId, metadataSourceQualifiedName, refreshTimeInterval):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    requestURL = commandURLRoot + '/integration-groups/' + integrationGroupGUID + '/integration-connectors/' + integrationConnectorGUID
+    try:
+        requestBody = {
+            "class" : "RegisteredIntegrationConnectorProperties",
+            "connectorName" : connectorName,
+            "connectorUserId" : connectorUserId,
+            "metadataSourceQualifiedName" : metadataSourceQualifiedName,
+            "refreshTimeInterval" : refreshTimeInterval
+        }
+        response=issuePost(requestURL, requestBody)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                integrationConnectorGUID = getResponseEnvelope(response).get('guid')
+                return integrationConnectorGUID
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+def initiateGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineName, qualifiedName, requestType, requestParameters, processName):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/framework-services/governance-engine/open-governance-service/users/" + userId        
+    initiateGovernanceActionURL = commandURLRoot + '/governance-engines/' + governanceEngineName + '/governance-actions/initiate'
+    governanceActionGUID = None
+    try:
+        body = {
+            "class" : "GovernanceActionRequestBody",
+            "qualifiedName" : qualifiedName,
+            "processName" : processName,
+            "requestType" : requestType,
+            "requestParameters" : requestParameters
+        }
+        response=issuePost(initiateGovernanceActionURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceActionGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceActionGUID
+     
+def printGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    getGovernanceActionURL = commandURLRoot + '/governance-actions/' + governanceActionGUID
+    try:
+        response=issueGet(getGovernanceActionURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                element = getResponseEnvelope(response).get('element')
+                if element:
+                    qualifiedName = element.get('qualifiedName')
+                    elementHeader = element.get('elementHeader')
+                    if elementHeader:
+                        guid = elementHeader.get('guid')
+                    else:
+                        guid = "none?"
+                    governanceEngineName = element.get('governanceEngineName')
+                    processName = element.get('processName')
+                    governanceRequestType = element.get('requestType')
+                    requestParameters = element.get('requestParameters')
+                    actionStatus = element.get('actionStatus')
+                    requestedTime = element.get('requestedTime')
+                    startTime = element.get('startTime')
+                    processingEngineUserId = element.get('processingEngineUserId')
+                    completionTime = element.get('completionTime')
+                    completionGuards = element.get('completionGuards')
+                    completionMessage = element.get('completionMessage')
+                    print(qualifiedName + " [" + guid + "]")
+                    if processName:
+                        print("    processName:            " + processName)
+                    if governanceEngineName:
+                        print("    governanceEngineName:   " + governanceEngineName)
+                    if governanceRequestType:
+                        print("    requestType:            " + governanceRequestType)
+                    if requestParameters:
+                        printMapProperties("    ", "requestParameters", requestParameters)
+                    if processingEngineUserId:
+                        print("    processingEngineUserId: " + processingEngineUserId)
+                    if actionStatus:
+                        print("    actionStatus:           " + actionStatus)
+                    if startTime:
+                        print("    startTime:              " + startTime)
+                    if requestedTime:
+                        print("    requestedTime:          " + requestedTime)
+                    if completionTime:
+                        print("    completionTime:         " + completionTime)
+                    if completionGuards:
+                        print("     completionGuards:     ")
+                        for x in range(len(completionGuards)):
+                            print("         - " + completionGuards[x])
+                    if completionMessage:
+                        print("    completionMessage:      " + completionMessage)
+                else:
+                    prettyResponse = json.dumps(response, indent=4)
+                    print(prettyResponse)
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+def checkGovernanceActionStatus(governanceActionElement, desiredState):
+    governanceActionStatus = governanceActionElement.get('actionStatus')
+    if governanceActionStatus == desiredState:
+        return True
+    else:
+        return False
+    
+def checkGovernanceActionCompletion(governanceActionElement):
+    governanceActionCompletionTime = None
+    governanceActionCompletionTime = governanceActionElement.get('completionTime')
+    if governanceActionCompletionTime:
+        return True
+    else:
+        return False
+
+def getGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID):
+    governanceActionElement = None
+    try:
+        commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+        getGovernanceActionURL = commandURLRoot + '/governance-actions/' + governanceActionGUID
+        response = getPlatformSession(getGovernanceActionURL).get(getGovernanceActionURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceActionElement = getResponseEnvelope(response).get('element')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceActionElement
+    
+#
+# Governance action completion events.  The Governance Engine OMAS publishes an event on its out topic each time a
+# governance action changes.  startGovernanceActionListener consumes that topic on a background thread and wakes up
+# anyone waiting for a governance action named in an event, so the waits below only call getGovernanceAction when
+# something has happened to the action rather than polling it repeatedly.  While the listener runs, each action is
+# still checked every governanceActionEventPollInterval seconds in case an event is missed.  The listener needs the
+# kafka-python package; without it, or if the event bus cannot be reached, the waits poll with backoff as before.
+# Any object with poll(timeout_ms) and close() methods that behaves like a KafkaConsumer can be passed as the
+# consumer, which allows the listener to be tried out without a Kafka broker.
+#
+
+try:
+    from kafka import KafkaConsumer, TopicPartition
+except ImportError:
+    KafkaConsumer = None
+    TopicPartition = None
+
+governanceActionEventPollInterval = 30
+governanceActionListener = None
+governanceActionWaiters = {}
+governanceActionWaitersLock = threading.Lock()
+
+def getGovernanceEngineOutTopicName(serverName, serverPlatformName, serverPlatformURL, userId, callerId):
+    topicName = "egeria.omag.server." + serverName + ".omas.governanceengine.outTopic"
+    try:
+        commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId
+        requestURL = commandURLRoot + '/topics/out-topic-connection/' + callerId
+        response = issueGet(requestURL)
+        if response.status_code == 200 and getResponseEnvelope(response).relatedHTTPCode == 200:
+            # The topic connector is usually embedded in a virtual connection
+            connections = [getResponseEnvelope(response).get('connection')]
+            while connections:
+                connection = connections.pop(0) or {}
+                address = (connection.get('endpoint') or {}).get('address')
+                if address:
+                    return address
+                for embeddedConnection in connection.get('embeddedConnections') or []:
+                    connections.append(embeddedConnection.get('embeddedConnection'))
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return topicName
+
+def createOutTopicConsumer(topicName, bootstrapServers):
+    consumer = KafkaConsumer(bootstrap_servers=bootstrapServers, enable_auto_commit=False, auto_offset_reset='latest')
+    # Assign the partitions directly, rather than joining a consumer group, so the listener is positioned at the
+    # end of the topic before the caller starts any governance actions
+    partitions = consumer.partitions_for_topic(topicName) or {0}
+    consumer.assign([TopicPartition(topicName, partition) for partition in partitions])
+    for topicPartition in consumer.assignment():
+        consumer.position(topicPartition)
+    return consumer
+
+# Return the GUIDs in an out topic event.  Different event types carry the governance action in different places
+# so the whole event is searched.
+def getEventGUIDs(event):
+    guids = set()
+    values = [event]
+    while values:
+        value = values.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key in ('guid', 'elementGUID', 'governanceActionGUID') and isinstance(item, str):
+                    guids.add(item)
+                else:
+                    values.append(item)
+        elif isinstance(value, list):
+            values.extend(value)
+    return guids
+
+def notifyGovernanceActionWaiters(guids):
+    with governanceActionWaitersLock:
+        for guid in guids:
+            for waiter in governanceActionWaiters.get(guid, []):
+                waiter["notified"].add(guid)
+                waiter["event"].set()
+
+def runGovernanceActionListener(listener):
+    consumer = listener["consumer"]
+    try:
+        while not listener["stopping"].is_set():
+            for records in consumer.poll(timeout_ms=500).values():
+                for record in records:
+                    try:
+                        event = decodeJSON(record.value)
+                    except ValueError:
+                        continue
+                    listener["events"] += 1
+                    notifyGovernanceActionWaiters(getEventGUIDs(event))
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("The governance action listener for " + listener["serverName"] + " has stopped - governance actions will be polled")
+    finally:
+        listener["stopping"].set()
+        consumer.close()
+
+def startGovernanceActionListener(serverName, serverPlatformName, serverPlatformURL, userId, consumer=None, bootstrapServers=None):
+    global governanceActionListener
+    stopGovernanceActionListener()
+    if consumer is None:
+        if KafkaConsumer is None:
+            print("The kafka-python package is not installed - governance actions will be polled")
+            return False
+        topicName = getGovernanceEngineOutTopicName(serverName, serverPlatformName, serverPlatformURL, userId, "governanceActionListener")
+        try:
+            consumer = createOutTopicConsumer(topicName, bootstrapServers or eventBusBootstrapServers)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Unable to listen to " + topicName + " - governance actions will be polled")
+            return False
+    listener = {
+        "serverName" : serverName,
+        "serverPlatformURL" : serverPlatformURL,
+        "consumer" : consumer,
+        "stopping" : threading.Event(),
+        "events" : 0
+    }
+    listener["thread"] = threading.Thread(target=runGovernanceActionListener, args=(listener,), daemon=True)
+    listener["thread"].start()
+    governanceActionListener = listener
+    return True
+
+def stopGovernanceActionListener():
+    global governanceActionListener
+    listener = governanceActionListener
+    governanceActionListener = None
+    if listener:
+        listener["stopping"].set()
+        listener["thread"].join(5)
+
+def isGovernanceActionListenerRunning(serverName, serverPlatformURL):
+    listener = governanceActionListener
+    return (listener is not None and not listener["stopping"].is_set()
+            and listener["serverName"] == serverName and listener["serverPlatformURL"] == serverPlatformURL)
+
+def addGovernanceActionWaiter(governanceActionGUIDs):
+    waiter = {"event" : threading.Event(), "notified" : set(), "guids" : list(governanceActionGUIDs)}
+    with governanceActionWaitersLock:
+        for guid in waiter["guids"]:
+            governanceActionWaiters.setdefault(guid, []).append(waiter)
+    return waiter
+
+def removeGovernanceActionWaiter(waiter):
+    with governanceActionWaitersLock:
+        for guid in waiter["guids"]:
+            waiters = governanceActionWaiters.get(guid)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del governanceActionWaiters[guid]
+
+# Return the GUIDs named in events since the last call and reset the waiter.
+def takeNotifiedGUIDs(waiter):
+    with governanceActionWaitersLock:
+        notified = waiter["notified"]
+        waiter["notified"] = set()
+        waiter["event"].clear()
+    return notified
+
+# Wait for a governance action to complete and return it, or None if it did not complete within timeout seconds.
+# Failed retrievals are retried until then.
+def waitForRunningGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID, timeout=defaultWaitTimeout):
+    timeout = getWaitTimeout(timeout)
+    if isGovernanceActionListenerRunning(serverName, serverPlatformURL):
+        print(" ... Waiting for the completion event")
+        for guid, governanceActionElement in waitForGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, [governanceActionGUID], timeout):
+            print("")
+            return governanceActionElement
+    lastStatus = None
+    def checkCompletion():
+        nonlocal lastStatus
+        governanceActionElement = getGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUID)
+        if governanceActionElement is None:
+            # A failed retrieval may be transient, so keep polling until the timeout
+            return None
+        if checkGovernanceActionCompletion(governanceActionElement):
+            return governanceActionElement
+        governanceActionStatus = governanceActionElement.get('actionStatus')
+        if governanceActionStatus != lastStatus:
+            print(" ... Waiting for completion status, current status is: " + governanceActionStatus)
+            lastStatus = governanceActionStatus
+        return None
+    governanceActionElement = waitUntil(checkCompletion, timeout)
+    if governanceActionElement is None:
+        print(" ... Governance action " + governanceActionGUID + " did not complete within " + str(timeout) + " seconds")
+    print("")
+    return governanceActionElement
+
+# Wait for many governance actions at once.  This is a generator that yields (governanceActionGUID, governanceAction)
+# as each action completes.  Each action is checked on its own schedule - when an event arrives for it if the
+# governance action listener is running, otherwise with backoff - with the checks that fall due together made
+# concurrently on the worker pool.  An action that cannot be retrieved is checked again later, in case the error was
+# transient.  Actions that have not completed within timeout seconds are yielded with None in place of the action.
+def waitForGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, governanceActionGUIDs, timeout=defaultWaitTimeout):
+    timeout = getWaitTimeout(timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    schedule = {guid: (time.monotonic(), concurrency.waitInitialInterval) for guid in governanceActionGUIDs}
+    waiter = None
+    if isGovernanceActionListenerRunning(serverName, serverPlatformURL):
+        waiter = addGovernanceActionWaiter(schedule)
+    try:
+        while schedule:
+            now = time.monotonic()
+            if waiter:
+                for guid in takeNotifiedGUIDs(waiter):
+                    if guid in schedule:
+                        schedule[guid] = (now, concurrency.waitInitialInterval)
+            dueGUIDs = [guid for guid, (nextPollTime, interval) in schedule.items() if nextPollTime <= now]
+            governanceActions = mapOnWorkers(
+                lambda guid: getGovernanceAction(serverName, serverPlatformName, serverPlatformURL, userId, guid), dueGUIDs)
+            for guid, governanceActionElement in zip(dueGUIDs, governanceActions):
+                nextPollTime, interval = schedule[guid]
+                if governanceActionElement is not None and checkGovernanceActionCompletion(governanceActionElement):
+                    del schedule[guid]
+                    yield guid, governanceActionElement
+                elif governanceActionElement is not None and waiter and isGovernanceActionListenerRunning(serverName, serverPlatformURL):
+                    schedule[guid] = (time.monotonic() + governanceActionEventPollInterval, interval)
+                else:
+                    schedule[guid] = (time.monotonic() + getJitteredInterval(interval), getNextWaitInterval(interval))
+            if not schedule:
+                break
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                for guid in list(schedule):
+                    print(" ... Governance action " + guid + " did not complete within " + str(timeout) + " seconds")
+                    yield guid, None
+                break
+            nextPollTime = min(nextPollTime for nextPollTime, interval in schedule.values())
+            if deadline is not None:
+                nextPollTime = min(nextPollTime, deadline)
+            if nextPollTime > now:
+                if waiter:
+                    waiter["event"].wait(nextPollTime - now)
+                else:
+                    time.sleep(nextPollTime - now)
+    finally:
+        if waiter:
+            removeGovernanceActionWaiter(waiter)
+
+def iterateGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, startFrom=0, pageSize=None, activeOnly=False, stream=False):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    if activeOnly:
+        getGovernanceActionsURL = commandURLRoot + '/governance-actions/active'
+    else:
+        getGovernanceActionsURL = commandURLRoot + '/governance-actions'
+
+    def retrievePage(startFrom, pageSize):
+        requestURL = getGovernanceActionsURL + '?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize)
+        try:
+            if stream:
+                return streamResponseElements(serverName, serverPlatformName, serverPlatformURL, issueStreamingGet(requestURL), 'elements')
+            response = getPlatformSession(requestURL).get(requestURL)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    return getResponseEnvelope(response).get('elements') or []
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformURL + " is returning an error")
+        return None
+
+    return iteratePages(retrievePage, startFrom, pageSize)
+
+# With compact set, the governance actions are returned as GovernanceActionElement records (see coco_lab.elements).
+# With stream set, each page is decoded as it is read from the connection (see streamResponseElements).
+def getGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, pageSize=None, compact=False, stream=False):
+    governanceActions = iterateGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, 0, pageSize, stream=stream)
+    if compact:
+        governanceActions = toElementRecords(governanceActions, GovernanceActionElement)
+    return list(governanceActions)
+
+def printGovernanceActionSummary(governanceAction):
+    if governanceAction:
+        name = governanceAction.get('displayName')
+        if not name:
+            name = governanceAction.get('qualifiedName')
+        actionStatus = governanceAction.get('actionStatus')
+        if governanceAction.get('completionGuards'):
+            completionGuards = governanceAction.get('completionGuards')
+        else:
+            completionGuards = "\t"
+        if governanceAction.get('processName'):
+            processName = governanceAction.get('processName')
+        else:
+            processName = "\t"
+        if governanceAction.get('completionMessage'):
+            completionMessage = governanceAction.get('completionMessage')
+        else:
+            completionMessage = ""
+        print(actionStatus + "\t| " + name + "\t| " + processName + "\t| " + '%s' % ', '.join(map(str, completionGuards)) + "\t| " + completionMessage)
+
+#
+# Governance action monitor.  The list of governance actions on a long-lived server grows without bound, so rather
+# than retrieving it all each time, a monitor keeps a local copy of the governance actions and refreshes it
+# incrementally.  New actions are paged in from a cursor at the end of the list.  The GUIDs of the page before the
+# cursor are kept, and that page is read again each time and compared with them position by position: if an action
+# has been inserted or removed earlier in the list, or the server has reordered it, they no longer line up and the
+# whole list is read again from the start, so no new action is skipped.  Actions
+# that are still running are refreshed through the active governance actions request, and those that have finished
+# since the last refresh are retrieved individually.  Finished actions do not change so are not retrieved again.
+# Each refresh returns the actions that are new or have changed, found using a high-water mark of (update time, GUID)
+# together with the last status seen for each action.
+#
+
+governanceActionMonitorPageSize = 100
+governanceActionMonitors = {}
+
+def getGovernanceActionMonitor(serverName, serverPlatformName, serverPlatformURL, userId):
+    monitorKey = (serverPlatformURL, serverName, userId)
+    monitor = governanceActionMonitors.get(monitorKey)
+    if monitor is None:
+        monitor = {
+            "serverName" : serverName,
+            "serverPlatformName" : serverPlatformName,
+            "serverPlatformURL" : serverPlatformURL,
+            "userId" : userId,
+            "governanceActions" : {},
+            "runningGUIDs" : set(),
+            "cursor" : 0,
+            "cursorPageGUIDs" : [],
+            "highWaterMark" : (0, "")
+        }
+        governanceActionMonitors[monitorKey] = monitor
+    return monitor
+
+# The most recent time recorded in a governance action.  Older servers do not return the element's version times
+# so the request, start and completion times are used as well.
+def getGovernanceActionUpdateTime(governanceAction):
+    versions = (governanceAction.get('elementHeader') or {}).get('versions') or {}
+    times = [versions.get('updateTime'), versions.get('createTime'), governanceAction.get('requestedTime'),
+             governanceAction.get('startTime'), governanceAction.get('completionTime')]
+    return max([actionTime for actionTime in times if actionTime], default=0)
+
+def getGovernanceActionMonitorKey(governanceAction):
+    return (getGovernanceActionUpdateTime(governanceAction), getElementGUID(governanceAction.get('elementHeader')) or "")
+
+def getGovernanceActionGUIDs(governanceActions):
+    return [getElementGUID(governanceAction.get('elementHeader')) for governanceAction in governanceActions]
+
+# Read the actions from the page before the cursor to the end of the list.  The page before the cursor must hold the
+# same GUIDs, in the same positions, as when it was last read; if it does not, the list is read again from the start.
+def readNewGovernanceActions(monitor):
+    serverDetails = (monitor["serverName"], monitor["serverPlatformName"], monitor["serverPlatformURL"], monitor["userId"])
+    cursor = monitor["cursor"]
+    startFrom = max(cursor - governanceActionMonitorPageSize, 0)
+    governanceActions = list(iterateGovernanceActions(*serverDetails, startFrom, governanceActionMonitorPageSize))
+    cursorPageGUIDs = monitor["cursorPageGUIDs"]
+    if getGovernanceActionGUIDs(governanceActions[:len(cursorPageGUIDs)]) != cursorPageGUIDs:
+        startFrom = 0
+        governanceActions = list(iterateGovernanceActions(*serverDetails, startFrom, governanceActionMonitorPageSize))
+    monitor["cursor"] = startFrom + len(governanceActions)
+    monitor["cursorPageGUIDs"] = getGovernanceActionGUIDs(governanceActions[-governanceActionMonitorPageSize:])
+    return governanceActions
+
+# Bring the monitor up to date and return the governance actions that are new or have changed since the last
+# refresh, oldest change first.
+def refreshGovernanceActionMonitor(monitor):
+    serverDetails = (monitor["serverName"], monitor["serverPlatformName"], monitor["serverPlatformURL"], monitor["userId"])
+    retrieved = {}
+    for governanceAction in readNewGovernanceActions(monitor):
+        retrieved[getElementGUID(governanceAction.get('elementHeader'))] = governanceAction
+    for governanceAction in iterateGovernanceActions(*serverDetails, 0, governanceActionMonitorPageSize, activeOnly=True):
+        retrieved[getElementGUID(governanceAction.get('elementHeader'))] = governanceAction
+    finishedGUIDs = [guid for guid in monitor["runningGUIDs"] if guid not in retrieved]
+    finishedActions = mapOnWorkers(lambda guid: getGovernanceAction(*serverDetails, guid), finishedGUIDs)
+    for guid, governanceAction in zip(finishedGUIDs, finishedActions):
+        if governanceAction:
+            retrieved[guid] = governanceAction
+
+    changes = []
+    highWaterMark = monitor["highWaterMark"]
+    for guid, governanceAction in retrieved.items():
+        if guid is None:
+            continue
+        previousAction = monitor["governanceActions"].get(guid)
+        monitorKey = getGovernanceActionMonitorKey(governanceAction)
+        if (previousAction is None or monitorKey > monitor["highWaterMark"]
+                or previousAction.get('actionStatus') != governanceAction.get('actionStatus')):
+            changes.append(governanceAction)
+        highWaterMark = max(highWaterMark, monitorKey)
+        monitor["governanceActions"][guid] = governanceAction
+        if checkGovernanceActionCompletion(governanceAction):
+            monitor["runningGUIDs"].discard(guid)
+        else:
+            monitor["runningGUIDs"].add(guid)
+    monitor["highWaterMark"] = highWaterMark
+    return sorted(changes, key=getGovernanceActionMonitorKey)
+
+def filterGovernanceActions(governanceActions, statuses=None, governanceEngineNames=None, requestTypes=None):
+    return [governanceAction for governanceAction in governanceActions
+            if (not statuses or governanceAction.get('actionStatus') in statuses)
+            and (not governanceEngineNames or governanceAction.get('governanceEngineName') in governanceEngineNames)
+            and (not requestTypes or governanceAction.get('requestType') in requestTypes)]
+
+# Print all of the governance actions that match the filters.  Only new and changed actions are retrieved from the server.
+def monitorGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, statuses=None, governanceEngineNames=None, requestTypes=None):
+    monitor = getGovernanceActionMonitor(serverName, serverPlatformName, serverPlatformURL, userId)
+    refreshGovernanceActionMonitor(monitor)
+    governanceActions = sorted(monitor["governanceActions"].values(), key=getGovernanceActionMonitorKey)
+    for governanceAction in filterGovernanceActions(governanceActions, statuses, governanceEngineNames, requestTypes):
+        printGovernanceActionSummary(governanceAction)
+
+# Print the governance actions that match the filters and are new or have changed since the last call.
+def printGovernanceActionChanges(serverName, serverPlatformName, serverPlatformURL, userId, statuses=None, governanceEngineNames=None, requestTypes=None):
+    monitor = getGovernanceActionMonitor(serverName, serverPlatformName, serverPlatformURL, userId)
+    changes = filterGovernanceActions(refreshGovernanceActionMonitor(monitor), statuses, governanceEngineNames, requestTypes)
+    for governanceAction in changes:
+        printGovernanceActionSummary(governanceAction)
+    return len(changes)
+
+# A simple dashboard: print the changes to the governance actions every interval seconds until duration seconds
+# have passed (or for ever if duration is None).  Interrupt the kernel to stop it early.
+def watchGovernanceActions(serverName, serverPlatformName, serverPlatformURL, userId, interval=5, duration=None, statuses=None, governanceEngineNames=None, requestTypes=None):
+    deadline = None if duration is None else time.monotonic() + duration
+    try:
+        while True:
+            printGovernanceActionChanges(serverName, serverPlatformName, serverPlatformURL, userId, statuses, governanceEngineNames, requestTypes)
+            if deadline is not None and time.monotonic() + interval > deadline:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print(" ... Stopped watching governance actions")
+
+def createGovernanceActionProcess(serverName, serverPlatformName, serverPlatformURL, userId, qualifiedName, displayName, description, technicalName, technicalDescription):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    createGovernanceActionProcessURL = commandURLRoot + '/governance-action-processes/new'
+    governanceActionProcessGUID = None
+    try:
+        body = {
+            "class" : "NewGovernanceActionProcessRequestBody",
+            "processStatus" : "ACTIVE",
+            "properties" : {
+                "class" : "GovernanceActionProcessProperties",
+                "qualifiedName" : qualifiedName,
+                "displayName" : displayName,
+                "description" : description,
+                "technicalName" : technicalName,
+                "technicalDescription" : technicalDescription,
+                "owner" : userId,
+                "ownerCategory" : "USER_ID"
+            }
+        }
+        response=issuePost(createGovernanceActionProcessURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceActionProcessGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceActionProcessGUID
+
+
+def createGovernanceActionType(serverName, serverPlatformName, serverPlatformURL, userId, governanceEngineGUID, qualifiedName, supportedGuards, requestType, requestParameters):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    createGovernanceActionTypeURL = commandURLRoot + '/governance-action-types/new'
+    governanceActionTypeGUID = None
+    try:
+        body = {
+            "class" : "GovernanceActionTypeProperties",
+            "qualifiedName" : qualifiedName,
+            "supportedGuards" : supportedGuards,
+            "governanceEngineGUID" : governanceEngineGUID,
+            "requestType" : requestType,
+            "requestParameters" : requestParameters
+        }
+        response=issuePost(createGovernanceActionTypeURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                governanceActionTypeGUID = getResponseEnvelope(response).get('guid')
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+    return governanceActionTypeGUID
+
+def setupFirstActionType(serverName, serverPlatformName, serverPlatformURL, userId, processGUID, actionTypeGUID, optionalGuard):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    firstActionTypeURL = commandURLRoot + '/governance-action-processes/' + processGUID + '/first-action-type/' + actionTypeGUID + '/new'
+    try:
+        body = optionalGuard
+        response=issueDataPost(firstActionTypeURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+        
+def setupNextActionType(serverName, serverPlatformName, serverPlatformURL, userId, currentActionTypeGUID, nextActionTypeGUID, guard, mandatoryGuard, ignoreMultipleTriggers):
+    commandURLRoot = serverPlatformURL + "/servers/" + serverName + "/open-metadata/access-services/governance-engine/users/" + userId        
+    nextActionTypeURL = commandURLRoot + '/governance-action-types/' + currentActionTypeGUID + '/next-action-types/' + nextActionTypeGUID + '/new'
+    try:
+        body = {
+            "class" : "NewGovernanceActionTypeRequestBody",
+            "guard" : guard,
+            "mandatoryGuard" : mandatoryGuard,
+            "ignoreMultipleTriggers" : ignoreMultipleTriggers
+        }
+        response=issuePost(nextActionTypeURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error )
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+#
+# Using the OpenMetadataStore services to report on running governance action processes.
+#
@@ -0,0 +1,241 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Working with the integration daemons and their integration connectors.
+
+"""
+
+from .rest import getResponseEnvelope, issueGet, issuePost, printResponse, printUnexpectedResponse
+
+
+# 
+# Interaction with the Integration Daemon OMAG Server
+#
+def printIntegrationConnectorStatus(integrationConnectorSummary):
+    connectorName = integrationConnectorSummary.get('connectorName')
+    if connectorName:
+        print("      Integration Connector: " + connectorName)
+        connectorStatus = integrationConnectorSummary.get('connectorStatus')
+        if connectorStatus:
+            print("         status:                   " + connectorStatus)
+            if connectorStatus == "FAILED":
+                failingExceptionMessage = integrationConnectorSummary.get('failingExceptionMessage')
+                if failingExceptionMessage:
+                    print("         failingExceptionMessage:  " + failingExceptionMessage)
+            else:
+                lastStatusChange = integrationConnectorSummary.get('lastStatusChange')
+                if lastStatusChange:
+                    print("         lastStatusChange:         " + lastStatusChange)
+                lastRefreshTime = integrationConnectorSummary.get('lastRefreshTime')
+                if lastRefreshTime:
+                    print("         lastRefreshTime:          " + lastRefreshTime)
+                minMinutesBetweenRefresh = integrationConnectorSummary.get('minMinutesBetweenRefresh')
+                if minMinutesBetweenRefresh:
+                    print("         minMinutesBetweenRefresh: " + str(minMinutesBetweenRefresh))
+
+def printIntegrationServiceSummary(integrationServiceSummary):
+    integrationServiceName = integrationServiceSummary.get('integrationServiceFullName')
+    if integrationServiceName:
+        print("   Integration Service: " + integrationServiceName)
+        connectors = integrationServiceSummary.get('integrationConnectorReports')
+        if connectors:
+            print("     Integration Connector Reports: ")
+            for x in range(len(connectors)):
+                printIntegrationConnectorStatus(connectors[x])
+                
+def printIntegrationGroupSummary(integrationGroupSummary):
+    integrationGroupName = integrationGroupSummary.get('integrationGroupName')
+    if integrationGroupName:
+        print("   Integration Group: " + integrationGroupName)
+        connectors = integrationGroupSummary.get('integrationConnectorReports')
+        if connectors:
+            print("     Integration Connector Reports: ")
+            for x in range(len(connectors)):
+                printIntegrationConnectorStatus(connectors[x])
+        else:
+            print("     No integration connectors defined")
+
+def getIntegrationDaemonStatus(serverName, serverPlatformName, serverPlatformURL, userId):
+    try:
+        integrationDaemonURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-daemon/users/' + userId 
+        getStatusURL = integrationDaemonURL + '/status'
+        response=issueGet(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                integrationDaemonStatus = getResponseEnvelope(response).get('integrationDaemonStatus')
+                if integrationDaemonStatus:
+                    integrationServiceSummaries = integrationDaemonStatus.get('integrationServiceSummaries')
+                    if integrationServiceSummaries:
+                        if len(integrationServiceSummaries) == 1:
+                            print("One integration service defined for integration daemon " + serverName)
+                        else:
+                            print(str(len(integrationServiceSummaries)) + " integration services defined for integration daemon " + serverName)
+                        print(' ')
+                        for x in range(len(integrationServiceSummaries)):
+                            printIntegrationServiceSummary(integrationServiceSummaries[x])
+                            print(" ")
+                    else:
+                        print("No integration services defined for integration daemon " + serverName)
+                    integrationGroupSummaries = integrationDaemonStatus.get('integrationGroupSummaries')
+                    if integrationGroupSummaries:
+                        if len(integrationGroupSummaries) == 1:
+                            print("One integration group defined for integration daemon " + serverName)
+                        else:
+                            print(str(len(integrationGroupSummaries)) + " integration groups defined for integration daemon " + serverName)
+                        print(' ')
+                        for x in range(len(integrationGroupSummaries)):
+                            printIntegrationGroupSummary(integrationGroupSummaries[x])
+                            print(" ")
+                    else:
+                        print("No integration group defined for integration daemon " + serverName)
+                else:
+                    print("No status returned for integration daemon " + serverName) 
+            else:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+def restartIntegrationConnector(serverName, serverPlatformName, serverPlatformURL, userId, connectorName):
+    try:
+        integrationDaemonURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-daemon/users/' + userId 
+        restartURL = integrationDaemonURL + '/integration-connectors/restart'
+        body = {
+            "class" : "NameRequestBody",
+            "name" : connectorName
+        }
+        response=issuePost(restartURL, body)
+        if response.status_code == 200:
+            print("Done.") 
+        else:
+            printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+def updateConnectorConfigurationProperties(serverName, serverPlatformName, serverPlatformURL, userId, connectorName, configurationProperties):
+    try:
+        integrationDaemonURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-daemon/users/' + userId 
+        updateConnectorURL = integrationDaemonURL + '/integration-connectors/configuration-properties'
+        body = {
+            "class" : "ConnectorConfigPropertiesRequestBody",
+            "connectorName" : connectorName,
+            "mergeUpdate" : True,
+            "configurationProperties" : configurationProperties
+        }
+        response=issuePost(updateConnectorURL, body)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode != 200:
+                printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+            else:
+                print("Done.")
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error") 
+        
+def getIntegrationConnectorConfigProperties(serverName, serverPlatformName, serverPlatformURL, userId, connectorName):
+    try:
+        integrationDaemonURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-daemon/users/' + userId 
+        getConfigPropertiesURL = integrationDaemonURL + '/integration-connectors/' + connectorName + '/configuration-properties'
+        response=issueGet(getConfigPropertiesURL)
+        printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+
+def refreshIntegrationGroupConfig(serverName, serverPlatformName, serverPlatformURL, userId, groupName):
+    try:
+        integrationDaemonURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-daemon/users/' + userId
+        requestURL = integrationDaemonURL + '/integration-groups/' + groupName + '/refresh-config'
+        response=issueGet(requestURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                print("Done.")
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+        
+
+## Open Metadata Integration Services
+
+def validateIntegrationConnector(serverName, serverPlatformName, serverPlatformURL, serviceURLMarker, userId, connectorProvider):
+    try:
+        integrationServiceURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/integration-services/' + serviceURLMarker + '/users/' + userId 
+        getStatusURL = integrationServiceURL + '/validate-connector/' + connectorProvider
+        response=issueGet(getStatusURL)
+        if response.status_code == 200:
+            relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+            if relatedHTTPCode == 200:
+                connectorReport = getResponseEnvelope(response).get('connectorReport')
+                connectorType = connectorReport.get('connectorType')
+                if connectorType:
+                    guid = connectorType.get('guid')
+                    if guid:
+                        print("   guid:                              " + guid)
+                    qualifiedName = connectorType.get('qualifiedName')
+                    if qualifiedName:
+                        print("   qualifiedName:                     " + qualifiedName)
+                    displayName = connectorType.get('displayName')
+                    if displayName:
+                        print("   displayName:                       " + displayName)
+                    description = connectorType.get('description')
+                    if description:
+                        print("   description:                       " + description)
+                    connectorProviderClassName = connectorType.get('connectorProviderClassName')
+                    if connectorProviderClassName:
+                        print("   connectorProviderClassName:        " + connectorProviderClassName)
+                    recognizedConfigurationProperties = connectorType.get('recognizedConfigurationProperties')
+                    if recognizedConfigurationProperties:
+                        print("")
+                        print("   recognizedConfigurationProperties: ")
+                        for x in range(len(recognizedConfigurationProperties)):
+                            print("      - " + recognizedConfigurationProperties[x])
+                    if connectorType.get('connectorInterfaceLanguage'):
+                        print ("    connectorInterfaceLanguage: " + connectorType.get('connectorInterfaceLanguage'))
+                        if connectorType.get('connectorFrameworkName'):
+                            print ("    connectorFrameworkName: " + connectorType.get('connectorFrameworkName'))
+                            connectorInterfaces = connectorType.get('connectorInterfaces')
+                            if connectorInterfaces:
+                                print ("    connectorInterfaces:")
+                                for x in range(len(connectorInterfaces)):
+                                    print ("        " + connectorInterfaces[x])
+                    if connectorType.get('targetTechnologySource'):
+                        print ("    targetTechnologySource: " + connectorType.get('targetTechnologySource'))
+                    if connectorType.get('targetTechnologyName'):
+                        print ("    targetTechnologyName: " + connectorType.get('targetTechnologyName'))
+                    refreshTimeInterval = connectorReport.get('refreshTimeInterval')
+                    usesBlockingCalls = connectorReport.get('usesBlockingCalls')
+                    if usesBlockingCalls:
+                        print ("    usesBlockingCalls: true")
+                    else:
+                        print ("    usesBlockingCalls: false")
+                    if refreshTimeInterval == 0:
+                        print ("    refreshTimeInterval: no recommendation")
+                    else:
+                        print ("    refreshTimeInterval: " + str(refreshTimeInterval))
+                else:
+                    printResponse(response)
+            else:
+                printResponse(response)
+        else:
+            printResponse(response)
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("Platform " + serverPlatformURL + " is returning an error")
+        
@@ -0,0 +1,287 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Checking the OMAG Server Platforms are running and the servers on them are configured and started.
+
+"""
+
+import json
+
+from .rest import getPlatformSession, getResponseEnvelope, issueGet, issuePost, printUnexpectedResponse
+from .topology import adminUserId
+
+
+# The OMAG Server Platform is a single executable (application) that can be started
+# from the command line or a script or as part of a pre-built container environment
+# such as Kubernetes.  The function below checks that a specific
+# server platform is running.
+
+def checkServerPlatform(serverPlatformName, serverPlatformURL):
+    try:
+        isPlatformActiveURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/origin"
+        response = getPlatformSession(isPlatformActiveURL).get(isPlatformActiveURL)
+        if response.status_code == 200:
+            print("   ", serverPlatformName, "is active")
+            return True
+        else:
+            print("   ", serverPlatformName, "is not an OMAG Platform")
+            return False
+    except Exception as error:
+        print("Exception: %s" % error)
+        print("   ", serverPlatformName, "is down - start it before proceeding")
+        return False
+
+
+# The OMAG Server Platform has the implementation of the open metadata and governance (OMAG) services.  These are
+# divided into three groups: Common Services, Access Services and Governance Services.
+
+def printServiceDescriptions(serverPlatformName, serviceGroupName, services):
+    print(serviceGroupName, "for", serverPlatformName)
+    for x in range(len(services)):
+        serviceName = services[x].get('serviceName')
+        serviceDescription = services[x].get('serviceDescription')
+        serviceWiki = services[x].get('serviceWiki')    
+        print (" * ", serviceName)
+        print ("     ", serviceDescription)
+        print ("     ", serviceWiki)
+    print (" ")
+    
+def getServerPlatformServices(serverPlatformName, serverPlatformURL):
+    getOMAGServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/registered-services"
+    response = issueGet(getOMAGServicesURL + "/framework-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Common services", getResponseEnvelope(response).get('services'))
+    response = issueGet(getOMAGServicesURL + "/access-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Access services", getResponseEnvelope(response).get('services'))
+    response = issueGet(getOMAGServicesURL + "/engine-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Engine services", getResponseEnvelope(response).get('services'))
+    response = issueGet(getOMAGServicesURL + "/integration-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Integration services", getResponseEnvelope(response).get('services'))
+    response = issueGet(getOMAGServicesURL + "/view-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "View services", getResponseEnvelope(response).get('services'))
+    response = issueGet(getOMAGServicesURL + "/governance-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Governance services", getResponseEnvelope(response).get('services'))
+        
+def getAccessServices(serverPlatformName, serverPlatformURL):
+    getOMAGServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/registered-services"
+    response = issueGet(getOMAGServicesURL + "/access-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Access services", getResponseEnvelope(response).get('services'))
+    
+def getEngineServices(serverPlatformName, serverPlatformURL):
+    getOMAGServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/registered-services"
+    response =issueGet(getOMAGServicesURL + "/engine-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Engine services", getResponseEnvelope(response).get('services'))
+              
+def getIntegrationServices(serverPlatformName, serverPlatformURL):
+    getOMAGServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/registered-services"
+    response = issueGet(getOMAGServicesURL + "/integration-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "Integration services", getResponseEnvelope(response).get('services'))
+        
+def getViewServices(serverPlatformName, serverPlatformURL):
+    getOMAGServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/registered-services"
+    response = issueGet(getOMAGServicesURL + "/view-services")
+    if response.status_code == 200:
+        printServiceDescriptions(serverPlatformName, "View services", getResponseEnvelope(response).get('services'))        
+
+def getConnectorType(serverPlatformName, serverPlatformURL, connectorProviderClassName):
+    print (" ")
+    platformServicesURLRoot = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform"
+    url = platformServicesURLRoot + '/connector-types/' + connectorProviderClassName
+    response = getPlatformSession(url).get(url)
+    if response.status_code == 200:
+        connectorType = getResponseEnvelope(response).get('connectorType')
+        if connectorType:
+            print ("Connector Type: " + connectorType.get('displayName'))
+            print ("    qualifiedName: " + connectorType.get('qualifiedName'))
+            print ("    description: " + connectorType.get('description'))
+            print ("    connectorProviderClassName: " + connectorType.get('connectorProviderClassName'))
+            if connectorType.get('supportedAssetTypeName'):
+                print ("    supportedAssetTypeName: " + connectorType.get('supportedAssetTypeName'))
+            if connectorType.get('expectedDataFormat'):
+                print ("    expectedDataFormat: " + connectorType.get('expectedDataFormat'))
+            recognizedConfigurationProperties = connectorType.get('recognizedConfigurationProperties')
+            if recognizedConfigurationProperties:
+                print ("    recognizedConfigurationProperties:")
+                for x in range(len(recognizedConfigurationProperties)):
+                    print ("        " + recognizedConfigurationProperties[x])
+            if connectorType.get('connectorInterfaceLanguage'):
+                print ("    connectorInterfaceLanguage: " + connectorType.get('connectorInterfaceLanguage'))
+            if connectorType.get('connectorFrameworkName'):
+                print ("    connectorFrameworkName: " + connectorType.get('connectorFrameworkName'))
+            connectorInterfaces = connectorType.get('connectorInterfaces')
+            if connectorInterfaces:
+                print ("    connectorInterfaces:")
+                for x in range(len(connectorInterfaces)):
+                    print ("        " + connectorInterfaces[x])
+            if connectorType.get('targetTechnologySource'):
+                print ("    targetTechnologySource: " + connectorType.get('targetTechnologySource'))
+            if connectorType.get('targetTechnologyName'):
+                print ("    targetTechnologyName: " + connectorType.get('targetTechnologyName'))
+        else:
+            prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+            print ("Response: ")
+            print (prettyResponse)
+    else:
+        prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+        print ("Response: ")
+        print (prettyResponse)
+    print (" ")    
+
+
+def queryKnownServers(serverPlatformName, serverPlatformURL):
+    print (" ")
+    print ("Querying the known servers on platform: " + serverPlatformName + " ...")
+    platformServicesURLRoot = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform"
+    url = platformServicesURLRoot + '/servers'
+    print ("GET " + url)
+    response = getPlatformSession(url).get(url)
+    prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+    print ("Response: ")
+    print (prettyResponse)
+    print (" ")
+
+def queryActiveServers(serverPlatformName, serverPlatformURL):
+    print (" ")
+    print ("Active servers on platform: " + serverPlatformName + " ...")
+    platformServicesURLRoot = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform"
+    url = platformServicesURLRoot + '/servers/active'
+    response = issueGet(url)
+
+    if response.status_code == 200:
+        servers = getResponseEnvelope(response).get('serverList')
+        if servers is not None:
+            print("  ", servers)
+        else:
+            print("no active servers")
+    else:
+        prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+        print ("Response: ")
+        print (prettyResponse)
+        print (" ")
+
+# Each server is configured to define which services should be active.  This configuration results in
+# the creation of a configuration document.  This document is read when the server is started and
+# drives the initialization of the services.
+
+def checkServerConfigured(serverName, serverPlatformName, serverPlatformURL):
+    isServerKnownOnPlatform = serverPlatformURL + "/open-metadata/admin-services/users/" + adminUserId + "/servers/" + serverName + "/configuration"
+    response = issueGet(isServerKnownOnPlatform)
+    if response.status_code == 200:
+        serverConfig=getResponseEnvelope(response).get('omagserverConfig')
+        if serverConfig is not None:
+            auditTrail = serverConfig.get('auditTrail')
+            if auditTrail is not None:
+                print("           ...", serverName, "is configured")
+                return True
+            else:
+                print("           ...", serverName, "needs configuring")
+        else:
+            print("   ...", serverPlatformName, "at", serverPlatformURL, "is down - unable to check server configuration")
+            return False
+
+
+# The OMAG Server Platform supports a call to return if a server is active.
+
+def checkServerActive(serverName, serverPlatformName, serverPlatformURL):
+    isServerActiveOnPlatform = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/servers/" + serverName + "/status"
+    response = issueGet(isServerActiveOnPlatform)
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            serverStatus = getResponseEnvelope(response).get('active')
+            if serverStatus == True:
+                print("           ...", serverName, "is active - ready to begin")
+            else:
+                print("           ...", serverName, "is down - needs to be started")
+            return serverStatus
+        else:
+            print("           ...", serverName, "is not known - needs to be started")
+        return False
+    else:
+        print("   ...", serverPlatformName, "at", serverPlatformURL, "is down - unable to check server configuration")
+        return False
+
+    
+# This is the call to start a server on a specific platform.  Once the server is running it is possible to
+# make use of the open metadata and governance services that have been activated in the server.
+
+def activateServerOnPlatform(serverName, serverPlatformName, serverPlatformURL):
+    print ("                Starting server " + serverName + " ...")
+    activateServerURL = serverPlatformURL + "/open-metadata/admin-services/users/" + adminUserId + '/servers/' + serverName + "/instance"
+    response = issuePost(activateServerURL, {})
+    if response.status_code == 200:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode == 200:
+            return True
+        else:
+            errorMessage = getResponseEnvelope(response).exceptionErrorMessage
+            print ("                   ..." + serverName + " failed to start")
+            print ("                       error message is: " + errorMessage)
+            printUnexpectedResponse(serverName,serverPlatformName,serverPlatformURL,response)
+            return False
+                
+    else:
+        print ("                   ..." + serverName + " failed to start")
+        printUnexpectedResponse(serverName,serverPlatformName,serverPlatformURL,response)
+        return False
+
+
+# Once a server is active, it is possible to query the services that are active.
+
+def getServerServices(serverName, serverPlatformName, serverPlatformURL):
+    getServerActiveServicesURL = serverPlatformURL + "/open-metadata/platform-services/users/" + adminUserId + "/server-platform/servers/" + serverName + "/services"
+    print ("Services for server:", serverName)
+    response = issueGet(getServerActiveServicesURL)
+    if response.status_code == 200:
+        serviceList = getResponseEnvelope(response).get('serverServicesList')
+        for x in range(len(serviceList)):
+            print (" * ", serviceList[x])
+    else:
+        print (response)
+
+# This function checks whether a server is active and starts it if it is down.
+
+def activateServerIfDown(serverName, serverPlatformName, serverPlatformURL):
+    print("        Checking OMAG Server " + serverName)
+    configured = checkServerConfigured(serverName, serverPlatformName, serverPlatformURL)
+    if configured == True:
+        active = checkServerActive(serverName, serverPlatformName, serverPlatformURL)
+        if active == False:
+            activateServerOnPlatform(serverName, serverPlatformName, serverPlatformURL)
+
+# This function checks the platform is running and ensures the servers are started on it.
+# It requests user action if either the platform is not running or the servers are not configured.
+# Otherwise it should return with all of the servers running.
+
+def activatePlatform(serverPlatformName, serverPlatformURL, hostedServerNames):
+    available = checkServerPlatform(serverPlatformName, serverPlatformURL)
+    if available == True:
+        for x in range(len(hostedServerNames)):
+            activateServerIfDown(hostedServerNames[x], serverPlatformName, serverPlatformURL)
+    else:
+        print(f"Server platform: {serverPlatformName} is not available")
+
+# This function checks the platform is running and (re)starts each of the requested servers.
+
+def reActivatePlatform(serverPlatformName, serverPlatformURL, hostedServerNames):
+    available = checkServerPlatform(serverPlatformName, serverPlatformURL)
+    if available == True:
+        for x in range(len(hostedServerNames)):
+            activateServerOnPlatform(hostedServerNames[x], serverPlatformName, serverPlatformURL)
+        return True
+    else:
+        print(f"Server platform: {serverPlatformName} is not available")
+        return False
@@ -0,0 +1,653 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Issuing REST calls to the OMAG Server Platforms through pooled sessions, recording metrics about them, decoding
+their responses and processing the errors they return.
+
+"""
+
+import codecs
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+
+#
+# Disable certificate checking for local development use with self-signed certificate 
+#
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+os.environ['CURL_CA_BUNDLE'] = ''
+
+#
+# Flag to enable debug, this cases extra information to be printed including rest calls request and response details
+# Switching this flag to True produces a very large amount of output and is not recommended.
+# A targeted use of this flag is recommended, set this before and reset this after the code you would like to produce debug
+#
+isDebug = False
+
+#
+# Response envelopes.  Every Egeria response body is a JSON object holding the relatedHTTPCode, the exception fields
+# when the request failed, and the payload under a name that depends on the service ('element', 'elementList',
+# 'guid' ...).  getResponseEnvelope decodes the body once and keeps the envelope on the response, so the wrappers
+# can check the relatedHTTPCode, print the error and extract the payload without decoding the body again.
+# orjson is used to decode the body when it is installed.  encodeJSON returns compact JSON as bytes.
+# encodeStoredJSON does the same for JSON that is kept for a long time: the bytes orjson returns have about 1KB of
+# spare capacity at the end, so they are copied to bytes of the right size.  The bytes json.dumps returns do not, so
+# without orjson it is encodeJSON.
+#
+
+try:
+    import orjson
+    decodeJSON = orjson.loads
+    encodeJSON = orjson.dumps
+
+    def encodeStoredJSON(value):
+        return bytes(memoryview(orjson.dumps(value)))
+except ImportError:
+    orjson = None
+    decodeJSON = json.loads
+
+    def encodeJSON(value):
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+    encodeStoredJSON = encodeJSON
+
+class ResponseEnvelope:
+    __slots__ = ('statusCode', 'body', 'relatedHTTPCode', 'exceptionErrorMessage', 'exceptionSystemAction',
+                 'exceptionUserAction')
+
+    def __init__(self, statusCode, body):
+        self.statusCode = statusCode
+        self.body = body
+        if not isinstance(body, dict):
+            body = {}
+        self.relatedHTTPCode = body.get('relatedHTTPCode')
+        self.exceptionErrorMessage = body.get('exceptionErrorMessage')
+        self.exceptionSystemAction = body.get('exceptionSystemAction')
+        self.exceptionUserAction = body.get('exceptionUserAction')
+
+    # True when both the platform and the server report success.
+    def isOK(self):
+        return self.statusCode == 200 and self.relatedHTTPCode == 200
+
+    # Return a field of the payload, for example envelope.get('elementList').
+    def get(self, name, default=None):
+        if isinstance(self.body, dict):
+            return self.body.get(name, default)
+        return default
+
+# Raises ValueError if the body is not JSON, as response.json() does.
+def getResponseEnvelope(response):
+    envelope = getattr(response, 'egeriaEnvelope', None)
+    if envelope is None:
+        envelope = ResponseEnvelope(response.status_code, decodeJSON(response.content))
+        response.egeriaEnvelope = envelope
+    return envelope
+
+#
+# Common processing of REST API errors.
+#
+
+def printResponse(response):
+    prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+    print(" ")
+    print("Response: ")
+    print(prettyResponse)
+    print(" ")
+    
+def printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response):
+    if response.status_code == 200:
+        envelope = getResponseEnvelope(response)
+        if envelope.relatedHTTPCode == 200:
+            print("Unexpected response from server " + serverName)
+            printResponse(response)
+        else:
+            exceptionErrorMessage = envelope.exceptionErrorMessage
+            exceptionSystemAction = envelope.exceptionSystemAction
+            exceptionUserAction   = envelope.exceptionUserAction
+            if exceptionErrorMessage != None:
+                print(exceptionErrorMessage)
+                print(" * " + exceptionSystemAction)
+                print(" * " + exceptionUserAction)
+            else:
+                print("Unexpected response from server " + serverName)
+                printResponse(response)
+    else:
+        print("Unexpected response from server platform " + serverPlatformName + " at " + serverPlatformURL)
+        printResponse(response)
+
+#
+# Connection pooling.  Each server platform (scheme, host and port) gets its own requests session so that
+# the TCP connection - and the TLS handshake with the platform's self-signed certificate - is reused across
+# calls rather than set up again for every request.  The pool sizes can be changed with configurePlatformSessions.
+#
+platformPoolConnections = 4
+platformPoolMaxSize = 16
+platformSessions = {}
+platformSessionsLock = threading.Lock()
+
+def getPlatformSession(url):
+    urlParts = urlsplit(url)
+    platformKey = urlParts.scheme + '://' + urlParts.netloc
+    with platformSessionsLock:
+        session = platformSessions.get(platformKey)
+        if session == None:
+            session = requests.Session()
+            session.verify = False
+            session.headers.update({'Accept-Encoding' : 'gzip, deflate', 'Connection' : 'keep-alive'})
+            adapter = HTTPAdapter(pool_connections=platformPoolConnections, pool_maxsize=platformPoolMaxSize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.request = getInstrumentedRequest(session.request)
+            platformSessions[platformKey] = session
+    return session
+
+def closePlatformSessions():
+    with platformSessionsLock:
+        for session in platformSessions.values():
+            session.close()
+        platformSessions.clear()
+
+# New pool sizes only apply to sessions created afterwards, so the existing sessions are closed.
+def configurePlatformSessions(poolConnections=4, poolMaxSize=16):
+    global platformPoolConnections, platformPoolMaxSize
+    closePlatformSessions()
+    platformPoolConnections = poolConnections
+    platformPoolMaxSize = poolMaxSize
+
+#
+# REST call metrics.  Every call made through the platform sessions is timed and recorded against its method and
+# endpoint template - the URL path with GUIDs and the user id replaced by placeholders - so calls to the same service
+# group together.  For each endpoint the number of calls, HTTP status codes, relatedHTTPCodes, response bytes and a
+# histogram of latencies are kept in memory.  The histogram buckets are log-linear, as in an HDR histogram, so
+# percentiles are accurate to within restCallHistogramPrecision (about 1.6%) from microseconds to minutes.
+# Use printRestCallStatistics to see which services are slow, and exportRestCallMetricsPrometheus or
+# exportRestCallMetricsJSONL to save the metrics.  Set restCallMetricsEnabled to False to turn recording off.
+#
+
+restCallMetricsEnabled = True
+restCallHistogramSubBuckets = 128
+restCallHistogramPrecision = 2 / restCallHistogramSubBuckets
+restCallStatistics = {}
+restCallStatisticsLock = threading.Lock()
+restCallPrometheusBuckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+restCallGUIDPattern = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+restCallUserPattern = re.compile(r'/users/[^/]+')
+restCallRelatedHTTPCodePattern = re.compile(rb'"relatedHTTPCode"\s*:\s*(\d+)')
+
+def getEndpointTemplate(url):
+    path = urlsplit(url).path
+    path = restCallGUIDPattern.sub('{guid}', path)
+    return restCallUserPattern.sub('/users/{userId}', path)
+
+# Histogram bucket for a latency in microseconds.  Values below restCallHistogramSubBuckets have a bucket each; above
+# that each power of two is split into restCallHistogramSubBuckets/2 equal buckets.
+def getHistogramIndex(value):
+    if value < restCallHistogramSubBuckets:
+        return value
+    halfBuckets = restCallHistogramSubBuckets // 2
+    shift = value.bit_length() - restCallHistogramSubBuckets.bit_length() + 1
+    return shift * halfBuckets + (value >> shift)
+
+# The range of latencies (in microseconds) recorded in a histogram bucket.
+def getHistogramBucketRange(index):
+    if index < restCallHistogramSubBuckets:
+        return index, index
+    halfBuckets = restCallHistogramSubBuckets // 2
+    shift = index // halfBuckets - 1
+    top = index - shift * halfBuckets
+    return top << shift, ((top + 1) << shift) - 1
+
+def getHistogramPercentile(histogram, count, percentile):
+    threshold = count * percentile / 100
+    seen = 0
+    for index in sorted(histogram):
+        seen = seen + histogram[index]
+        if seen >= threshold:
+            lowest, highest = getHistogramBucketRange(index)
+            return (lowest + highest) / 2 / 1000000
+    return 0
+
+def getRelatedHTTPCode(response):
+    # The relatedHTTPCode is near the start of Egeria's responses so the body does not need to be parsed
+    match = restCallRelatedHTTPCodePattern.search(response.content, 0, 256) or restCallRelatedHTTPCodePattern.search(response.content)
+    if match:
+        return int(match.group(1))
+    return None
+
+# The body of a streamed response has not been read when the call is recorded, so its relatedHTTPCode is not known
+# and its size is taken from the Content-Length header, when there is one.
+def recordRestCall(method, url, response, elapsedTime, streamed=False):
+    if response is not None and streamed:
+        statusCode = response.status_code
+        relatedHTTPCode = None
+        responseBytes = int(response.headers.get('Content-Length') or 0)
+    elif response is not None:
+        statusCode = response.status_code
+        relatedHTTPCode = getRelatedHTTPCode(response)
+        responseBytes = len(response.content)
+    else:
+        statusCode = "exception"
+        relatedHTTPCode = None
+        responseBytes = 0
+    latency = int(elapsedTime * 1000000)
+    statisticsKey = (method.upper(), getEndpointTemplate(url))
+    with restCallStatisticsLock:
+        statistics = restCallStatistics.get(statisticsKey)
+        if statistics is None:
+            statistics = {"count" : 0, "errors" : 0, "totalTime" : 0.0, "maxTime" : 0.0, "responseBytes" : 0,
+                          "statusCodes" : {}, "relatedHTTPCodes" : {}, "histogram" : {}}
+            restCallStatistics[statisticsKey] = statistics
+        statistics["count"] += 1
+        if statusCode != 200 or relatedHTTPCode not in (None, 200):
+            statistics["errors"] += 1
+        statistics["totalTime"] += elapsedTime
+        statistics["maxTime"] = max(statistics["maxTime"], elapsedTime)
+        statistics["responseBytes"] += responseBytes
+        statistics["statusCodes"][statusCode] = statistics["statusCodes"].get(statusCode, 0) + 1
+        if relatedHTTPCode is not None:
+            statistics["relatedHTTPCodes"][relatedHTTPCode] = statistics["relatedHTTPCodes"].get(relatedHTTPCode, 0) + 1
+        histogramIndex = getHistogramIndex(latency)
+        statistics["histogram"][histogramIndex] = statistics["histogram"].get(histogramIndex, 0) + 1
+
+def getInstrumentedRequest(request):
+    def instrumentedRequest(method, url, *args, **kwargs):
+        lastRestCalls.response = None
+        lastRestCalls.streamed = kwargs.get('stream', False)
+        if not restCallMetricsEnabled:
+            response = request(method, url, *args, **kwargs)
+            lastRestCalls.response = response
+            return response
+        response = None
+        startTime = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+            lastRestCalls.response = response
+            return response
+        finally:
+            recordRestCall(method, url, response, time.perf_counter() - startTime, kwargs.get('stream', False))
+    return instrumentedRequest
+
+#
+# The last call made by each thread.  Most functions print an error and return None when a call fails, so a caller
+# that wants to retry uses isTransientRestFailure(getLastRestResponse()) to tell a failure worth retrying - no
+# response at all (a connection error or timeout), a request timeout, too many requests or a server side error - from
+# a permanent one such as an invalid parameter or an unauthorized user.
+#
+lastRestCalls = threading.local()
+
+def getLastRestResponse():
+    return getattr(lastRestCalls, "response", None)
+
+def isTransientRestFailure(response):
+    if response is None:
+        return True
+    if response.status_code in (408, 429) or response.status_code >= 500:
+        return True
+    if response is getLastRestResponse() and getattr(lastRestCalls, "streamed", False):
+        # The body of a streamed response may already have been read, so its relatedHTTPCode is not checked
+        return False
+    relatedHTTPCode = getRelatedHTTPCode(response)
+    return relatedHTTPCode is not None and relatedHTTPCode >= 500
+
+def resetRestCallStatistics():
+    with restCallStatisticsLock:
+        restCallStatistics.clear()
+
+# A summary of each endpoint's calls (times in seconds), slowest total time first.
+def getRestCallStatistics():
+    with restCallStatisticsLock:
+        snapshot = [(key, dict(statistics, histogram=dict(statistics["histogram"]))) for key, statistics in restCallStatistics.items()]
+    summaries = []
+    for (method, endpoint), statistics in snapshot:
+        count = statistics["count"]
+        summaries.append({
+            "method" : method,
+            "endpoint" : endpoint,
+            "count" : count,
+            "errors" : statistics["errors"],
+            "totalTime" : statistics["totalTime"],
+            "meanTime" : statistics["totalTime"] / count,
+            "p50" : getHistogramPercentile(statistics["histogram"], count, 50),
+            "p90" : getHistogramPercentile(statistics["histogram"], count, 90),
+            "p99" : getHistogramPercentile(statistics["histogram"], count, 99),
+            "maxTime" : statistics["maxTime"],
+            "responseBytes" : statistics["responseBytes"],
+            "statusCodes" : statistics["statusCodes"],
+            "relatedHTTPCodes" : statistics["relatedHTTPCodes"],
+            "histogram" : statistics["histogram"]
+        })
+    return sorted(summaries, key=lambda summary: summary["totalTime"], reverse=True)
+
+def printRestCallStatistics(top=20):
+    summaries = getRestCallStatistics()
+    if not summaries:
+        print("No REST calls recorded")
+        return
+    print("{:>7} {:>6} {:>9} {:>9} {:>9} {:>9} {:>11}  {}".format("Calls", "Errors", "p50 ms", "p90 ms", "p99 ms", "Max ms", "KB", "Endpoint"))
+    for summary in summaries[:top]:
+        print("{:>7} {:>6} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>11.1f}  {} {}".format(
+            summary["count"], summary["errors"], summary["p50"] * 1000, summary["p90"] * 1000, summary["p99"] * 1000,
+            summary["maxTime"] * 1000, summary["responseBytes"] / 1024, summary["method"], summary["endpoint"]))
+    if len(summaries) > top:
+        print("... and " + str(len(summaries) - top) + " more endpoints")
+
+def getPrometheusLabels(summary, **labels):
+    labels = dict({"method" : summary["method"], "endpoint" : summary["endpoint"]}, **labels)
+    return ",".join(name + '="' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+                    for name, value in labels.items())
+
+# Return the metrics in the Prometheus text exposition format, and write them to fileName if it is given.
+def exportRestCallMetricsPrometheus(fileName=None):
+    lines = ["# HELP egeria_rest_call_duration_seconds Latency of REST calls to the OMAG Server Platforms.",
+             "# TYPE egeria_rest_call_duration_seconds histogram"]
+    summaries = getRestCallStatistics()
+    for summary in summaries:
+        # A histogram bucket is counted under a Prometheus bucket once all of its range is below the bound
+        bucketCounts = [0] * len(restCallPrometheusBuckets)
+        for index, count in summary["histogram"].items():
+            highest = getHistogramBucketRange(index)[1] / 1000000
+            for position, bound in enumerate(restCallPrometheusBuckets):
+                if highest <= bound:
+                    bucketCounts[position] += count
+                    break
+        cumulativeCount = 0
+        for bound, count in zip(restCallPrometheusBuckets, bucketCounts):
+            cumulativeCount = cumulativeCount + count
+            lines.append("egeria_rest_call_duration_seconds_bucket{" + getPrometheusLabels(summary, le=bound) + "} " + str(cumulativeCount))
+        lines.append("egeria_rest_call_duration_seconds_bucket{" + getPrometheusLabels(summary, le="+Inf") + "} " + str(summary["count"]))
+        lines.append("egeria_rest_call_duration_seconds_sum{" + getPrometheusLabels(summary) + "} " + repr(summary["totalTime"]))
+        lines.append("egeria_rest_call_duration_seconds_count{" + getPrometheusLabels(summary) + "} " + str(summary["count"]))
+    lines.append("# HELP egeria_rest_calls_total REST calls by HTTP status code.")
+    lines.append("# TYPE egeria_rest_calls_total counter")
+    for summary in summaries:
+        for statusCode, count in summary["statusCodes"].items():
+            lines.append("egeria_rest_calls_total{" + getPrometheusLabels(summary, status=statusCode) + "} " + str(count))
+    lines.append("# HELP egeria_rest_related_http_code_total REST call responses by relatedHTTPCode.")
+    lines.append("# TYPE egeria_rest_related_http_code_total counter")
+    for summary in summaries:
+        for relatedHTTPCode, count in summary["relatedHTTPCodes"].items():
+            lines.append("egeria_rest_related_http_code_total{" + getPrometheusLabels(summary, related_http_code=relatedHTTPCode) + "} " + str(count))
+    lines.append("# HELP egeria_rest_call_response_bytes_total Size of the REST call responses.")
+    lines.append("# TYPE egeria_rest_call_response_bytes_total counter")
+    for summary in summaries:
+        lines.append("egeria_rest_call_response_bytes_total{" + getPrometheusLabels(summary) + "} " + str(summary["responseBytes"]))
+    metrics = "\n".join(lines) + "\n"
+    if fileName:
+        with open(fileName, 'w') as metricsFile:
+            metricsFile.write(metrics)
+    return metrics
+
+# Append one line of JSON for each endpoint to fileName.  The histogram maps the lowest latency of each bucket, in
+# microseconds, to the number of calls in the bucket.
+def exportRestCallMetricsJSONL(fileName):
+    exportTime = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    with open(fileName, 'a') as metricsFile:
+        for summary in getRestCallStatistics():
+            record = dict(summary, time=exportTime,
+                          statusCodes={str(code) : count for code, count in summary["statusCodes"].items()},
+                          relatedHTTPCodes={str(code) : count for code, count in summary["relatedHTTPCodes"].items()},
+                          histogram={str(getHistogramBucketRange(index)[0]) : count for index, count in sorted(summary["histogram"].items())})
+            metricsFile.write(json.dumps(record) + "\n")
+
+#
+# Rest calls, these functions issue rest calls and print debug if required.
+# 
+def issuePostNoBody(url):
+    if (isDebug):
+        printRestRequest("POST " + url)
+    jsonHeader = {'content-type':'application/json'}
+    response=getPlatformSession(url).post(url, json=None, headers=None)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+def issuePost(url, body):
+    if (isDebug):
+        printRestRequest("POST " + url)
+        printRestRequestBody(body)
+    jsonHeader = {'content-type':'application/json'}
+    response=getPlatformSession(url).post(url, json=body, headers=jsonHeader)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+def issueDataPost(url, body):
+    if (isDebug):
+        printRestRequest("POST " + url)
+        printRestRequestBody(body)
+    jsonHeader = {'content-type':'text/plain'}
+    response=getPlatformSession(url).post(url, data=body)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+def issueDelete(url):
+    if (isDebug):
+        printRestRequest("DELETE " + url)
+    response=getPlatformSession(url).delete(url, json=None, headers=None)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+def issuePut(url, body):
+    if (isDebug):
+        printRestRequest("PUT " + url)
+        printRestRequestBody(body)
+    jsonHeader = {'content-type':'application/json'}
+    response=getPlatformSession(url).put(url, json=body, headers=jsonHeader)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+def issueGet(url):
+    if (isDebug):
+        printRestRequest("GET " + url)
+    jsonHeader = {'content-type':'application/json'}
+    response=getPlatformSession(url).get(url, headers=jsonHeader)
+    if (isDebug):
+        printRestResponse(response) 
+    return response
+
+#
+# Streaming responses.  A request for a large list - a search with an unlimited page size, for example - can return
+# many megabytes.  Normally the whole body is read into memory and then decoded into one large object before the first
+# element can be used.  The streaming versions of the rest calls read the body from the connection as it is used, and
+# streamResponseElements decodes the list in the response (elementList, list, elements ...) one element at a time,
+# yielding each element as soon as it has been read.  Only the element being decoded is held in memory, however long
+# the list is.  The other fields of the response are kept in its envelope (see getResponseEnvelope) so the
+# relatedHTTPCode and any error can be checked once the list has been read.
+#
+
+streamChunkSize = 65536
+streamDecoder = json.JSONDecoder()
+streamWhitespacePattern = re.compile(r'[ \t\n\r]*')
+streamNumberEndPattern = re.compile(r'[0-9.eE+-]*')
+
+def issueStreamingPost(url, body):
+    if (isDebug):
+        printRestRequest("POST (streamed) " + url)
+        printRestRequestBody(body)
+    jsonHeader = {'content-type':'application/json'}
+    return getPlatformSession(url).post(url, json=body, headers=jsonHeader, stream=True)
+
+def issueStreamingGet(url):
+    if (isDebug):
+        printRestRequest("GET (streamed) " + url)
+    jsonHeader = {'content-type':'application/json'}
+    return getPlatformSession(url).get(url, headers=jsonHeader, stream=True)
+
+class ResponseStream:
+    __slots__ = ('chunks', 'textDecoder', 'text', 'position', 'finished')
+
+    def __init__(self, response):
+        self.chunks = response.iter_content(chunk_size=streamChunkSize)
+        self.textDecoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.position = 0
+        self.finished = False
+
+    # Read at least minimumLength more characters, if there are that many left.  Returns False at the end of the body.
+    def readMore(self, minimumLength=1):
+        if self.finished:
+            return False
+        newText = []
+        newLength = 0
+        for chunk in self.chunks:
+            newText.append(self.textDecoder.decode(chunk))
+            newLength = newLength + len(newText[-1])
+            if newLength >= minimumLength:
+                break
+        else:
+            newText.append(self.textDecoder.decode(b'', final=True))
+            self.finished = True
+        # The text that has already been decoded is dropped
+        self.text = self.text[self.position:] + ''.join(newText)
+        self.position = 0
+        return newLength > 0
+
+    def peekCharacter(self):
+        while True:
+            self.position = streamWhitespacePattern.match(self.text, self.position).end()
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self.readMore():
+                raise ValueError("The response ended before the end of the JSON")
+
+    def readCharacter(self):
+        character = self.peekCharacter()
+        self.position = self.position + 1
+        return character
+
+    def readValue(self):
+        self.peekCharacter()
+        while True:
+            try:
+                value, end = streamDecoder.raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                # The value is not all here yet.  Reading at least as much again as is waiting keeps the work linear
+                # however large the value is.
+                if not self.readMore(len(self.text) - self.position):
+                    raise
+                continue
+            # A number at the end of the text may continue in the next chunk
+            if (type(value) in (int, float) and streamNumberEndPattern.fullmatch(self.text, end)
+                    and self.readMore()):
+                continue
+            self.position = end
+            return value
+
+    def expectCharacter(self, expected):
+        character = self.readCharacter()
+        if character not in expected:
+            raise ValueError("Expected " + " or ".join(expected) + " in the response but found " + character)
+        return character
+
+# Yield the elements of the list called arrayName in a response as they are decoded.  Once the response has been read,
+# its other fields are in its envelope.  If the response reports an error before the list, the list is not yielded.
+def iterateResponseElements(response, arrayName):
+    stream = ResponseStream(response)
+    fields = {}
+    stream.expectCharacter('{')
+    if stream.peekCharacter() == '}':
+        stream.readCharacter()
+    else:
+        while True:
+            name = stream.readValue()
+            stream.expectCharacter(':')
+            if name == arrayName and fields.get('relatedHTTPCode', 200) == 200 and stream.peekCharacter() == '[':
+                stream.readCharacter()
+                if stream.peekCharacter() == ']':
+                    stream.readCharacter()
+                else:
+                    while True:
+                        yield stream.readValue()
+                        if stream.expectCharacter(',]') == ']':
+                            break
+            else:
+                fields[name] = stream.readValue()
+            if stream.expectCharacter(',}') == '}':
+                break
+    response.egeriaEnvelope = ResponseEnvelope(response.status_code, fields)
+
+# Yield the elements of a streamed response and print the error if the request failed.  The response is closed when
+# the elements have been read, or when the caller stops reading them.
+def streamResponseElements(serverName, serverPlatformName, serverPlatformURL, response, arrayName):
+    try:
+        if response.status_code == 200:
+            yield from iterateResponseElements(response, arrayName)
+            if getResponseEnvelope(response).relatedHTTPCode == 200:
+                return
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    finally:
+        response.close()
+
+def printRestRequest(url):
+    print (" ")
+    print (url)
+    
+def printRestRequestBody(body):   
+    prettyBody = json.dumps(body, indent=4)
+    print (prettyBody)
+    print (" ")
+    
+def printRestResponse(response): 
+    print ("Returns:")
+    prettyResponse = json.dumps(getResponseEnvelope(response).body, indent=4)
+    print (prettyResponse)
+    print (" ")
+
+def processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response):
+    if response.status_code != 200:
+        printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    else:
+        relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+        if relatedHTTPCode != 200:
+             printUnexpectedResponse(serverName, serverPlatformName, serverPlatformURL, response)
+    return []
+
+def postAndPrintResult(url, json=None, headers=None):
+    print("   ...... (POST", url, ")")
+    response = getPlatformSession(url).post(url, json=json, headers=headers)
+    if response.status_code == 200:
+        print("   ...... Success. Response: ", getResponseEnvelope(response).body)
+        return True
+    else:
+        print("   ...... Failed. Response: ", getResponseEnvelope(response).body)
+        return False
+
+def getAndPrintResult(url, json=None, headers=None):
+    print("   ...... (GET", url, ")")
+    response = getPlatformSession(url).get(url, json=json, headers=headers)
+    if response.status_code == 200:
+        print("   ...... Success. Response: ", getResponseEnvelope(response).body)
+        return True
+    else:
+        print("   ...... Failed. Response: ", getResponseEnvelope(response).body)
+        return False
+
+def getResult(url, json=None, headers=None):
+    print("\n   ...... (GET", url, ")")
+    try:
+        response = getPlatformSession(url).get(url, json=json, headers=headers)
+        if response.status_code == 200:
+            if getResponseEnvelope(response).relatedHTTPCode == 200:
+                return getResponseEnvelope(response).body
+        return None
+    except requests.exceptions.RequestException as e:
+        print ("   ...... FAILED - http request threw an exception: ", e)
+        return None
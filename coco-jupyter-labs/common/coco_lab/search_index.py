@@ -0,0 +1,429 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Local search indexes over the terms of a glossary or the assets in a zone, so that interactive searches are answered
+in the notebook rather than by the server.
+
+"""
+
+import bisect
+import heapq
+import os
+import re
+import time
+
+from .concurrency import iteratePages
+from .elements import AssetElement, GlossaryTermElement
+from .rest import decodeJSON, encodeJSON, getResponseEnvelope, issuePost, processErrorResponse
+
+
+#
+# Search indexes.  findGlossaryTerms and the asset searches send a regular expression to the server for every search,
+# so each keystroke of an interactive search costs a round trip and a scan of the repository.  A search index pulls
+# the terms of one glossary, or the assets of one zone, once (page by page) and indexes them in the notebook:
+#
+#   - each element's names and descriptions are split into lower case tokens, and each token maps to the elements
+#     that contain it along with the weight of the best field it appears in (display names count most),
+#   - the tokens are also kept sorted so a prefix query is a binary search,
+#   - the display names are indexed by trigram (each run of three characters) for substring queries.
+#
+# The elements themselves are kept as compact records (see coco_lab.elements).  searchIndex answers "token" queries
+# (every word of the query is a whole word of the element), "prefix" queries (every word of the query starts a word of
+# the element - the usual search-as-you-type) and "substring" queries (the query appears anywhere in the display
+# name), and ranks the results: exact and leading matches on the display name first, then by the weight of the fields
+# that matched, then shorter names first.
+#
+# refreshSearchIndex brings an index up to date, but it is not an incremental query.  The glossary term and asset
+# search endpoints cannot be asked for the elements updated since a time, and they do not return deleted elements, so
+# every refresh pages through the whole glossary or zone again, exactly as much server work as building the index.
+# What it saves is the notebook's work: it compares each element's update time and version with the ones already
+# indexed, re-indexes only the elements that are new or have changed, and drops the ones that were not returned.  If
+# any page fails the index is left as it was rather than losing the elements it did not see.  Refresh when the server
+# is quiet, or raise searchIndexMaxAge, rather than before each search.
+#
+# saveSearchIndex and loadSearchIndex keep an index on disk between sessions.  getGlossarySearchIndex and
+# getAssetSearchIndex load an index from its file if there is one (refreshing it if it is older than
+# searchIndexMaxAge seconds), otherwise build it, and keep it in searchIndexes for the rest of the session.  For
+# example:
+#
+#     termIndex = getGlossarySearchIndex(cocoMDS2Name, cocoMDS2PlatformName, cocoMDS2PlatformURL, erinsUserId,
+#                                        glossaryGUID, "coco-glossary.index.json")
+#     printTermSummaries(searchIndex(termIndex, "clin tri", "prefix"))
+#
+
+searchIndexVersion = 1
+
+# Seconds after which getGlossarySearchIndex and getAssetSearchIndex refresh an index they have loaded from a file
+# (None never refreshes automatically).
+searchIndexMaxAge = 3600
+
+# The number of elements requested in each page when building or refreshing an index.
+searchIndexPageSize = None
+
+# The fields that are indexed for each kind of index, with the weight of a token found in each of them.
+searchIndexFields = {
+    "glossaryTerms" : ("glossaryTermProperties", (("displayName", 8), ("abbreviation", 6), ("qualifiedName", 3),
+                                                  ("summary", 2), ("description", 1))),
+    "assets" : ("assetProperties", (("displayName", 8), ("name", 8), ("qualifiedName", 3), ("description", 1)))
+}
+
+searchIndexRecordClasses = {
+    "glossaryTerms" : GlossaryTermElement,
+    "assets" : AssetElement
+}
+
+# Indexes used in this session, keyed by platform, server, user, kind and glossary GUID or zone.
+searchIndexes = {}
+
+tokenPattern = re.compile(r'[0-9a-z]+')
+
+def getSearchTokens(text):
+    if not text:
+        return []
+    return tokenPattern.findall(text.lower())
+
+def getTrigrams(text):
+    return {text[position:position + 3] for position in range(len(text) - 2)}
+
+
+def newSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, kind, scope):
+    return {
+        "serverName" : serverName,
+        "serverPlatformName" : serverPlatformName,
+        "serverPlatformURL" : serverPlatformURL,
+        "userId" : userId,
+        "kind" : kind,
+        "scope" : scope,
+        "refreshTime" : None,
+        "elements" : {},
+        "versions" : {},
+        "names" : {},
+        "tokens" : {},
+        "trigrams" : {},
+        "sortedTokens" : None
+    }
+
+def getSearchIndexKey(serverName, serverPlatformURL, userId, kind, scope):
+    return (serverPlatformURL, serverName, userId, kind, scope)
+
+def getElementProperties(index, element):
+    propertiesName = searchIndexFields[index["kind"]][0]
+    properties = element.get(propertiesName)
+    if properties is None and propertiesName == "assetProperties":
+        properties = element.get("properties")
+    return properties
+
+def getElementVersionKey(element):
+    elementHeader = element.get('elementHeader')
+    versions = elementHeader.get('versions') if elementHeader else None
+    if not versions:
+        return None
+    return (versions.get('updateTime') or versions.get('createTime'), versions.get('version'))
+
+def addToSearchIndex(index, guid, element, versionKey):
+    index["elements"][guid] = element
+    index["versions"][guid] = versionKey
+    properties = getElementProperties(index, element)
+    if not properties:
+        return
+    tokens = index["tokens"]
+    for fieldName, weight in searchIndexFields[index["kind"]][1]:
+        for token in getSearchTokens(properties.get(fieldName)):
+            postings = tokens.get(token)
+            if postings is None:
+                tokens[token] = {guid : weight}
+                index["sortedTokens"] = None
+            elif postings.get(guid, 0) < weight:
+                postings[guid] = weight
+    name = properties.get('displayName') or properties.get('name')
+    if name:
+        name = name.lower()
+        index["names"][guid] = name
+        trigrams = index["trigrams"]
+        for trigram in getTrigrams(name):
+            trigrams.setdefault(trigram, set()).add(guid)
+
+def removeFromSearchIndex(index, guid):
+    element = index["elements"].pop(guid, None)
+    index["versions"].pop(guid, None)
+    name = index["names"].pop(guid, None)
+    if element is None:
+        return
+    properties = getElementProperties(index, element)
+    if properties:
+        tokens = index["tokens"]
+        for fieldName, weight in searchIndexFields[index["kind"]][1]:
+            for token in getSearchTokens(properties.get(fieldName)):
+                postings = tokens.get(token)
+                if postings is not None:
+                    postings.pop(guid, None)
+                    if not postings:
+                        del tokens[token]
+                        index["sortedTokens"] = None
+    if name:
+        trigrams = index["trigrams"]
+        for trigram in getTrigrams(name):
+            guids = trigrams.get(trigram)
+            if guids is not None:
+                guids.discard(guid)
+                if not guids:
+                    del trigrams[trigram]
+
+
+#
+# Retrieving the elements of an index.  Each page is checked, and failed is set if any page returns an error so that
+# the refresh knows it has not seen every element.
+#
+# The Asset Owner OMAS search has no zone parameter.  Its SearchStringRequestBody only carries the search string, and
+# the zones a server searches are fixed by the supportedZones option in the server's configuration.  So an index for
+# one zone pages through every asset the server returns and keeps the ones whose zoneMembership includes the zone.
+# For a large catalog, build the zone's index from a server whose Asset Owner OMAS supportedZones is just that zone,
+# or build one index with zone None and use it for all zones.
+#
+def iterateSearchIndexSource(index, failed):
+    serverName = index["serverName"]
+    serverPlatformName = index["serverPlatformName"]
+    serverPlatformURL = index["serverPlatformURL"]
+    userId = index["userId"]
+    servicesURL = serverPlatformURL + '/servers/' + serverName + '/open-metadata/access-services/'
+    if index["kind"] == "glossaryTerms":
+        searchURL = servicesURL + 'asset-manager/users/' + userId + '/glossaries/terms/by-search-string'
+        searchBody = {
+            "class" : "GlossarySearchStringRequestBody",
+            "searchString" : ".*",
+            "glossaryGUID" : index["scope"]
+        }
+        arrayName = 'elementList'
+    else:
+        searchURL = servicesURL + 'asset-owner/users/' + userId + '/assets/by-search-string'
+        searchBody = {
+            "class" : "SearchStringRequestBody",
+            "searchString" : ".*"
+        }
+        arrayName = 'assets'
+
+    def retrievePage(startFrom, pageSize):
+        try:
+            response = issuePost(searchURL + '?startFrom=' + str(startFrom) + '&pageSize=' + str(pageSize), searchBody)
+            if response.status_code == 200:
+                relatedHTTPCode = getResponseEnvelope(response).relatedHTTPCode
+                if relatedHTTPCode == 200:
+                    return getResponseEnvelope(response).get(arrayName) or []
+            processErrorResponse(serverName, serverPlatformName, serverPlatformURL, response)
+        except Exception as error:
+            print("Exception: %s" % error)
+            print("Platform " + serverPlatformName + " (" + serverPlatformURL + ") is returning an error")
+        failed.append(startFrom)
+        return None
+
+    zone = index["scope"] if index["kind"] == "assets" else None
+    for element in iteratePages(retrievePage, 0, searchIndexPageSize):
+        if element is None:
+            continue
+        if zone:
+            properties = element.get('assetProperties') or element.get('properties') or {}
+            if zone not in (properties.get('zoneMembership') or ()):
+                continue
+        yield element
+
+
+# Returns the number of elements added, updated and removed, or None if the elements could not all be retrieved.
+def refreshSearchIndex(index):
+    recordClass = searchIndexRecordClasses[index["kind"]]
+    versions = index["versions"]
+    failed = []
+    seen = set()
+    added = 0
+    updated = 0
+    refreshTime = time.time()
+    for element in iterateSearchIndexSource(index, failed):
+        elementHeader = element.get('elementHeader')
+        guid = elementHeader.get('guid') if elementHeader else None
+        if not guid:
+            continue
+        seen.add(guid)
+        versionKey = getElementVersionKey(element)
+        if guid in versions:
+            if versionKey is not None and versions[guid] == versionKey:
+                continue
+            removeFromSearchIndex(index, guid)
+            updated = updated + 1
+        else:
+            added = added + 1
+        addToSearchIndex(index, guid, recordClass(element), versionKey)
+    if failed:
+        print("The search index is incomplete: " + str(added) + " elements added and " + str(updated) + " updated before the error")
+        return None
+    removedGUIDs = [guid for guid in index["elements"] if guid not in seen]
+    for guid in removedGUIDs:
+        removeFromSearchIndex(index, guid)
+    index["refreshTime"] = refreshTime
+    return (added, updated, len(removedGUIDs))
+
+def buildSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, kind, scope):
+    index = newSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, kind, scope)
+    refreshSearchIndex(index)
+    return index
+
+
+#
+# Saving and loading.  The file holds the elements with their settings; the tokens and trigrams are rebuilt when it
+# is loaded.  The file is written to a temporary file first and then renamed so a failed save never leaves a
+# half written index behind.
+#
+def saveSearchIndex(index, fileName):
+    savedIndex = {
+        "searchIndexVersion" : searchIndexVersion,
+        "serverName" : index["serverName"],
+        "serverPlatformName" : index["serverPlatformName"],
+        "serverPlatformURL" : index["serverPlatformURL"],
+        "userId" : index["userId"],
+        "kind" : index["kind"],
+        "scope" : index["scope"],
+        "refreshTime" : index["refreshTime"],
+        "elements" : [element.toDict() for element in index["elements"].values()]
+    }
+    temporaryFileName = fileName + '.tmp'
+    with open(temporaryFileName, 'wb') as indexFile:
+        indexFile.write(encodeJSON(savedIndex))
+    os.replace(temporaryFileName, fileName)
+
+def loadSearchIndex(fileName):
+    try:
+        with open(fileName, 'rb') as indexFile:
+            savedIndex = decodeJSON(indexFile.read())
+    except FileNotFoundError:
+        return None
+    if savedIndex.get("searchIndexVersion") != searchIndexVersion:
+        print("Search index " + fileName + " was saved by a different version and will be rebuilt")
+        return None
+    index = newSearchIndex(savedIndex["serverName"], savedIndex["serverPlatformName"], savedIndex["serverPlatformURL"],
+                           savedIndex["userId"], savedIndex["kind"], savedIndex["scope"])
+    recordClass = searchIndexRecordClasses[index["kind"]]
+    for element in savedIndex["elements"]:
+        guid = element['elementHeader']['guid']
+        addToSearchIndex(index, guid, recordClass(element), getElementVersionKey(element))
+    index["refreshTime"] = savedIndex.get("refreshTime")
+    return index
+
+def getSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, kind, scope, fileName=None):
+    indexKey = getSearchIndexKey(serverName, serverPlatformURL, userId, kind, scope)
+    index = searchIndexes.get(indexKey)
+    if index is None:
+        if fileName:
+            index = loadSearchIndex(fileName)
+            if index is not None and getSearchIndexKey(index["serverName"], index["serverPlatformURL"], index["userId"],
+                                                       index["kind"], index["scope"]) != indexKey:
+                print("Search index " + fileName + " is for a different glossary, zone or server and will be rebuilt")
+                index = None
+            if index is not None and searchIndexMaxAge is not None:
+                if index["refreshTime"] is None or time.time() - index["refreshTime"] > searchIndexMaxAge:
+                    if refreshSearchIndex(index) is not None:
+                        saveSearchIndex(index, fileName)
+        if index is None:
+            index = buildSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, kind, scope)
+            if fileName and index["refreshTime"] is not None:
+                saveSearchIndex(index, fileName)
+        searchIndexes[indexKey] = index
+    return index
+
+def getGlossarySearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, glossaryGUID, fileName=None):
+    return getSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, "glossaryTerms", glossaryGUID, fileName)
+
+# A zone of None indexes every asset the user can see.  The zone is filtered in the notebook, not by the server (see
+# iterateSearchIndexSource).
+def getAssetSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, zone=None, fileName=None):
+    return getSearchIndex(serverName, serverPlatformName, serverPlatformURL, userId, "assets", zone, fileName)
+
+def clearSearchIndexes():
+    searchIndexes.clear()
+
+
+#
+# Searching.  Candidates are scored from the postings of the query's tokens and the best limit of them are returned
+# in rank order.
+#
+def getSortedTokens(index):
+    sortedTokens = index["sortedTokens"]
+    if sortedTokens is None:
+        sortedTokens = sorted(index["tokens"])
+        index["sortedTokens"] = sortedTokens
+    return sortedTokens
+
+def getPrefixPostings(index, prefix):
+    sortedTokens = getSortedTokens(index)
+    tokens = index["tokens"]
+    postings = {}
+    position = bisect.bisect_left(sortedTokens, prefix)
+    while position < len(sortedTokens) and sortedTokens[position].startswith(prefix):
+        for guid, weight in tokens[sortedTokens[position]].items():
+            if postings.get(guid, 0) < weight:
+                postings[guid] = weight
+        position = position + 1
+    return postings
+
+def getSubstringCandidates(index, queryText):
+    names = index["names"]
+    if len(queryText) < 3:
+        return [guid for guid, name in names.items() if queryText in name]
+    trigrams = index["trigrams"]
+    candidateSets = []
+    for trigram in getTrigrams(queryText):
+        guids = trigrams.get(trigram)
+        if not guids:
+            return []
+        candidateSets.append(guids)
+    candidateSets.sort(key=len)
+    candidates = candidateSets[0].intersection(*candidateSets[1:])
+    return [guid for guid in candidates if queryText in names[guid]]
+
+# Returns up to limit elements, best match first.  mode is "token", "prefix" or "substring".
+def searchIndex(index, query, mode="prefix", limit=20):
+    queryText = query.strip().lower()
+    if not queryText:
+        return []
+    scores = None
+    if mode == "substring":
+        scores = dict.fromkeys(getSubstringCandidates(index, queryText), 0)
+    elif mode == "token" or mode == "prefix":
+        queryPostings = []
+        for queryToken in set(getSearchTokens(queryText)):
+            if mode == "token":
+                postings = index["tokens"].get(queryToken)
+            else:
+                postings = getPrefixPostings(index, queryToken)
+            if not postings:
+                return []
+            queryPostings.append(postings)
+        # Start from the rarest token so the candidates shrink as quickly as possible.
+        queryPostings.sort(key=len)
+        for postings in queryPostings:
+            if scores is None:
+                scores = dict(postings)
+            else:
+                scores = {guid : score + postings[guid] for guid, score in scores.items() if guid in postings}
+            if not scores:
+                return []
+    else:
+        print("Unknown search mode: " + mode)
+        return []
+    if not scores:
+        return []
+
+    names = index["names"]
+    def getRank(guid):
+        name = names.get(guid, "")
+        score = scores[guid]
+        if name == queryText:
+            score = score + 100
+        elif name.startswith(queryText):
+            score = score + 50
+        return (-score, len(name), name)
+
+    elements = index["elements"]
+    return [elements[guid] for guid in heapq.nsmallest(limit, scores, key=getRank)]
@@ -0,0 +1,176 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+Incremental configuration of the Coco Pharmaceuticals OMAG Servers.
+
+The first time a server is configured, its config_<server> function makes the full set of configuration calls
+and the resulting configuration document is saved in a local cache, together with a fingerprint of everything
+that produced it: the configuration script, the local modules it imports from, globals.py and coco_lab/topology.py
+(where the Coco Pharmaceuticals definitions live), this file and the installed pyegeria version.  On later runs the
+cached document is the desired configuration: the server's stored configuration document is fetched once and, if it
+differs, replaced with a single call.  A server that is already running with an unchanged configuration is not
+re-activated.  Changing any of those files, or upgrading pyegeria, changes the fingerprint, so the full set of
+configuration calls is made again and the cache refreshed.
+
+The cache is a directory of <server name>.json files, coco-config-cache in the temporary directory (/tmp) unless
+the cocoConfigCache environment variable names another.  The configuration documents hold the servers' passwords,
+so the cache is kept out of the home directory, which in the lab container is the coco-jupyter-labs checkout, and
+only its owner can read it.  Anything else that changes a server's configuration - such as a change made by hand
+through the admin services - is not seen by the fingerprint.  To make all of the configuration calls again, delete
+the server's file, or the whole directory to reconfigure every server:
+
+    rm -rf /tmp/coco-config-cache
+
+"""
+
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import tempfile
+
+import pyegeria
+import requests
+from pyegeria import Platform
+from pyegeria import (
+    print_exception_response,
+)
+
+config_cache_dir = os.environ.get("cocoConfigCache", os.path.join(tempfile.gettempdir(), "coco-config-cache"))
+common_dir = os.path.dirname(os.path.abspath(__file__))
+globals_file = os.path.join(common_dir, "globals.py")
+topology_file = os.path.join(common_dir, "coco_lab", "topology.py")
+
+
+def admin_server_url(platform_url: str, userid: str, server_name: str) -> str:
+    return f"{platform_url}/open-metadata/admin-services/users/{userid}/servers/{server_name}"
+
+
+def check_response(response, action: str):
+    if response.status_code != 200 or response.json().get("relatedHTTPCode") != 200:
+        raise Exception(f"Unable to {action}: {response.text}")
+
+
+def get_stored_config(server_name: str, platform_url: str, userid: str):
+    response = requests.get(admin_server_url(platform_url, userid, server_name) + "/configuration", verify=False)
+    check_response(response, f"retrieve the configuration of {server_name}")
+    return response.json().get("omagserverConfig")
+
+
+def replace_stored_config(server_name: str, platform_url: str, userid: str, config: dict):
+    response = requests.post(admin_server_url(platform_url, userid, server_name) + "/configuration",
+                             json=config, verify=False)
+    check_response(response, f"replace the configuration of {server_name}")
+
+
+def is_server_active(server_name: str, platform_url: str, userid: str) -> bool:
+    url = f"{platform_url}/open-metadata/platform-services/users/{userid}/server-platform/servers/{server_name}/status"
+    response = requests.get(url, verify=False)
+    return response.status_code == 200 and response.json().get("active") is True
+
+
+def pyegeria_version() -> str:
+    version = getattr(pyegeria, "__version__", None)
+    if version is None:
+        try:
+            version = importlib.metadata.version("pyegeria")
+        except importlib.metadata.PackageNotFoundError:
+            version = "unknown"
+    return str(version)
+
+
+# The source files that decide what a config function does: its own, those of the local modules it imports from,
+# the definitions it uses and this file.  Constants imported from globals have no module of their own, which is why
+# globals.py and coco_lab/topology.py are always included.
+def config_source_files(config_function) -> list:
+    source_files = {os.path.abspath(inspect.getsourcefile(config_function)), os.path.abspath(__file__),
+                    globals_file, topology_file}
+    for value in vars(inspect.getmodule(config_function)).values():
+        module = value if inspect.ismodule(value) else inspect.getmodule(value)
+        source_file = getattr(module, "__file__", None)
+        if source_file and source_file.endswith(".py") and os.path.abspath(source_file).startswith(common_dir + os.sep):
+            source_files.add(os.path.abspath(source_file))
+    return sorted(source_files)
+
+
+def config_fingerprint(config_function, platform_url: str, userid: str) -> str:
+    fingerprint = hashlib.sha256()
+    for file_name in config_source_files(config_function):
+        fingerprint.update(os.path.relpath(file_name, common_dir).encode() + b"\0")
+        with open(file_name, "rb") as source_file:
+            fingerprint.update(source_file.read())
+    fingerprint.update(f"{config_function.__name__}|{platform_url}|{userid}|pyegeria {pyegeria_version()}".encode())
+    return fingerprint.hexdigest()
+
+
+# The audit trail records every configuration change, so it is left out when comparing documents.
+def comparable_config(config: dict) -> dict:
+    return {key: value for key, value in config.items() if key != "auditTrail"}
+
+
+def cache_file_name(server_name: str) -> str:
+    return os.path.join(config_cache_dir, f"{server_name}.json")
+
+
+def load_cached_config(server_name: str):
+    try:
+        with open(cache_file_name(server_name)) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_config(server_name: str, fingerprint: str, config: dict, active: bool):
+    os.makedirs(config_cache_dir, mode=0o700, exist_ok=True)
+    with open(os.open(cache_file_name(server_name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as cache_file:
+        json.dump({"fingerprint": fingerprint, "active": active, "omagserverConfig": config}, cache_file)
+
+
+def apply_server_config(server_name: str, config_function, platform_url: str, userid: str) -> bool:
+    fingerprint = config_fingerprint(config_function, platform_url, userid)
+    cached = load_cached_config(server_name)
+
+    if cached is None or cached.get("fingerprint") != fingerprint:
+        print(f"No up to date cached configuration for {server_name} - making all configuration calls")
+        if not config_function(platform_url, userid):
+            return False
+        try:
+            save_cached_config(server_name, fingerprint,
+                               get_stored_config(server_name, platform_url, userid),
+                               is_server_active(server_name, platform_url, userid))
+        except Exception as e:
+            print(f"Unable to cache the configuration of {server_name}: {e}")
+        return True
+
+    try:
+        desired_config = cached["omagserverConfig"]
+        stored_config = get_stored_config(server_name, platform_url, userid)
+        unchanged = stored_config is not None and comparable_config(stored_config) == comparable_config(desired_config)
+
+        if not cached.get("active"):
+            if not unchanged:
+                print(f"Replacing the configuration document of {server_name}")
+                replace_stored_config(server_name, platform_url, userid, desired_config)
+            return True
+
+        if unchanged and is_server_active(server_name, platform_url, userid):
+            print(f"{server_name} is already running with the desired configuration")
+            return True
+
+        if not unchanged:
+            print(f"Replacing the configuration document of {server_name}")
+            replace_stored_config(server_name, platform_url, userid, desired_config)
+        print(f"Activating {server_name}")
+        p_client = Platform(server_name, platform_url, userid)
+        p_client.activate_server_stored_config()
+        print(f"{server_name} activated")
+    except Exception as e:
+        print_exception_response(e)
+        return False
+    return True
@@ -25,38 +25,34 @@ from pyegeria import (
 )
 
 
-def config_coco_core(url: str, userid: str):
-    disable_ssl_warnings = True
-    print("Configuring and activating the Datalake")
-    platform_url = url
-    admin_user = userid
-
-    # event_bus_config = {
-    #     "producer": {
-    #         "bootstrap.servers": "{{kafkaEndpoint}}"
-    #     },
-    #     "consumer": {
-    #         "bootstrap.servers": "{{kafkaEndpoint}}"
-    #     }
-    # }
-    event_bus_config = {
-        "producer": {
-            "bootstrap.servers": "host.docker.internal:7192"
-        },
-        "consumer": {
-            "bootstrap.servers": "host.docker.internal:7192"
-        }
+# event_bus_config = {
+#     "producer": {
+#         "bootstrap.servers": "{{kafkaEndpoint}}"
+#     },
+#     "consumer": {
+#         "bootstrap.servers": "{{kafkaEndpoint}}"
+#     }
+# }
+event_bus_config = {
+    "producer": {
+        "bootstrap.servers": "host.docker.internal:7192"
+    },
+    "consumer": {
+        "bootstrap.servers": "host.docker.internal:7192"
     }
-
-    security_connection_body = {
-        "class": "Connection",
-        "connectorType": {
-            "class": "ConnectorType",
-            "connectorProviderClassName":
-                "org.odpi.openmetadata.metadatasecurity.samples.CocoPharmaServerSecurityProvider"
-        }
+}
+
+security_connection_body = {
+    "class": "Connection",
+    "connectorType": {
+        "class": "ConnectorType",
+        "connectorProviderClassName":
+            "org.odpi.openmetadata.metadatasecurity.samples.CocoPharmaServerSecurityProvider"
     }
+}
+
 
+def config_cocoMDS2(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS2
     #
@@ -113,7 +109,11 @@ def config_coco_core(url: str, userid: str):
         print(f"{mdr_server} activated")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
 
+def config_cocoMDS3(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS3
     #
@@ -172,6 +172,11 @@ def config_coco_core(url: str, userid: str):
         print(f"{mdr_server} activated")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
+
+def config_cocoMDS5(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS5
     #
@@ -214,15 +219,17 @@ def config_coco_core(url: str, userid: str):
         print(f"{mdr_server} activated")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
 
+def config_cocoMDS6(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS6
     #
     disable_ssl_warnings = True
 
     mdr_server = cocoMDS6Name
-    platform_url = corePlatformURL
-    admin_user = "garygeeke"
     mdr_server_user_id = "cocoMDS6npa"
     mdr_server_password = "cocoMDS6passw0rd"
     metadataCollectionId = f"{mdr_server}-e915f2fa-aa3g-4396-8bde-bcd65e642b1d"
@@ -281,6 +288,16 @@ def config_coco_core(url: str, userid: str):
         print(f"{mdr_server} activated")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
+
+def config_coco_core(url: str, userid: str):
+    print("Configuring and activating the Core Platform servers")
+    config_cocoMDS2(url, userid)
+    config_cocoMDS3(url, userid)
+    config_cocoMDS5(url, userid)
+    config_cocoMDS6(url, userid)
 
 def main():
     parser = argparse.ArgumentParser()
@@ -23,39 +23,35 @@ from globals import (corePlatformURL, cocoCohort, max_paging_size, cocoMDS1Name,
                      cocoMDS4Name, dataLakePlatformURL, fileSystemRoot, adminUserId)
 
 
-def config_coco_datalake(url:str, userid:str):
-    print("Configuring and starting the Data Lake")
-    disable_ssl_warnings = True
-    platform_url = url
-    admin_user = userid
-
-    #   Change the kafka configuration to reflect the distinguished kafka setting for the labs
-    # event_bus_config = {
-    #     "producer": {
-    #         "bootstrap.servers": "{{kafkaEndpoint}}"
-    #     },
-    #     "consumer": {
-    #         "bootstrap.servers": "{{kafkaEndpoint}}"
-    #     }
-    # }
-    event_bus_config = {
-        "producer": {
-            "bootstrap.servers": "host.docker.internal:7192"
-        },
-        "consumer": {
-            "bootstrap.servers": "host.docker.internal:7192"
-        }
+#   Change the kafka configuration to reflect the distinguished kafka setting for the labs
+# event_bus_config = {
+#     "producer": {
+#         "bootstrap.servers": "{{kafkaEndpoint}}"
+#     },
+#     "consumer": {
+#         "bootstrap.servers": "{{kafkaEndpoint}}"
+#     }
+# }
+event_bus_config = {
+    "producer": {
+        "bootstrap.servers": "host.docker.internal:7192"
+    },
+    "consumer": {
+        "bootstrap.servers": "host.docker.internal:7192"
     }
-
-    security_connection_body = {
-        "class": "Connection",
-        "connectorType": {
-            "class": "ConnectorType",
-            "connectorProviderClassName":
-                "org.odpi.openmetadata.metadatasecurity.samples.CocoPharmaServerSecurityProvider"
-        }
+}
+
+security_connection_body = {
+    "class": "Connection",
+    "connectorType": {
+        "class": "ConnectorType",
+        "connectorProviderClassName":
+            "org.odpi.openmetadata.metadatasecurity.samples.CocoPharmaServerSecurityProvider"
     }
+}
 
+
+def config_cocoMDS1(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS1
     #
@@ -118,7 +114,11 @@ def config_coco_datalake(url:str, userid:str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
 
+def config_cocoMDS4(platform_url: str, admin_user: str) -> bool:
     #
     # Configure MDS4
     #
@@ -168,7 +168,11 @@ def config_coco_datalake(url:str, userid:str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
 
+
+def config_exchangeDL01(platform_url: str, admin_user: str) -> bool:
     #
     # Configure exchangeDL01
     #
@@ -239,7 +243,11 @@ def config_coco_datalake(url:str, userid:str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
 
+def config_governDL01(platform_url: str, admin_user: str) -> bool:
     #
     # Configure governDL01
     #
@@ -289,7 +297,11 @@ def config_coco_datalake(url:str, userid:str):
         print(f"{engine_server} activated")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
 
+
+def config_cocoView1(platform_url: str, admin_user: str) -> bool:
     #
     # Configure cocoView1
     #
@@ -325,7 +337,11 @@ def config_coco_datalake(url:str, userid:str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
 
+def config_cocoOLS1(platform_url: str, admin_user: str) -> bool:
     #
     # Configure cocoOLS1
     #
@@ -398,6 +414,18 @@ def config_coco_datalake(url:str, userid:str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
+
+def config_coco_datalake(url:str, userid:str):
+    print("Configuring and starting the Data Lake")
+    config_cocoMDS1(url, userid)
+    config_cocoMDS4(url, userid)
+    config_exchangeDL01(url, userid)
+    config_governDL01(url, userid)
+    config_cocoView1(url, userid)
+    config_cocoOLS1(url, userid)
 
 def main():
     parser = argparse.ArgumentParser()
@@ -21,12 +21,11 @@ from pyegeria import (
 )
 
 
-def config_coco_development(url: str, userid: str):
-    disable_ssl_warnings = True
-
+def config_cocoMDSx(platform_url: str, admin_user: str) -> bool:
+    #
+    # cocoMDSx
+    #
     mdr_server = cocoMDSxName
-    platform_url = devPlatformURL
-    admin_user = "garygeeke"
     mdr_server_user_id = "cocoMDSxnpa"
     mdr_server_password = "cocoMDSxpassw0rd"
     metadataCollectionId = f"{mdr_server}-e915f2fa-aa3g-4396-8bde-bcd65e642b1d"
@@ -116,17 +115,20 @@ def config_coco_development(url: str, userid: str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
 
+
+def config_monitorDev01(platform_url: str, admin_user: str) -> bool:
     #
     # monitorDev01
     #
     daemon_server_name = "monitorDev01"
-    daemon_server_platform = devPlatformURL
+    daemon_server_platform = platform_url
     daemon_server_user_id = "erinoverview"
     daemon_server_password = "erinoverviewpassw0rd"
 
     mdr_server = "cocoMDSx"
-    platform_url = devPlatformURL
 
     print("Configuring " + daemon_server_name + "...")
 
@@ -154,20 +156,22 @@ def config_coco_development(url: str, userid: str):
 
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
 
 
+def config_monitorGov01(platform_url: str, admin_user: str) -> bool:
     #
     # monitorGov01
     #
 
     daemon_server_name = "monitorGov01"
-    daemon_server_platform = dataLakePlatformURL
+    daemon_server_platform = platform_url
     daemon_server_user_id = "exchangeDL01npa"
     daemon_server_password = "exchangeDL01passw0rd"
 
     mdr_server = "cocoMDS1"
     mdr_platform_url = dataLakePlatformURL
-    admin_user = "garygeeke"
 
     KafkaReceiverConnectorName = "KafkaOpenLineageEventReceiver"
     KafkaReceiverConnectorUserId = "onboardDL01npa"
@@ -351,6 +355,15 @@ def config_coco_development(url: str, userid: str):
         print(f"Activation of {daemon_server_name} complete")
     except Exception as e:
         print_exception_response(e)
+        return False
+    return True
+
+
+def config_coco_development(url: str, userid: str):
+    config_cocoMDSx(url, userid)
+    config_monitorDev01(url, userid)
+    # monitorGov01 runs on the Data Lake Platform alongside its metadata server
+    config_monitorGov01(dataLakePlatformURL, userid)
 
 def main():
     parser = argparse.ArgumentParser()
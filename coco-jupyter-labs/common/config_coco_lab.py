@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+
+
+Egeria Coco Pharmaceutical demonstration labs.
+
+This script configures and activates the Egeria OMAG Servers on all three Coco Pharmaceuticals platforms.
+Servers that do not depend on one another are brought up at the same time.  An engine host, integration daemon,
+view server or lineage server is only brought up once the metadata server it connects to has been activated.
+The time taken by each server is reported at the end.
+With --incremental, servers whose configuration is unchanged since the last run are only checked, not reconfigured
+(see config_coco_apply.py).
+It is automatically run whenever the Coco Lab Compose script is started.
+
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from globals import (corePlatformURL, dataLakePlatformURL, devPlatformURL, adminUserId,
+                     cocoMDS1Name, cocoMDS2Name, cocoMDS3Name, cocoMDS4Name, cocoMDS5Name, cocoMDS6Name,
+                     cocoMDSxName, cocoView1Name, cocoOLS1Name,
+                     governDL01Name, governDL01MDS, exchangeDL01Name, exchangeDL01MDS,
+                     monitorGov01Name, monitorGov01MDS, monitorDev01Name, monitorDev01MDS)
+from config_coco_core import config_cocoMDS2, config_cocoMDS3, config_cocoMDS5, config_cocoMDS6
+from config_coco_datalake import (config_cocoMDS1, config_cocoMDS4, config_exchangeDL01, config_governDL01,
+                                  config_cocoView1, config_cocoOLS1)
+from config_coco_development import config_cocoMDSx, config_monitorDev01, config_monitorGov01
+from config_coco_apply import apply_server_config
+
+#
+# The servers of the lab: (server name, platform, configuration function, servers that must be active first)
+#
+coco_servers = [
+    (cocoMDS2Name, "core", config_cocoMDS2, []),
+    (cocoMDS3Name, "core", config_cocoMDS3, []),
+    (cocoMDS5Name, "core", config_cocoMDS5, []),
+    (cocoMDS6Name, "core", config_cocoMDS6, []),
+    (cocoMDS1Name, "datalake", config_cocoMDS1, []),
+    (cocoMDS4Name, "datalake", config_cocoMDS4, []),
+    (exchangeDL01Name, "datalake", config_exchangeDL01, [exchangeDL01MDS]),
+    (governDL01Name, "datalake", config_governDL01, [governDL01MDS]),
+    (cocoView1Name, "datalake", config_cocoView1, [cocoMDS1Name]),
+    (cocoOLS1Name, "datalake", config_cocoOLS1, [cocoMDS1Name]),
+    (monitorGov01Name, "datalake", config_monitorGov01, [monitorGov01MDS]),
+    (cocoMDSxName, "dev", config_cocoMDSx, []),
+    (monitorDev01Name, "dev", config_monitorDev01, [monitorDev01MDS]),
+]
+
+
+def bring_up_server(server_name: str, config_function, platform_url: str, userid: str, incremental: bool):
+    # The pyegeria clients drive their requests through an asyncio event loop, which worker threads
+    # do not have by default.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    start_time = time.perf_counter()
+    try:
+        if incremental:
+            succeeded = apply_server_config(server_name, config_function, platform_url, userid)
+        else:
+            succeeded = config_function(platform_url, userid)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    return succeeded, time.perf_counter() - start_time
+
+
+def config_coco_lab(core_url: str, datalake_url: str, dev_url: str, userid: str, max_workers: int = 8,
+                    incremental: bool = False):
+    platform_urls = {"core": core_url, "datalake": datalake_url, "dev": dev_url}
+    waiting = list(coco_servers)
+    running = {}
+    results = {}
+    lab_start_time = time.perf_counter()
+
+    print(f"Configuring and activating {len(coco_servers)} servers on the Coco Pharmaceuticals platforms")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while waiting or running:
+            for server in list(waiting):
+                server_name, platform, config_function, depends_on = server
+                if any(results.get(dependency, ("", 0))[0] in ("failed", "skipped") for dependency in depends_on):
+                    waiting.remove(server)
+                    results[server_name] = ("skipped", 0)
+                    print(f"Skipping {server_name} because {', '.join(depends_on)} did not start")
+                elif all(dependency in results for dependency in depends_on):
+                    waiting.remove(server)
+                    future = executor.submit(bring_up_server, server_name, config_function,
+                                             platform_urls[platform], userid, incremental)
+                    running[future] = server_name
+
+            if not running:
+                # Anything still waiting depends on a server that is not part of the lab.
+                for server_name, platform, config_function, depends_on in waiting:
+                    results[server_name] = ("skipped", 0)
+                    print(f"Skipping {server_name} because {', '.join(depends_on)} is not a lab server")
+                break
+
+            done, not_done = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                server_name = running.pop(future)
+                try:
+                    succeeded, elapsed_time = future.result()
+                except Exception as e:
+                    print(f"Unexpected error bringing up {server_name}: {e}")
+                    succeeded, elapsed_time = False, 0
+                results[server_name] = ("ok" if succeeded else "failed", elapsed_time)
+
+    print(f"\n{'Server':<16}{'Status':<10}{'Seconds':>10}")
+    for server_name, platform, config_function, depends_on in coco_servers:
+        status, elapsed_time = results[server_name]
+        print(f"{server_name:<16}{status:<10}{elapsed_time:>10.1f}")
+    print(f"\nAll servers processed in {time.perf_counter() - lab_start_time:.1f} seconds")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--core-url", help="URL of the Core Platform")
+    parser.add_argument("--datalake-url", help="URL of the Data Lake Platform")
+    parser.add_argument("--dev-url", help="URL of the Development Platform")
+    parser.add_argument("--userid", help="User Id")
+    parser.add_argument("--workers", type=int, default=8, help="Maximum number of servers brought up at once")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only reconfigure and reactivate servers whose configuration has changed")
+    args = parser.parse_args()
+
+    core_url = args.core_url if args.core_url is not None else corePlatformURL
+    datalake_url = args.datalake_url if args.datalake_url is not None else dataLakePlatformURL
+    dev_url = args.dev_url if args.dev_url is not None else devPlatformURL
+    userid = args.userid if args.userid is not None else adminUserId
+
+    config_coco_lab(core_url, datalake_url, dev_url, userid, args.workers, args.incremental)
+
+if __name__ == "__main__":
+    main()
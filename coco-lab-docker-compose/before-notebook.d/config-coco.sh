@@ -10,9 +10,11 @@
 
 #rm -rf ./__pychache__
 export PYTHONDONTWRITEBYTECODE=1
-python3 /home/jovyan/common/config_coco_core.py
-python3 /home/jovyan/common/config_coco_datalake.py
-python3 /home/jovyan/common/config_coco_development.py
+# Servers on all three platforms are brought up together, each metadata server before the governance servers that use it.
+# The per-platform scripts config_coco_core.py, config_coco_datalake.py and config_coco_development.py can still be run
+# on their own to configure a single platform.  Servers whose configuration has not changed since the last start are
+# left running rather than being reconfigured.
+python3 /home/jovyan/common/config_coco_lab.py --incremental
 echo "Launching Jupyter notebook server.."
 #exec jupyter notebook "$@"
 #python3 config_cocoMDS2.py